@@ -96,7 +96,8 @@
    - 수집된 데이터는 collected/[날짜시간]_[키워드].json에 저장
 
 2. 문장 추출 및 분류
-   - SentenceClassifier로 문장 분류
+   - SentenceClassifier.classify_candidates로 문장 분류 (scripts/classify_facts.py)
+     * 의미 중복 제거 → 사전 순위로 후보만 LLM 분류
    - FactExtractor로 팩트 추출
    - 분류된 문장은 classified/[날짜시간]_[키워드].json에 저장
 
@@ -1,4 +1,4 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
 from ..services.crawlers.keyword_crawler import KeywordCrawler
 from ..services.post_generator.post_generator import PostGenerator
 from ..services.fact_extractor import FactExtractor
@@ -99,6 +99,34 @@ def create_app():
             logger.error(f"Error in generate_post endpoint: {str(e)}", exc_info=True)
             return jsonify({'error': f'포스트 생성 중 오류가 발생했습니다: {str(e)}'}), 500
 
+    @app.route('/generate_post/stream', methods=['GET'])
+    def generate_post_stream():
+        """포스트 생성 과정을 Server-Sent Events로 전송 (EventSource는 GET만 지원)"""
+        keyword = request.args.get('keyword')
+        if not keyword:
+            return jsonify({'error': '키워드를 입력해주세요'}), 400
+        
+        def events():
+            stream = post_generator.stream_post(keyword)
+            try:
+                for event in stream:
+                    yield _format_sse(event)
+            except Exception as e:
+                logger.error(f"Error in generate_post_stream endpoint: {str(e)}", exc_info=True)
+                yield _format_sse({'event': 'error', 'message': f'포스트 생성 중 오류가 발생했습니다: {str(e)}'})
+            finally:
+                # 클라이언트 연결이 끊기면 생성 스트림을 바로 닫아 모델 점유를 해제
+                stream.close()
+        
+        return Response(
+            stream_with_context(events()),
+            mimetype='text/event-stream',
+            headers={
+                'Cache-Control': 'no-cache',
+                'X-Accel-Buffering': 'no'  # 프록시 버퍼링 비활성화
+            }
+        )
+
     @app.route('/api/extract-facts', methods=['POST'])
     def extract_facts():
         """수집된 파일들에서 사실을 추출합니다."""
@@ -135,3 +163,7 @@ def create_app():
             }), 500
 
     return app
+
+def _format_sse(event):
+    """이벤트 dict를 SSE 메시지 형식으로 변환"""
+    return f"event: {event['event']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
@@ -0,0 +1,104 @@
+import json
+import unittest
+from unittest import mock
+from . import create_app
+from ..services.llm_backend import CompletionBackend
+from ..services.lm_studio_client import LMStudioClient, POST_SECTIONS
+from ..services.post_generator.post_generator import PostGenerator
+
+SEARCH_RESULTS = {'results': [
+    {'source': 'blog', 'title': '퀵플렉스 후기', 'content': '쿠팡 퀵플렉스는 건당 800원의 수수료를 받습니다.'},
+    {'source': 'news', 'title': '퀵플렉스 기사', 'content': '퀵플렉스 기사 수가 늘고 있습니다.'},
+]}
+
+class _StreamingBackend(CompletionBackend):
+    """프로필 이름으로 두 조각짜리 응답을 스트리밍하고, fail_after개 조각 뒤에는 예외를 내는 테스트용 백엔드"""
+
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after
+        self.sent = 0
+
+    def complete(self, prompt, profile):
+        return ''.join(self.stream(prompt, profile))
+
+    def stream(self, prompt, profile):
+        for text in (f"{profile.name} ", "본문"):
+            if self.fail_after is not None and self.sent >= self.fail_after:
+                raise RuntimeError("모델 연결 끊김")
+            self.sent += 1
+            yield text
+
+class _StubCrawler:
+    def search_with_long_tail(self, keyword):
+        return SEARCH_RESULTS
+
+def parse_sse(body):
+    """SSE 본문을 (event 이름, data dict) 목록으로 변환"""
+    messages = []
+    for block in body.split('\n\n'):
+        if not block:
+            continue
+        event_line, data_line = block.split('\n')
+        assert event_line.startswith('event: ') and data_line.startswith('data: '), block
+        messages.append((event_line[len('event: '):], json.loads(data_line[len('data: '):])))
+    return messages
+
+class TestStreamPost(unittest.TestCase):
+    def test_events_in_order(self):
+        generator = PostGenerator(crawler=_StubCrawler(),
+                                  lm_client=LMStudioClient(cache=None, backend=_StreamingBackend()))
+        events = list(generator.stream_post('퀵플렉스', SEARCH_RESULTS))
+
+        self.assertEqual(events[0]['event'], 'status')
+        self.assertEqual(events[1], {'event': 'section_start', 'section': 'title'})
+        self.assertEqual(events[-1]['event'], 'done')
+        self.assertEqual(events[-1]['title'], 'title 본문')
+        self.assertEqual(events[-1]['sections'], {name: 'section 본문' for name in POST_SECTIONS})
+
+        tokens = [e['text'] for e in events if e['event'] == 'token' and e['section'] == 'intro']
+        self.assertEqual(tokens, ['section ', '본문'])
+
+class TestGeneratePostStream(unittest.TestCase):
+    def make_client(self, backend):
+        generator = PostGenerator(crawler=_StubCrawler(), lm_client=LMStudioClient(cache=None, backend=backend))
+        with mock.patch(f'{create_app.__module__}.PostGenerator', return_value=generator):
+            app = create_app()
+        app.testing = True
+        return app.test_client()
+
+    def get_events(self, client, keyword='퀵플렉스'):
+        response = client.get('/generate_post/stream', query_string={'keyword': keyword}, buffered=False)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        self.assertEqual(response.headers['Cache-Control'], 'no-cache')
+        body = ''.join(chunk.decode('utf-8') for chunk in response.response)
+        response.close()
+        return parse_sse(body)
+
+    def test_stream_frames_every_event(self):
+        messages = self.get_events(self.make_client(_StreamingBackend()))
+
+        # SSE event 이름은 data의 event와 같음
+        self.assertTrue(all(name == data['event'] for name, data in messages))
+        names = [name for name, _ in messages]
+        self.assertEqual(names[0], 'status')
+        self.assertEqual(names[-1], 'done')
+        self.assertEqual(names.count('section_start'), names.count('section_end'))
+        self.assertEqual(messages[-1][1]['title'], 'title 본문')
+        self.assertEqual(set(messages[-1][1]['sections']), set(POST_SECTIONS))
+
+    def test_backend_failure_ends_with_error_event(self):
+        messages = self.get_events(self.make_client(_StreamingBackend(fail_after=3)))
+
+        names = [name for name, _ in messages]
+        self.assertEqual(names[-1], 'error')
+        self.assertNotIn('done', names)
+        self.assertIn('모델 연결 끊김', messages[-1][1]['message'])
+        self.assertEqual([data['text'] for name, data in messages if name == 'token'], ['title ', '본문', 'section '])
+
+    def test_missing_keyword(self):
+        response = self.make_client(_StreamingBackend()).get('/generate_post/stream')
+        self.assertEqual(response.status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from ..services.sentence_analyzer.sentence_analyzer import AnalyzedSentence
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def load_expander_module():
+    """services/keyword_expander/keyword_expander.py 로드
+
+    같은 이름의 services/keyword_expander.py 모듈이 패키지 경로를 가리므로
+    (keyword_expander/에는 __init__.py가 없음) 파일 경로로 직접 불러온다.
+    """
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'services', 'keyword_expander', 'keyword_expander.py')
+    spec = importlib.util.spec_from_file_location('app.services._keyword_expander.keyword_expander', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def make_sentences(count: int, vocabulary: int, seed: int = 42) -> list:
+    """Zipf 분포 키워드를 가진 합성 분석 문장"""
+    rng = np.random.default_rng(seed)
+    sentences = []
+    for i in range(count):
+        keyword_ids = np.minimum(rng.zipf(1.3, size=rng.integers(3, 9)), vocabulary)
+        keywords = [f"키워드{k}" for k in keyword_ids]
+        sentences.append(AnalyzedSentence(
+            text=f"문장 {i} " + ' '.join(keywords) + "입니다",
+            quality_score=0.7, has_statistics=bool(i % 5 == 0), has_example=bool(i % 7 == 0),
+            keywords=keywords, sentiment='objective', length=40, structure_score=0.7
+        ))
+    return sentences
+
+def legacy_related_sets(expander, sentences: list) -> dict:
+    """기존 방식: 키워드마다 모든 키워드 그룹과 문장 집합을 비교 (O(K²·S))"""
+    keyword_groups = defaultdict(list)
+    for sentence in sentences:
+        for keyword in sentence.keywords:
+            keyword_groups[keyword].append(sentence)
+
+    related_sets = {}
+    processed = set()
+    for keyword in keyword_groups:
+        if keyword in processed:
+            continue
+        related = expander._find_related_keywords(keyword, keyword_groups)
+        processed.update(related)
+        related_sets[keyword] = related
+    return related_sets
+
+def benchmark(sizes, vocabulary: int, legacy_limit: int) -> list:
+    module = load_expander_module()
+    expander = module.KeywordExpander(content_context=None)
+
+    results = []
+    for size in sizes:
+        sentences = make_sentences(size, vocabulary)
+        started = time.perf_counter()
+        clusters = expander._cluster_sentences(sentences)
+        sparse_seconds = time.perf_counter() - started
+
+        result = {'sentences': size, 'clusters': len(clusters), 'sparse_seconds': round(sparse_seconds, 3)}
+        if size <= legacy_limit:
+            started = time.perf_counter()
+            legacy = legacy_related_sets(expander, sentences)
+            result['legacy_seconds'] = round(time.perf_counter() - started, 3)
+            result['same_clusters'] = legacy == {c.main_keyword: set(c.related_keywords) for c in clusters}
+        results.append(result)
+        logger.info(json.dumps(result, ensure_ascii=False))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='키워드 클러스터링 (희소 행렬 vs 기존 방식) 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--vocabulary', type=int, default=5000, help='합성 키워드 어휘 크기')
+    parser.add_argument('--legacy-limit', type=int, default=10000, help='기존 방식을 함께 측정할 최대 문장 수')
+    args = parser.parse_args()
+
+    print(json.dumps(benchmark(args.sizes, args.vocabulary, args.legacy_limit), ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import argparse
+import json
+import logging
+import time
+
+from ..services.vector_index import VectorIndex
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def main():
+    parser = argparse.ArgumentParser(description='data/facts 문장을 벡터 인덱스에 적재하고 검색합니다.')
+    parser.add_argument('--facts-dir', default=None, help='사실 파일 폴더 (기본: data/facts)')
+    parser.add_argument('--index-dir', default=None, help='인덱스 폴더 (기본: data/vector_index)')
+    parser.add_argument('--train', action='store_true', help='IVF 클러스터를 다시 학습')
+    parser.add_argument('--nlist', type=int, default=None, help='IVF 클러스터 수 (기본: 4√N)')
+    parser.add_argument('--keyword', default=None, help='검색할 키워드')
+    parser.add_argument('--section', default='main', help='검색할 섹션/카테고리 (예: costs)')
+    parser.add_argument('--top-k', type=int, default=20)
+    args = parser.parse_args()
+
+    index = VectorIndex(path=args.index_dir)
+    started = time.perf_counter()
+    added = index.ingest_facts_dir(args.facts_dir)
+    if args.train:
+        index.train(nlist=args.nlist)
+    index.wait_for_training()
+    logger.info(f"{added}개 문장 추가 ({time.perf_counter() - started:.1f}초)")
+
+    if args.keyword:
+        started = time.perf_counter()
+        hits = index.query_section(args.keyword, args.section, top_k=args.top_k)
+        logger.info(f"검색 {(time.perf_counter() - started) * 1000:.1f}ms")
+        for hit in hits:
+            print(f"{hit.score:.3f}\t{hit.text}")
+    print(json.dumps(index.stats(), ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import argparse
+import logging
+from pathlib import Path
+from typing import List
+
+from ..services.sentence_classifier import SentenceClassifier
+from ..services.sentence_storage import SentenceStorage
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def load_fact_sentences(facts_dir: Path) -> List[str]:
+    """process_facts.py가 저장한 facts_*.txt 파일에서 문장만 읽어옵니다."""
+    sentences = []
+    for fact_file in sorted(facts_dir.glob('facts_*.txt')):
+        with open(fact_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('문장: '):
+                    sentences.append(line[len('문장: '):].strip())
+    return sentences
+
+def classify_facts(keyword: str, max_posts: int = 3, facts_dir: str = None) -> str:
+    """추출된 문장을 중복 제거/사전 순위로 추린 뒤 LLM으로 분류해 classified/에 저장합니다."""
+    if facts_dir is None:
+        facts_dir = Path(__file__).parent.parent / 'data' / 'facts'
+    sentences = load_fact_sentences(Path(facts_dir))
+    if not sentences:
+        raise ValueError(f"분류할 문장이 없습니다: {facts_dir}")
+
+    classified = SentenceClassifier().classify_candidates(sentences, keyword=keyword, max_posts=max_posts)
+    filepath = SentenceStorage().save_classified_sentences(keyword, classified)
+    logger.info(
+        f"Classified {sum(len(items) for items in classified.values())}/{len(sentences)} sentences. "
+        f"Results saved to: {filepath}"
+    )
+    return filepath
+
+def main():
+    parser = argparse.ArgumentParser(description='추출된 문장 분류')
+    parser.add_argument('keyword', help='포스팅 키워드')
+    parser.add_argument('--max-posts', type=int, default=3, help='생성할 최대 포스트 수 (후보 문장 수 결정)')
+    parser.add_argument('--facts-dir', default=None, help='문장 파일 경로 (기본: data/facts)')
+    args = parser.parse_args()
+
+    classify_facts(args.keyword, args.max_posts, args.facts_dir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import argparse
+import json
+import logging
+import random
+import time
+
+from ..services.sentence_storage import SentenceStorage
+from ..services.embedding_classifier import EmbeddingClassifier, CLASSIFIER_METHODS
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def train(method: str = 'centroid', test_ratio: float = 0.2, threshold: float = 0.6,
+          seed: int = 42, output: str = None) -> dict:
+    """저장된 LLM 분류 결과로 임베딩 분류기를 학습하고 보류 데이터로 평가합니다."""
+    sentences = SentenceStorage().load_all_classified()
+    if len(sentences) < 10:
+        raise ValueError(f"학습할 분류 결과가 부족합니다: {len(sentences)}개")
+
+    random.Random(seed).shuffle(sentences)
+    split = int(len(sentences) * (1 - test_ratio))
+    train_set, test_set = sentences[:split], sentences[split:]
+
+    classifier = EmbeddingClassifier(method=method, confidence_threshold=threshold)
+    started = time.perf_counter()
+    classifier.fit([s.text for s in train_set], [s.category for s in train_set])
+    train_seconds = time.perf_counter() - started
+
+    report = classifier.evaluate([s.text for s in test_set], [s.category for s in test_set])
+    report.update({
+        'method': method,
+        'train_samples': len(train_set),
+        'train_seconds': train_seconds,
+        'threshold': threshold,
+        'model_path': classifier.save(output)
+    })
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description='임베딩 기반 문장 분류기 재학습')
+    parser.add_argument('--method', choices=CLASSIFIER_METHODS, default='centroid')
+    parser.add_argument('--test-ratio', type=float, default=0.2)
+    parser.add_argument('--threshold', type=float, default=0.6, help='LLM으로 넘길 신뢰도 기준')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=None, help='모델 저장 경로 (기본: data/models/embedding_classifier.npz)')
+    args = parser.parse_args()
+
+    report = train(args.method, args.test_ratio, args.threshold, args.seed, args.output)
+    logger.info(
+        f"정확도 {report['accuracy']:.3f} (신뢰 구간 {report['confident_accuracy']:.3f}), "
+        f"LLM 위임 비율 {report['escalation_rate']:.1%}, "
+        f"처리량 {report['sentences_per_second']:.0f} 문장/초"
+    )
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
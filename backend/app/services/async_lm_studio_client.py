@@ -0,0 +1,280 @@
+from typing import Callable, Dict, Any, Optional, Set, Sequence
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from openai import AsyncOpenAI
+from .lm_studio_client import LMStudioClient, POST_SECTIONS
+from .completion_cache import CompletionCache
+from .llm_backend import CompletionBackend, OpenAICompatibleBackend
+from .micro_batcher import MicroBatcher
+from .generation_profiles import GenerationProfile
+
+logger = logging.getLogger(__name__)
+
+class AdaptiveConcurrencyController:
+    """지연시간과 오류율에 따라 동시 요청 수를 조절하는 AIMD 컨트롤러
+
+    - 성공 응답의 지연시간이 기준(같은 종류 요청의 최소 관측 지연 × latency_tolerance) 이내면
+      동시 요청 한도를 약 1 RTT마다 increase_step만큼 늘린다 (additive increase)
+    - 기준 지연은 slot(key)의 key(생성 프로필 등)별로 따로 유지한다. 짧은 분류 요청의 지연을
+      긴 섹션 생성 요청의 기준으로 쓰면 모든 섹션 요청이 혼잡으로 판정되기 때문이다
+    - 오류가 나거나 지연시간이 기준을 넘으면 한도를 decrease_factor배로 줄인다
+      (multiplicative decrease, 한 번 줄인 뒤에는 진행 중인 요청이 끝날 때까지 다시 줄이지 않음)
+    """
+
+    def __init__(self, initial_limit: int = 2, min_limit: int = 1, max_limit: int = 16,
+                 latency_tolerance: float = 2.0, decrease_factor: float = 0.5,
+                 increase_step: float = 1.0):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+
+        self.limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self.in_flight = 0
+        self.min_latencies: Dict[str, float] = {}  # 요청 종류 → 최소 관측 지연
+        self.successes = 0
+        self.errors = 0
+        self._decrease_guard = 0  # 이 값만큼 요청이 끝나기 전에는 다시 줄이지 않음
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def current_limit(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    @asynccontextmanager
+    async def slot(self, key: str = 'default'):
+        """동시 요청 슬롯 획득 (async with controller.slot(key): ...), key는 지연 기준을 공유할 요청 종류"""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < self.current_limit)
+            self.in_flight += 1
+
+        outcome = {'error': False}
+        started = time.monotonic()
+        try:
+            yield outcome
+        except asyncio.CancelledError:
+            # 취소된 요청은 용량 신호로 사용하지 않음
+            outcome['cancelled'] = True
+            raise
+        except Exception:
+            outcome['error'] = True
+            raise
+        finally:
+            latency = time.monotonic() - started
+            async with condition:
+                self.in_flight -= 1
+                if not outcome.get('cancelled'):
+                    self._record(key, latency, outcome['error'])
+                condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'limit': self.current_limit,
+            'in_flight': self.in_flight,
+            'min_latencies': dict(self.min_latencies),
+            'successes': self.successes,
+            'errors': self.errors
+        }
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Condition은 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만듦
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+        return self._condition
+
+    def _record(self, key: str, latency: float, error: bool) -> None:
+        if self._decrease_guard > 0:
+            self._decrease_guard -= 1
+
+        if error:
+            self.errors += 1
+            self._decrease()
+            return
+
+        self.successes += 1
+        baseline = self.min_latencies.get(key)
+        if baseline is None or latency < baseline:
+            baseline = self.min_latencies[key] = latency
+
+        if latency > baseline * self.latency_tolerance:
+            self._decrease()
+        else:
+            self.limit = min(self.max_limit, self.limit + self.increase_step / self.limit)
+
+    def _decrease(self) -> None:
+        if self._decrease_guard > 0:
+            return
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+        self._decrease_guard = self.in_flight
+
+class AsyncLMStudioClient(LMStudioClient):
+    """비동기 LM Studio 클라이언트
+
+    동시 요청 수는 AdaptiveConcurrencyController가 서버 처리량에 맞춰 조절하며,
+    cancel_all()로 진행 중인 요청을 취소할 수 있다.
+    HTTP가 아닌 백엔드(LlamaCppBackend 등)는 스레드 풀에서 동기 호출로 실행한다.
+    AsyncOpenAI 클라이언트(httpx 연결)는 이벤트 루프에 묶이므로 루프마다 따로 만들고,
+    동기 메서드는 백그라운드 스레드에서 계속 도는 전용 루프 하나에서 실행한다.
+    """
+
+    def __init__(self, base_url="http://localhost:1234/v1", context_length: int = 4096,
+                 model: str = "local-model", cache: Optional[CompletionCache] = None,
+                 controller: Optional[AdaptiveConcurrencyController] = None,
+                 backend: Optional[CompletionBackend] = None,
+                 micro_batcher: Optional[MicroBatcher] = None):
+        super().__init__(base_url=base_url, context_length=context_length, model=model,
+                         cache=cache, backend=backend, micro_batcher=micro_batcher)
+        self._async_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]' = weakref.WeakKeyDictionary()
+        self.controller = controller or AdaptiveConcurrencyController()
+        self._in_flight_tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    async def agenerate_title(self, facts: Dict[str, Any]) -> str:
+        response = await self._agenerate_response(self.build_title_prompt(facts), profile='title')
+        return response.strip()
+
+    async def awrite_blog_section(self, facts: Dict[str, Any], section_type: str) -> Optional[str]:
+        built = self._build_section(facts, section_type)
+        if built is None:
+            return None
+
+        cached = self._semantic_lookup(section_type, built)
+        if cached is not None:
+            return cached
+
+        response = (await self._agenerate_response(built.prompt, profile='section')).strip()
+        self._semantic_store(section_type, built, response)
+        return response
+
+    async def agenerate_post_sections(self, facts: Dict[str, Any], sections: Sequence[str] = POST_SECTIONS,
+                                      include_title: bool = False) -> Dict[str, Any]:
+        """섹션(및 제목)을 동시에 생성 (동시 요청 수는 controller가 제한)"""
+        coroutines = [self.awrite_blog_section(facts, section_type) for section_type in sections]
+        if include_title:
+            coroutines.append(self.agenerate_title(facts))
+        results = await asyncio.gather(*coroutines)
+        return {
+            'title': results[-1] if include_title else None,
+            'sections': dict(zip(sections, results))
+        }
+
+    def generate_post_sections(self, facts: Dict[str, Any], sections: Sequence[str] = POST_SECTIONS,
+                               include_title: bool = False) -> Dict[str, Any]:
+        """동기 코드에서 호출하는 agenerate_post_sections (실행 중인 이벤트 루프 안에서도 호출 가능)"""
+        return self._run_sync(self.agenerate_post_sections(facts, sections, include_title))
+
+    def close(self) -> None:
+        """동기 호출용 백그라운드 이벤트 루프 종료"""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def _run_sync(self, coroutine):
+        """백그라운드 스레드의 전용 이벤트 루프에서 코루틴을 실행하고 결과를 기다림"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name='async-lm-studio-client', daemon=True
+                )
+                self._loop_thread.start()
+            loop = self._loop
+        if threading.current_thread() is self._loop_thread:
+            coroutine.close()
+            raise RuntimeError("Synchronous client method called from its own event loop; await the async method instead")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    @staticmethod
+    def _latency_key(profile: GenerationProfile) -> str:
+        """지연 기준을 공유할 요청 종류 (프로필 이름 + 최대 출력 토큰 수의 2의 거듭제곱 구간)"""
+        return f"{profile.name}/{profile.max_tokens.bit_length()}"
+
+    def _get_async_client(self) -> Optional[AsyncOpenAI]:
+        """현재 이벤트 루프용 AsyncOpenAI 클라이언트 (HTTP 백엔드가 아니면 None)"""
+        if not isinstance(self.backend, OpenAICompatibleBackend):
+            return None
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = AsyncOpenAI(base_url=self.backend.base_url, api_key="not-needed")
+            self._async_clients[loop] = client
+        return client
+
+    def cancel_all(self) -> int:
+        """진행 중인 요청 취소, 취소한 요청 수 반환"""
+        tasks = [task for task in self._in_flight_tasks if not task.done()]
+        for task in tasks:
+            task.cancel()
+        return len(tasks)
+
+    async def _agenerate_response(self, prompt: str, max_tokens: Optional[int] = None,
+                                  temperature: Optional[float] = None, use_cache: Optional[bool] = None,
+                                  profile: Any = 'default',
+                                  validate: Optional[Callable[[str], bool]] = None) -> str:
+        """비동기 응답 생성 (프로필/캐시 규칙은 _generate_response와 동일)"""
+        profile = self._resolve_profile(profile, max_tokens, temperature)
+        if use_cache is None:
+            use_cache = profile.temperature == 0
+        params = profile.cache_params()
+
+        if use_cache:
+            cached = self._cache_get(prompt, params, validate)
+            if cached is not None:
+                return cached
+
+        task = asyncio.current_task()
+        if task is not None:
+            self._in_flight_tasks.add(task)
+        try:
+            text = profile.finish(await self._arequest_completion(prompt, profile))
+        finally:
+            if task is not None:
+                self._in_flight_tasks.discard(task)
+
+        if use_cache:
+            self._cache_put(prompt, params, text, validate)
+        return text
+
+    async def _arequest_completion(self, prompt: str, profile: GenerationProfile) -> str:
+        try:
+            async with self.controller.slot(self._latency_key(profile)):
+                if self.micro_batcher is not None:
+                    return await asyncio.wrap_future(self.micro_batcher.submit(prompt, profile))
+                async_client = self._get_async_client()
+                if async_client is None:
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(None, self.backend.complete, prompt, profile)
+                completion = await async_client.completions.create(
+                    model=self.model,
+                    prompt=prompt,
+                    stream=False,
+                    **profile.request_params()
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error generating response: {e}")
+            return ""
+
+        if not completion or not getattr(completion, 'choices', None):
+            logger.warning("Received empty response from LM Studio")
+            return ""
+
+        text = completion.choices[0].text
+        return text.strip() if text else ""
@@ -0,0 +1,151 @@
+from typing import Dict, Any, Optional
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+class CompletionCache:
+    """프롬프트 → 응답 결과를 SQLite에 저장하는 영구 캐시
+
+    키는 (모델 ID, 프롬프트 해시, 샘플링 파라미터)로 만들며,
+    TTL이 지난 항목과 최대 개수를 넘는 오래된 항목(마지막 사용 시각 기준)은 제거한다.
+    """
+
+    def __init__(self, db_path: str = None, ttl_seconds: float = 7 * 24 * 3600,
+                 max_entries: int = 100000):
+        if db_path is None:
+            db_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'cache', 'completions.sqlite3')
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._puts_since_evict = 0
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS completions (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_completions_last_access ON completions (last_access)')
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, prompt: str, params: Dict[str, Any]) -> str:
+        """캐시 키 생성"""
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        payload = json.dumps({'model': model, 'prompt': prompt_hash, 'params': params},
+                             sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, model: str, prompt: str, params: Dict[str, Any]) -> Optional[str]:
+        """캐시 조회 (만료된 항목은 없는 것으로 처리)"""
+        key = self.make_key(model, prompt, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT response, created_at FROM completions WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+
+            self._conn.execute('UPDATE completions SET last_access = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, model: str, prompt: str, params: Dict[str, Any], response: str) -> None:
+        """응답 저장 (검증은 호출자 몫: 파싱에 실패한 응답은 저장하지 않아야 함)"""
+        key = self.make_key(model, prompt, params)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO completions (key, model, response, created_at, last_access) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, model, response, now, now)
+            )
+            self._conn.commit()
+            self._puts_since_evict += 1
+            # 저장할 때마다 정리하지 않고 일정 횟수마다 정리
+            if self._puts_since_evict >= max(1, self.max_entries // 100):
+                self._evict_locked()
+
+    def invalidate(self, model: str, prompt: str, params: Dict[str, Any]) -> bool:
+        """항목 하나 제거 (검증에 실패한 응답 등), 제거 여부 반환"""
+        key = self.make_key(model, prompt, params)
+        with self._lock:
+            cursor = self._conn.execute('DELETE FROM completions WHERE key = ?', (key,))
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def evict(self) -> int:
+        """만료 항목 및 최대 개수 초과 항목 제거, 제거된 개수 반환"""
+        with self._lock:
+            return self._evict_locked()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM completions')
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중 통계"""
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM completions').fetchone()[0]
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'entries': entries
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict_locked(self) -> int:
+        self._puts_since_evict = 0
+        cursor = self._conn.execute(
+            'DELETE FROM completions WHERE created_at < ?', (time.time() - self.ttl_seconds,)
+        )
+        removed = cursor.rowcount
+
+        count = self._conn.execute('SELECT COUNT(*) FROM completions').fetchone()[0]
+        if count > self.max_entries:
+            cursor = self._conn.execute(
+                'DELETE FROM completions WHERE key IN '
+                '(SELECT key FROM completions ORDER BY last_access ASC LIMIT ?)',
+                (count - self.max_entries,)
+            )
+            removed += cursor.rowcount
+
+        self._conn.commit()
+        return removed
+
+_shared_cache: Optional[CompletionCache] = None
+
+def get_completion_cache() -> CompletionCache:
+    """프로세스 전체에서 공유하는 CompletionCache 반환 (기본 경로 data/cache/completions.sqlite3)"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = CompletionCache()
+    return _shared_cache
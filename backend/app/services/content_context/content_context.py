@@ -1,5 +1,6 @@
 from typing import Dict, List, Any
 from dataclasses import dataclass
+from ..tokenizer.tokenizer import get_tokenizer
 
 @dataclass
 class ServiceInfo:
@@ -62,9 +63,11 @@ class ContentContext:
             'params': {}
         }
         
+        tokenizer = get_tokenizer()
+        
         # 1. 특징 연결 확인
         for feature in self.service.features:
-            if any(keyword in sentence for keyword in feature.split()):
+            if any(keyword in sentence for keyword in tokenizer.words(feature)):
                 connection.update({
                     'type': 'feature',
                     'params': {
@@ -77,7 +80,7 @@ class ContentContext:
         # 2. 혜택 연결 확인
         if not connection['type']:
             for benefit in self.service.benefits:
-                if any(keyword in sentence for keyword in benefit.split()):
+                if any(keyword in sentence for keyword in tokenizer.words(benefit)):
                     connection.update({
                         'type': 'benefit',
                         'params': {
@@ -0,0 +1,164 @@
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+import logging
+import os
+import time
+import numpy as np
+from .embeddings.sentence_embedder import SentenceEmbedder, get_embedder
+from .generation_profiles import CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+CLASSIFIER_METHODS = ('centroid', 'softmax')
+
+class EmbeddingClassifier:
+    """문장 임베딩으로 카테고리를 분류하는 로컬 분류기
+
+    LLM이 붙인 과거 분류 결과(SentenceStorage)로 학습하며 두 가지 방식을 지원한다.
+    - 'centroid': 카테고리별 평균 벡터와의 코사인 유사도 (scale을 곱한 softmax로 확률화)
+    - 'softmax': L2 정규화한 다항 로지스틱 회귀 (경사하강법)
+
+    predict()는 (카테고리, 신뢰도)를 반환하며, 신뢰도가 confidence_threshold보다
+    낮은 문장만 SentenceClassifier가 LLM으로 다시 분류한다.
+    """
+
+    def __init__(self, embedder: Optional[SentenceEmbedder] = None, method: str = 'centroid',
+                 categories: Sequence[str] = CATEGORIES, confidence_threshold: float = 0.6,
+                 scale: float = 20.0):
+        if method not in CLASSIFIER_METHODS:
+            raise ValueError(f"Unknown classifier method: {method}")
+        self.embedder = embedder or get_embedder()
+        self.method = method
+        self.categories = list(categories)
+        self.confidence_threshold = confidence_threshold
+        self.scale = scale  # centroid 방식의 코사인 유사도 → 확률 변환 온도
+
+        self.weights: Optional[np.ndarray] = None  # (차원 × 카테고리)
+        self.bias: Optional[np.ndarray] = None     # (카테고리,)
+
+    @property
+    def is_trained(self) -> bool:
+        return self.weights is not None
+
+    def fit(self, texts: Sequence[str], labels: Sequence[str], epochs: int = 200,
+            learning_rate: float = 0.5, l2: float = 1e-3) -> 'EmbeddingClassifier':
+        """LLM 분류 결과로 학습"""
+        known = [(t, l) for t, l in zip(texts, labels) if l in self.categories]
+        if not known:
+            raise ValueError("No labeled sentences to train on")
+
+        X = self.embedder.embed_many([t for t, _ in known])
+        y = np.array([self.categories.index(l) for _, l in known], dtype=np.int64)
+
+        if self.method == 'centroid':
+            self._fit_centroids(X, y)
+        else:
+            self._fit_softmax(X, y, epochs, learning_rate, l2)
+        logger.info(f"Trained {self.method} classifier on {len(known)} sentences")
+        return self
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """(문장 수 × 카테고리 수) 확률 행렬"""
+        if not self.is_trained:
+            raise ValueError("Classifier is not trained")
+        X = self.embedder.embed_many(texts)
+        logits = X @ self.weights + self.bias
+        return self._softmax(logits)
+
+    def predict(self, texts: Sequence[str]) -> Tuple[List[str], np.ndarray]:
+        """(카테고리 목록, 신뢰도 배열)"""
+        if not texts:
+            return [], np.zeros(0, dtype=np.float32)
+        proba = self.predict_proba(texts)
+        best = proba.argmax(axis=1)
+        return [self.categories[i] for i in best], proba[np.arange(len(best)), best]
+
+    def evaluate(self, texts: Sequence[str], labels: Sequence[str]) -> Dict[str, Any]:
+        """보류한 LLM 분류 결과에 대한 정확도/처리량 리포트"""
+        started = time.perf_counter()
+        predicted, confidence = self.predict(texts)
+        elapsed = time.perf_counter() - started
+
+        labels = list(labels)
+        correct = np.array([p == l for p, l in zip(predicted, labels)], dtype=bool)
+        confident = confidence >= self.confidence_threshold
+
+        per_category = {}
+        for category in self.categories:
+            mask = np.array([l == category for l in labels], dtype=bool)
+            if mask.any():
+                per_category[category] = {
+                    'support': int(mask.sum()),
+                    'accuracy': float(correct[mask].mean())
+                }
+
+        return {
+            'samples': len(labels),
+            'accuracy': float(correct.mean()) if len(correct) else 0.0,
+            'confident_ratio': float(confident.mean()) if len(confident) else 0.0,
+            'confident_accuracy': float(correct[confident].mean()) if confident.any() else 0.0,
+            'escalation_rate': float(1 - confident.mean()) if len(confident) else 0.0,
+            'sentences_per_second': len(labels) / elapsed if elapsed > 0 else 0.0,
+            'per_category': per_category
+        }
+
+    def save(self, path: str = None) -> str:
+        """학습된 가중치 저장 (npz)"""
+        if not self.is_trained:
+            raise ValueError("Classifier is not trained")
+        path = path or self.default_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez(path, weights=self.weights, bias=self.bias,
+                 categories=np.array(self.categories), method=np.array(self.method),
+                 model_name=np.array(self.embedder.model_name))
+        return path
+
+    @classmethod
+    def load(cls, path: str = None, embedder: Optional[SentenceEmbedder] = None,
+             confidence_threshold: float = 0.6) -> 'EmbeddingClassifier':
+        """저장된 분류기 로드"""
+        path = path or cls.default_path()
+        with np.load(path) as data:
+            classifier = cls(embedder=embedder, method=str(data['method']),
+                             categories=[str(c) for c in data['categories']],
+                             confidence_threshold=confidence_threshold)
+            classifier.weights = data['weights']
+            classifier.bias = data['bias']
+        return classifier
+
+    @staticmethod
+    def default_path() -> str:
+        return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'models', 'embedding_classifier.npz')
+
+    def _fit_centroids(self, X: np.ndarray, y: np.ndarray) -> None:
+        centroids = np.zeros((len(self.categories), X.shape[1]), dtype=np.float32)
+        for k in range(len(self.categories)):
+            members = X[y == k]
+            if len(members):
+                centroid = members.mean(axis=0)
+                norm = np.linalg.norm(centroid)
+                centroids[k] = centroid / norm if norm > 0 else centroid
+        # 학습 데이터가 없는 카테고리는 선택되지 않도록 큰 음수 편향
+        empty = ~centroids.any(axis=1)
+        self.weights = (self.scale * centroids.T).astype(np.float32)
+        self.bias = np.where(empty, -1e4, 0.0).astype(np.float32)
+
+    def _fit_softmax(self, X: np.ndarray, y: np.ndarray, epochs: int,
+                     learning_rate: float, l2: float) -> None:
+        n, d = X.shape
+        k = len(self.categories)
+        targets = np.zeros((n, k), dtype=np.float32)
+        targets[np.arange(n), y] = 1.0
+
+        W = np.zeros((d, k), dtype=np.float32)
+        b = np.zeros(k, dtype=np.float32)
+        for _ in range(epochs):
+            gradient = self._softmax(X @ W + b) - targets
+            W -= learning_rate * (X.T @ gradient / n + l2 * W)
+            b -= learning_rate * gradient.mean(axis=0)
+        self.weights, self.bias = W, b
+
+    @staticmethod
+    def _softmax(logits: np.ndarray) -> np.ndarray:
+        logits = logits - logits.max(axis=1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
@@ -0,0 +1,3 @@
+from .sentence_embedder import SentenceEmbedder, get_embedder, load_spacy_model
+
+__all__ = ['SentenceEmbedder', 'get_embedder', 'load_spacy_model']
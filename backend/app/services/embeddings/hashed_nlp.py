@@ -0,0 +1,16 @@
+import zlib
+import numpy as np
+
+class HashedDoc:
+    def __init__(self, text: str, dimensions: int = 64):
+        self.vector = np.zeros(dimensions, dtype=np.float32)
+        for word in text.split():
+            self.vector[zlib.crc32(word.encode('utf-8')) % dimensions] += 1
+
+class HashedNLP:
+    """spaCy 없이 테스트하기 위한 단어 해시 벡터 모델 (SentenceEmbedder(nlp=HashedNLP()))"""
+    class vocab:
+        vectors_length = 64
+
+    def make_doc(self, text: str) -> HashedDoc:
+        return HashedDoc(text, self.vocab.vectors_length)
@@ -0,0 +1,84 @@
+from typing import Dict, Any, Optional, Sequence
+import logging
+import threading
+import numpy as np
+from ..cache.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "ko_core_news_lg"
+
+# 프로세스당 한 번만 spaCy 모델을 로드하기 위한 캐시
+_SPACY_MODELS: Dict[str, Any] = {}
+_SPACY_MODELS_LOCK = threading.Lock()
+
+def load_spacy_model(name: str = DEFAULT_MODEL) -> Any:
+    """spaCy 모델 로드 (같은 이름은 프로세스 내에서 재사용)
+
+    모델 패키지는 requirements.txt로 설치하며, 요청 처리 중에 내려받지 않는다.
+    """
+    with _SPACY_MODELS_LOCK:
+        nlp = _SPACY_MODELS.get(name)
+        if nlp is None:
+            import spacy
+
+            try:
+                nlp = spacy.load(name)
+            except OSError as e:
+                raise OSError(
+                    f"spaCy model '{name}' is not installed; install it with "
+                    f"'pip install -r requirements.txt' or 'python -m spacy download {name}'"
+                ) from e
+            _SPACY_MODELS[name] = nlp
+        return nlp
+
+class SentenceEmbedder:
+    """spaCy 정적 단어 벡터의 평균으로 문장/문단 임베딩을 만드는 클래스
+
+    토크나이저만 실행(nlp.make_doc)하므로 파이프라인 전체를 돌리는 것보다 빠르며,
+    결과는 L2 정규화된 float32 벡터라 내적이 곧 코사인 유사도다.
+    같은 텍스트의 임베딩은 LRU 캐시에 보관한다.
+    """
+
+    def __init__(self, model_name: str = DEFAULT_MODEL, nlp: Any = None, cache_size: int = 50000):
+        self.model_name = model_name
+        self._nlp = nlp
+        self.cache = LRUCache(maxsize=cache_size)
+
+    @property
+    def nlp(self) -> Any:
+        if self._nlp is None:
+            self._nlp = load_spacy_model(self.model_name)
+        return self._nlp
+
+    @property
+    def dim(self) -> int:
+        return int(self.nlp.vocab.vectors_length)
+
+    def embed(self, text: str) -> np.ndarray:
+        """텍스트 하나의 정규화된 임베딩"""
+        vector = self.cache.get(text)
+        if vector is None:
+            vector = self._normalize(np.asarray(self.nlp.make_doc(text).vector, dtype=np.float32))
+            self.cache.put(text, vector)
+        return vector
+
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        """(텍스트 수 × 차원) 임베딩 행렬"""
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.vstack([self.embed(text) for text in texts])
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+_shared_embedder: Optional[SentenceEmbedder] = None
+
+def get_embedder() -> SentenceEmbedder:
+    """프로세스 전체에서 공유하는 SentenceEmbedder 반환"""
+    global _shared_embedder
+    if _shared_embedder is None:
+        _shared_embedder = SentenceEmbedder()
+    return _shared_embedder
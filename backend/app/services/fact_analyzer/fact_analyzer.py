@@ -1,12 +1,29 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Optional
 from collections import Counter
+from dataclasses import asdict
 import re
+from ..cache.lru_cache import LRUCache
+from ..keyword_engine.keyword_engine import KeywordEngine
+from ..statistics_index.statistics_index import StatisticsExtractor
+from ..tokenizer.tokenizer import get_tokenizer
+from .template_miner import TemplateMiner
+
+# 문장 패턴 추출용 정규식
+NUM_PATTERN = re.compile(r'\d+')
+KOR_PATTERN = re.compile(r'[가-힣]+')
+ENG_PATTERN = re.compile(r'[a-zA-Z]+')
 
 class FactAnalyzer:
     """추출된 팩트를 분석하고 활용 가능한 형태로 가공하는 클래스"""
     
-    def __init__(self):
-        self.pattern_cache = {}
+    def __init__(self, pattern_cache_size: int = 50000, template_capacity: int = 5000,
+                 max_templates: int = 20, keyword_engine: Optional[KeywordEngine] = None):
+        self.pattern_cache = LRUCache(maxsize=pattern_cache_size)
+        self.template_capacity = template_capacity  # 템플릿 빈도 인덱스 최대 항목 수
+        self.max_templates = max_templates
+        self.statistics_extractor = StatisticsExtractor()
+        self.keyword_engine = keyword_engine  # 말뭉치 DF 기반 키워드 점수 (없으면 단순 빈도)
+        self.tokenizer = get_tokenizer()
         
     def analyze_facts(self, facts: Dict[str, Any]) -> Dict[str, Any]:
         """팩트 분석 및 구조화"""
@@ -50,11 +67,17 @@ class FactAnalyzer:
     
     def _extract_keywords(self, facts: Dict[str, Any]) -> Dict[str, float]:
         """키워드 중요도 분석"""
+        if self.keyword_engine is not None:
+            # 말뭉치 전체에서 흔한 단어는 낮게 평가되는 TF-IDF 점수 사용
+            scored = self.keyword_engine.top_keywords(facts.get('sentences', []), 20)
+            total = sum(score for _, score in scored)
+            return {word: score/total for word, score in scored} if total else {}
+        
         keywords = Counter()
         
         # 문장에서 키워드 추출
         for sentence in facts.get('sentences', []):
-            words = sentence.split()
+            words = self.tokenizer.words(sentence)
             keywords.update(words)
             
         # 정규화된 점수 계산
@@ -65,30 +88,45 @@ class FactAnalyzer:
         """통계 정보 추출"""
         statistics = []
         
-        for sentence in facts.get('sentences', []):
+        for sentence_id, sentence in enumerate(facts.get('sentences', [])):
             # 숫자가 포함된 문장에서 통계 추출
             if re.search(r'\d+', sentence):
+                records = self.statistics_extractor.extract(sentence, sentence_id)
                 statistics.append({
                     'text': sentence,
                     'numbers': re.findall(r'\d+(?:[\.,]\d+)?', sentence),
+                    'values': [asdict(record) for record in records],
                     'context': self._get_statistical_context(sentence)
                 })
                 
         return statistics
     
-    def _find_content_templates(self, facts: Dict[str, Any]) -> List[Dict[str, str]]:
+    def _find_content_templates(self, facts: Dict[str, Any]) -> List[Dict[str, Any]]:
         """컨텐츠 템플릿 추출"""
-        templates = []
+        # 전체 문장에서 반복되는 문장 구조 찾기
+        return self.mine_templates(facts.get('sentences', []), self.max_templates)
+    
+    def mine_templates(self, sentences: Iterable[str], top_n: int = 20) -> List[Dict[str, Any]]:
+        """문장 패턴 빈도 인덱스로 반복 구조 상위 N개 추출
         
-        # 반복되는 문장 구조 찾기
-        sentences = facts.get('sentences', [])
-        for i in range(len(sentences)-1):
-            if self._is_similar_structure(sentences[i], sentences[i+1]):
-                templates.append({
-                    'pattern': self._extract_template_pattern(sentences[i]),
-                    'example': sentences[i]
-                })
-                
+        sentences는 제너레이터여도 되며, 메모리 사용량은 문장 수가 아닌
+        template_capacity에 비례한다.
+        """
+        miner = TemplateMiner(capacity=self.template_capacity)
+        for sentence in sentences:
+            miner.add(self._get_sentence_pattern(sentence), sentence)
+        
+        templates = []
+        for entry in miner.top(top_n):
+            example = entry['examples'][0]
+            templates.append({
+                'pattern': self._extract_template_pattern(example),
+                'example': example,
+                'signature': entry['signature'],
+                'count': entry['count'],
+                'error': entry['error'],
+                'examples': entry['examples']
+            })
         return templates
     
     def _get_statistical_context(self, sentence: str) -> str:
@@ -113,15 +151,16 @@ class FactAnalyzer:
     
     def _get_sentence_pattern(self, sentence: str) -> str:
         """문장의 패턴 추출"""
-        if sentence in self.pattern_cache:
-            return self.pattern_cache[sentence]
+        pattern = self.pattern_cache.get(sentence)
+        if pattern is not None:
+            return pattern
             
-        # 문장 패턴 추출 로직
-        pattern = re.sub(r'\d+', 'NUM', sentence)
-        pattern = re.sub(r'[가-힣]+', 'KOR', pattern)
-        pattern = re.sub(r'[a-zA-Z]+', 'ENG', pattern)
+        # 문장 패턴 추출 로직 (영문 치환을 먼저 해야 NUM/KOR 표식이 ENG로 덮이지 않음)
+        pattern = ENG_PATTERN.sub('ENG', sentence)
+        pattern = NUM_PATTERN.sub('NUM', pattern)
+        pattern = KOR_PATTERN.sub('KOR', pattern)
         
-        self.pattern_cache[sentence] = pattern
+        self.pattern_cache.put(sentence, pattern)
         return pattern
     
     def _extract_template_pattern(self, sentence: str) -> str:
@@ -0,0 +1,62 @@
+from typing import Dict, List, Any, Iterable
+
+class TemplateMiner:
+    """문장 패턴 시그니처의 출현 빈도를 집계하는 클래스 (lossy counting)
+
+    항목 수가 capacity의 2배를 넘으면 빈도 상한(count + error)이 큰 capacity개만 남기고 정리한다.
+    정리로 버려진 시그니처가 다시 나타나면 이전에 최대 max_error번 나왔을 수 있으므로,
+    새 항목은 그 시점의 max_error를 error로 가지고 실제 빈도는 [count, count + error] 안에 있다.
+    따라서 말뭉치 크기와 관계없이 메모리 사용량은 O(capacity)로 유지된다.
+    """
+
+    def __init__(self, capacity: int = 5000, max_examples: int = 3):
+        self.capacity = capacity
+        self.max_examples = max_examples
+        self.max_error = 0  # 정리 과정에서 버려진 항목의 최대 빈도 상한
+        self.total = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, signature: str, example: str) -> None:
+        """시그니처 빈도 증가"""
+        entry = self._entries.get(signature)
+        if entry is None:
+            entry = {'count': 0, 'error': self.max_error, 'examples': []}
+            self._entries[signature] = entry
+
+        entry['count'] += 1
+        if len(entry['examples']) < self.max_examples:
+            entry['examples'].append(example)
+
+        self.total += 1
+        if len(self._entries) > 2 * self.capacity:
+            self._prune()
+
+    def add_all(self, items: Iterable[tuple]) -> None:
+        """(시그니처, 예시 문장) 쌍 일괄 추가"""
+        for signature, example in items:
+            self.add(signature, example)
+
+    def top(self, n: int = 10, min_count: int = 2) -> List[Dict[str, Any]]:
+        """빈도 상위 N개 시그니처 반환 (count는 확실히 센 횟수, error는 과소 집계될 수 있는 최대 횟수)"""
+        entries = sorted(self._entries.items(), key=lambda item: item[1]['count'], reverse=True)
+        return [
+            {
+                'signature': signature,
+                'count': entry['count'],
+                'error': entry['error'],
+                'examples': list(entry['examples'])
+            }
+            for signature, entry in entries[:n]
+            if entry['count'] >= min_count
+        ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _prune(self) -> None:
+        """빈도 상한 상위 capacity개만 남기고 정리"""
+        entries = sorted(self._entries.items(), key=lambda item: item[1]['count'] + item[1]['error'], reverse=True)
+        kept, dropped = entries[:self.capacity], entries[self.capacity:]
+        if dropped:
+            self.max_error = max(self.max_error, dropped[0][1]['count'] + dropped[0][1]['error'])
+        self._entries = dict(kept)
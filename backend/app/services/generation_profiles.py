@@ -0,0 +1,100 @@
+from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field, replace
+
+CATEGORIES = ['usage', 'benefits', 'features', 'costs', 'reviews']
+
+# analyze_sentence 응답 스키마
+ANALYSIS_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'confidence': {'type': 'number', 'minimum': 0.0, 'maximum': 1.0},
+        'keywords': {'type': 'array', 'items': {'type': 'string'}},
+        'sentiment': {'type': 'number', 'minimum': -1.0, 'maximum': 1.0},
+        'quality_score': {'type': 'number', 'minimum': 0.0, 'maximum': 1.0}
+    },
+    'required': ['confidence', 'keywords', 'sentiment', 'quality_score']
+}
+
+# classify_batch 응답 스키마
+BATCH_CLASSIFICATION_SCHEMA = {
+    'type': 'array',
+    'items': {
+        'type': 'object',
+        'properties': {
+            'index': {'type': 'integer', 'minimum': 0},
+            'category': {'type': 'string', 'enum': CATEGORIES},
+            **ANALYSIS_SCHEMA['properties']
+        },
+        'required': ['index', 'category'] + ANALYSIS_SCHEMA['required']
+    }
+}
+
+@dataclass(frozen=True)
+class GenerationProfile:
+    """작업 유형별 생성 설정"""
+    name: str
+    max_tokens: int
+    temperature: float
+    stop: List[str] = field(default_factory=list)
+    json_schema: Optional[Dict[str, Any]] = None  # 지정 시 백엔드가 JSON 구조를 강제
+    # 응답의 첫 줄만 사용 (줄바꿈 stop은 응답이 빈 줄로 시작하면 위치 0에서 끝나므로 클라이언트에서 자름)
+    first_line: bool = False
+
+    def with_overrides(self, max_tokens: Optional[int] = None,
+                       temperature: Optional[float] = None) -> 'GenerationProfile':
+        """일부 값만 바꾼 프로필 반환"""
+        return replace(
+            self,
+            max_tokens=self.max_tokens if max_tokens is None else max_tokens,
+            temperature=self.temperature if temperature is None else temperature
+        )
+
+    def finish(self, text: str) -> str:
+        """응답 후처리: 앞뒤 공백을 제거하고 first_line이면 첫 번째 비어 있지 않은 줄만 반환"""
+        text = text.strip() if text else ""
+        if self.first_line:
+            text = text.split('\n', 1)[0].rstrip()
+        return text
+
+    def cache_params(self) -> Dict[str, Any]:
+        """캐시 키에 포함할 샘플링 파라미터"""
+        return {
+            'max_tokens': self.max_tokens,
+            'temperature': self.temperature,
+            'stop': self.stop,
+            'json_schema': self.json_schema
+        }
+
+    def request_params(self) -> Dict[str, Any]:
+        """completions.create()에 넘길 파라미터
+
+        JSON 스키마는 llama.cpp 계열 서버(LM Studio 포함)가 지원하는
+        json_schema 필드로 전달하여 문법 제약 디코딩을 사용한다.
+        """
+        params: Dict[str, Any] = {
+            'max_tokens': self.max_tokens,
+            'temperature': self.temperature
+        }
+        if self.stop:
+            params['stop'] = self.stop
+        if self.json_schema is not None:
+            params['extra_body'] = {'json_schema': self.json_schema}
+        return params
+
+GENERATION_PROFILES: Dict[str, GenerationProfile] = {
+    'default': GenerationProfile('default', max_tokens=2000, temperature=0.7),
+    'classify': GenerationProfile('classify', max_tokens=8, temperature=0.0, first_line=True),
+    'analyze': GenerationProfile('analyze', max_tokens=200, temperature=0.0, json_schema=ANALYSIS_SCHEMA),
+    'classify_batch': GenerationProfile('classify_batch', max_tokens=2000, temperature=0.0,
+                                        json_schema=BATCH_CLASSIFICATION_SCHEMA),
+    'title': GenerationProfile('title', max_tokens=80, temperature=0.7, first_line=True),
+    'section': GenerationProfile('section', max_tokens=1200, temperature=0.7),
+}
+
+def get_profile(profile: Any = 'default') -> GenerationProfile:
+    """이름 또는 GenerationProfile 객체로 프로필 조회"""
+    if isinstance(profile, GenerationProfile):
+        return profile
+    if profile not in GENERATION_PROFILES:
+        raise ValueError(f"Unknown generation profile: {profile}")
+    return GENERATION_PROFILES[profile]
@@ -0,0 +1,3 @@
+from .keyword_engine import KeywordEngine
+
+__all__ = ['KeywordEngine']
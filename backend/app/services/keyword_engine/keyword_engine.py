@@ -0,0 +1,255 @@
+from typing import Dict, List, Any, Tuple
+import json
+import logging
+import os
+import re
+import numpy as np
+from scipy import sparse
+from ..tokenizer.tokenizer import get_tokenizer
+
+logger = logging.getLogger(__name__)
+
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+def tokenize(text: str) -> Tuple[str, ...]:
+    """조사를 제거하고 2글자 이상의 단어만 반환 (공유 토큰화 캐시 사용)"""
+    return get_tokenizer().keywords(text)
+
+class KeywordEngine:
+    """수집 말뭉치 전체의 문서 빈도(DF)를 유지하며 TF-IDF/BM25 점수를 계산하는 클래스
+
+    DF 테이블은 data/index/document_frequency.json에 저장되며,
+    update_from_collected()는 새로 추가되거나 변경된 수집 파일만 반영한다.
+    파일별 기여분(문서 수, 길이 합, 단어별 DF)을 함께 저장해, 변경되거나 삭제된 파일은
+    이전 기여분을 뺀 뒤 다시 반영한다.
+    점수 계산은 문서×단어 희소 행렬 연산으로 한 번에 처리한다.
+    """
+
+    def __init__(self, base_dir: str = None, k1: float = 1.5, b: float = 0.75):
+        if base_dir is None:
+            base_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
+
+        self.collected_dir = os.path.join(base_dir, 'collected')
+        self.index_path = os.path.join(base_dir, 'index', 'document_frequency.json')
+        self.k1 = k1
+        self.b = b
+
+        self.doc_freq: Dict[str, int] = {}
+        self.num_docs = 0
+        self.total_doc_length = 0
+        # 파일명 -> {'mtime': 처리 시점의 수정 시각, 'num_docs', 'total_doc_length', 'doc_freq'}
+        self.processed_files: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    @property
+    def avg_doc_length(self) -> float:
+        return self.total_doc_length / self.num_docs if self.num_docs else 0.0
+
+    def load(self) -> None:
+        """저장된 DF 테이블 로드"""
+        if not os.path.exists(self.index_path):
+            return
+
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        processed_files = data.get('processed_files', {})
+        if any(not isinstance(entry, dict) for entry in processed_files.values()):
+            # 파일별 기여분이 없는 이전 형식: 변경 파일을 뺄 수 없으므로 처음부터 다시 만든다
+            logger.info("Rebuilding document frequency index from the old format")
+            return
+
+        self.doc_freq = data.get('doc_freq', {})
+        self.num_docs = data.get('num_docs', 0)
+        self.total_doc_length = data.get('total_doc_length', 0)
+        self.processed_files = processed_files
+
+    def save(self) -> str:
+        """DF 테이블 저장"""
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'num_docs': self.num_docs,
+                'total_doc_length': self.total_doc_length,
+                'processed_files': self.processed_files,
+                'doc_freq': self.doc_freq
+            }, f, ensure_ascii=False)
+        return self.index_path
+
+    def add_documents(self, documents: List[str]) -> Dict[str, Any]:
+        """문서들을 DF 테이블에 반영하고 그 기여분 반환 (remove_contribution()으로 되돌릴 수 있음)"""
+        contribution = {'num_docs': 0, 'total_doc_length': 0, 'doc_freq': {}}
+        doc_freq = contribution['doc_freq']
+        for document in documents:
+            tokens = tokenize(document)
+            if not tokens:
+                continue
+            contribution['num_docs'] += 1
+            contribution['total_doc_length'] += len(tokens)
+            for term in set(tokens):
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+
+        self.num_docs += contribution['num_docs']
+        self.total_doc_length += contribution['total_doc_length']
+        for term, count in doc_freq.items():
+            self.doc_freq[term] = self.doc_freq.get(term, 0) + count
+        return contribution
+
+    def remove_contribution(self, contribution: Dict[str, Any]) -> None:
+        """add_documents()가 반환한 기여분을 DF 테이블에서 제거"""
+        self.num_docs -= contribution.get('num_docs', 0)
+        self.total_doc_length -= contribution.get('total_doc_length', 0)
+        for term, count in contribution.get('doc_freq', {}).items():
+            remaining = self.doc_freq.get(term, 0) - count
+            if remaining > 0:
+                self.doc_freq[term] = remaining
+            else:
+                self.doc_freq.pop(term, None)
+
+    def update_from_collected(self, collected_dir: str = None) -> int:
+        """data/collected에서 새로 추가되거나 변경된 파일만 DF 테이블에 반영 (삭제된 파일은 제거)"""
+        collected_dir = collected_dir or self.collected_dir
+        if not os.path.isdir(collected_dir):
+            return 0
+
+        filenames = sorted(f for f in os.listdir(collected_dir) if f.endswith('.json'))
+        changed = False
+        for filename in set(self.processed_files) - set(filenames):
+            self.remove_contribution(self.processed_files.pop(filename))
+            changed = True
+
+        added = 0
+        for filename in filenames:
+            filepath = os.path.join(collected_dir, filename)
+            mtime = os.path.getmtime(filepath)
+            previous = self.processed_files.get(filename)
+            if previous is not None and previous['mtime'] == mtime:
+                continue
+
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"Error reading {filepath}: {str(e)}")
+                continue
+
+            if previous is not None:
+                self.remove_contribution(previous)
+            documents = self._collect_documents(data)
+            contribution = self.add_documents(documents)
+            contribution['mtime'] = mtime
+            self.processed_files[filename] = contribution
+            added += len(documents)
+            changed = True
+
+        if changed:
+            self.save()
+        return added
+
+    def idf(self, terms: List[str]) -> np.ndarray:
+        """BM25 방식의 IDF (말뭉치에 없는 단어는 최대값)"""
+        df = np.fromiter((self.doc_freq.get(t, 0) for t in terms), dtype=np.float64, count=len(terms))
+        return np.log1p((self.num_docs - df + 0.5) / (df + 0.5))
+
+    def document_ratio(self, term: str) -> float:
+        """단어가 등장한 문서 비율"""
+        return self.doc_freq.get(term, 0) / self.num_docs if self.num_docs else 0.0
+
+    def term_matrix(self, texts: List[str]) -> Tuple[sparse.csr_matrix, List[str]]:
+        """텍스트 목록을 (텍스트 × 단어) 빈도 희소 행렬로 변환"""
+        vocabulary: Dict[str, int] = {}
+        indices: List[int] = []
+        indptr = [0]
+
+        for text in texts:
+            for term in tokenize(text):
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+            indptr.append(len(indices))
+
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float64), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(len(texts), len(vocabulary))
+        )
+        matrix.sum_duplicates()
+        return matrix, list(vocabulary)
+
+    def tfidf_matrix(self, texts: List[str]) -> Tuple[sparse.csr_matrix, List[str]]:
+        """길이 정규화된 TF × IDF 행렬"""
+        counts, terms = self.term_matrix(texts)
+        lengths = np.asarray(counts.sum(axis=1)).ravel()
+        lengths[lengths == 0] = 1.0
+        weights = sparse.diags(1.0 / lengths) @ counts @ sparse.diags(self.idf(terms))
+        return sparse.csr_matrix(weights), terms
+
+    def bm25_matrix(self, texts: List[str]) -> Tuple[sparse.csr_matrix, List[str]]:
+        """BM25 단어 가중치 행렬
+
+        길이 정규화는 말뭉치 전체의 평균 문서 길이를 기준으로 하므로 한 문장의 점수가
+        함께 넘긴 문장 묶음에 따라 달라지지 않는다. 말뭉치가 비어 있을 때만 묶음 평균을 쓴다.
+        """
+        counts, terms = self.term_matrix(texts)
+        lengths = np.asarray(counts.sum(axis=1)).ravel()
+        avgdl = self.avg_doc_length
+        if avgdl <= 0:
+            avgdl = lengths.mean() if len(lengths) and lengths.mean() > 0 else 1.0
+
+        rows = np.repeat(np.arange(counts.shape[0]), np.diff(counts.indptr))
+        tf = counts.data
+        norm = self.k1 * (1 - self.b + self.b * lengths[rows] / avgdl)
+        data = tf * (self.k1 + 1) / (tf + norm) * self.idf(terms)[counts.indices]
+
+        return sparse.csr_matrix((data, counts.indices, counts.indptr), shape=counts.shape), terms
+
+    def score_terms(self, text: str, method: str = 'tfidf') -> Dict[str, float]:
+        """하나의 문장/문서에 대한 단어별 점수"""
+        matrix, terms = self._weight_matrix([text], method)
+        row = matrix.getrow(0)
+        return {terms[i]: float(v) for i, v in zip(row.indices, row.data)}
+
+    def top_keywords(self, texts: List[str], top_n: int = 20,
+                     method: str = 'tfidf') -> List[Tuple[str, float]]:
+        """텍스트 묶음 전체에서 점수 합계 상위 키워드"""
+        if not texts:
+            return []
+        matrix, terms = self._weight_matrix(texts, method)
+        totals = np.asarray(matrix.sum(axis=0)).ravel()
+        if not len(totals):
+            return []
+
+        top_n = min(top_n, len(totals))
+        top = np.argpartition(-totals, top_n - 1)[:top_n]
+        top = top[np.argsort(-totals[top], kind='stable')]
+        return [(terms[i], float(totals[i])) for i in top]
+
+    def rank_sentences(self, sentences: List[str], query: str,
+                       method: str = 'bm25') -> np.ndarray:
+        """질의어에 대한 문장별 점수 (문장 순서와 동일한 배열)"""
+        matrix, terms = self._weight_matrix(sentences, method)
+        term_ids = {term: i for i, term in enumerate(terms)}
+
+        query_vector = np.zeros(len(terms), dtype=np.float64)
+        for term in tokenize(query):
+            if term in term_ids:
+                query_vector[term_ids[term]] += 1.0
+
+        return matrix @ query_vector
+
+    def _weight_matrix(self, texts: List[str], method: str) -> Tuple[sparse.csr_matrix, List[str]]:
+        if method == 'tfidf':
+            return self.tfidf_matrix(texts)
+        if method == 'bm25':
+            return self.bm25_matrix(texts)
+        raise ValueError(f"Unknown scoring method: {method}")
+
+    def _collect_documents(self, data: Dict[str, Any]) -> List[str]:
+        """수집 파일에서 블로그/뉴스 본문 추출"""
+        documents = []
+        if not isinstance(data, dict):
+            return documents
+
+        for key in ('blog_results', 'news_results'):
+            for item in data.get(key, []):
+                content = item.get('full_content', '') or item.get('content', '') or item.get('description', '')
+                if content:
+                    documents.append(HTML_TAG_PATTERN.sub('', content))
+        return documents
@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+import unittest
+from .keyword_engine import KeywordEngine
+
+def write_collected(directory, filename, contents, mtime=None):
+    path = os.path.join(directory, filename)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'blog_results': [{'content': c} for c in contents]}, f, ensure_ascii=False)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+class TestKeywordEngine(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base_dir = self.tmp.name
+        self.collected_dir = os.path.join(self.base_dir, 'collected')
+        os.makedirs(self.collected_dir)
+        self.engine = KeywordEngine(base_dir=self.base_dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def snapshot(self, engine):
+        return engine.num_docs, engine.total_doc_length, dict(engine.doc_freq)
+
+    def test_update_counts_documents(self):
+        write_collected(self.collected_dir, 'a.json', ["퀵플렉스 수수료 안내", "퀵플렉스 신청 방법"])
+        self.assertEqual(self.engine.update_from_collected(), 2)
+        self.assertEqual(self.engine.num_docs, 2)
+        self.assertEqual(self.engine.doc_freq['퀵플렉스'], 2)
+        self.assertEqual(self.engine.doc_freq['수수료'], 1)
+        # 변경되지 않은 파일은 다시 반영하지 않음
+        self.assertEqual(self.engine.update_from_collected(), 0)
+        self.assertEqual(self.engine.num_docs, 2)
+
+    def test_modified_file_replaces_previous_counts(self):
+        write_collected(self.collected_dir, 'a.json', ["퀵플렉스 수수료 안내", "퀵플렉스 신청 방법"], mtime=1000)
+        write_collected(self.collected_dir, 'b.json', ["배민커넥트 수수료 안내"], mtime=1000)
+        self.engine.update_from_collected()
+
+        write_collected(self.collected_dir, 'a.json', ["퀵플렉스 후기 모음"], mtime=2000)
+        self.engine.update_from_collected()
+
+        fresh = KeywordEngine(base_dir=tempfile.mkdtemp(dir=self.base_dir))
+        fresh.update_from_collected(self.collected_dir)
+        self.assertEqual(self.snapshot(self.engine), self.snapshot(fresh))
+        self.assertNotIn('신청', self.engine.doc_freq)
+
+    def test_deleted_file_is_removed(self):
+        write_collected(self.collected_dir, 'a.json', ["퀵플렉스 수수료 안내"])
+        path = write_collected(self.collected_dir, 'b.json', ["배민커넥트 신청 방법"])
+        self.engine.update_from_collected()
+        os.remove(path)
+        self.engine.update_from_collected()
+        self.assertEqual(self.engine.num_docs, 1)
+        self.assertNotIn('배민커넥트', self.engine.doc_freq)
+        self.assertNotIn('b.json', self.engine.processed_files)
+
+    def test_saved_index_reloads(self):
+        write_collected(self.collected_dir, 'a.json', ["퀵플렉스 수수료 안내", "퀵플렉스 신청 방법"])
+        self.engine.update_from_collected()
+        reloaded = KeywordEngine(base_dir=self.base_dir)
+        self.assertEqual(self.snapshot(reloaded), self.snapshot(self.engine))
+        self.assertEqual(reloaded.update_from_collected(), 0)
+
+    def test_rank_sentences_prefers_query_terms(self):
+        write_collected(self.collected_dir, 'a.json', ["퀵플렉스 수수료 안내", "퀵플렉스 신청 방법", "배민커넥트 후기"])
+        self.engine.update_from_collected()
+        scores = self.engine.rank_sentences(["퀵플렉스 신청 방법", "배민커넥트 수수료 안내"], "수수료")
+        self.assertGreater(scores[1], scores[0])
+        self.assertEqual(scores[0], 0)
+
+    def test_bm25_uses_corpus_average_length(self):
+        write_collected(self.collected_dir, 'a.json', ["퀵플렉스 수수료 안내 정리", "퀵플렉스 신청 방법 정리"])
+        self.engine.update_from_collected()
+        self.assertEqual(self.engine.avg_doc_length, 4)
+
+        # 같은 문장의 점수는 함께 넘긴 문장 묶음과 무관
+        alone, terms = self.engine.bm25_matrix(["퀵플렉스 수수료"])
+        batch, batch_terms = self.engine.bm25_matrix(["퀵플렉스 수수료", "퀵플렉스 수수료 신청 방법 안내 정리 후기 모음"])
+        column = terms.index('수수료')
+        self.assertAlmostEqual(alone[0, column], batch[0, batch_terms.index('수수료')])
+
+        # 길이 2 문서, 평균 길이 4: tf × (k1 + 1) / (tf + k1 × (1 - b + b × 2 / 4)) × idf
+        k1, b = self.engine.k1, self.engine.b
+        expected = (k1 + 1) / (1 + k1 * (1 - b + b * 0.5)) * self.engine.idf(['수수료'])[0]
+        self.assertAlmostEqual(alone[0, column], expected)
+
+    def test_bm25_falls_back_to_batch_average(self):
+        matrix, terms = self.engine.bm25_matrix(["퀵플렉스 수수료", "퀵플렉스 수수료 신청 방법"])
+        self.assertEqual(self.engine.avg_doc_length, 0.0)
+        k1, b = self.engine.k1, self.engine.b
+        expected = (k1 + 1) / (1 + k1 * (1 - b + b * 2 / 3)) * self.engine.idf(['수수료'])[0]
+        self.assertAlmostEqual(matrix[0, terms.index('수수료')], expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,11 @@
 from typing import List, Dict, Any
 from dataclasses import dataclass
+import sys
+import numpy as np
+from scipy import sparse
 from .sentence_classifier import ClassifiedSentence
 
-@dataclass
+@dataclass(slots=True)
 class ExpandedKeyword:
     keyword: str
     related_sentences: Dict[str, List[ClassifiedSentence]]
@@ -21,6 +24,7 @@ class KeywordExpander:
         }
         
         self.total_min_sentences = sum(req['min'] for req in self.section_requirements.values())
+        self.independence_block_size = 2048  # 독립성 점수를 한 번에 계산할 그룹 수
     
     def expand_keywords(self, main_keyword: str, classified_sentences: Dict[str, List[ClassifiedSentence]]) -> List[ExpandedKeyword]:
         # 1. 전체 문장 수에 따른 확장 키워드 수 결정
@@ -31,11 +35,11 @@ class KeywordExpander:
         candidate_groups = self._create_candidate_groups(classified_sentences)
         
         # 3. 키워드 그룹 평가
+        independence_scores = self._calculate_independence(candidate_groups)
         evaluated_groups = []
-        for group in candidate_groups:
+        for group, independence in zip(candidate_groups, independence_scores.tolist()):
             if self._meets_minimum_requirements(group):
                 relevance = self._calculate_relevance(main_keyword, group)
-                independence = self._calculate_independence(group, candidate_groups)
                 quality = self._calculate_quality(group)
                 
                 evaluated_groups.append({
@@ -108,29 +112,44 @@ class KeywordExpander:
         
         return sum(relevance_scores) / len(relevance_scores) if relevance_scores else 0.0
     
-    def _calculate_independence(self, group: Dict[str, List[ClassifiedSentence]], 
-                              all_groups: List[Dict[str, List[ClassifiedSentence]]]) -> float:
-        """다른 그룹과의 독립성 점수 계산"""
-        group_keywords = set()
-        for sentences in group.values():
-            for sentence in sentences:
-                group_keywords.update(sentence.keywords)
+    def _calculate_independence(self, groups: List[Dict[str, List[ClassifiedSentence]]]) -> np.ndarray:
+        """그룹별 다른 그룹과의 독립성 점수 (1 - 키워드 Jaccard 유사도의 평균)
         
-        overlap_scores = []
-        for other_group in all_groups:
-            if other_group == group:
-                continue
-            
-            other_keywords = set()
-            for sentences in other_group.values():
-                for sentence in sentences:
-                    other_keywords.update(sentence.keywords)
-            
-            if other_keywords:
-                overlap = len(group_keywords & other_keywords) / len(group_keywords | other_keywords)
-                overlap_scores.append(1 - overlap)
+        (그룹 × 키워드) 희소 행렬 B에서 교집합 크기는 B·Bᵀ, 합집합 크기는 |A| + |B| - 교집합으로
+        모든 그룹 쌍의 Jaccard 유사도를 한 번에 계산한다. 키워드가 없는 그룹은 비교 대상에서 제외한다.
+        """
+        if not groups:
+            return np.zeros(0, dtype=np.float64)
         
-        return sum(overlap_scores) / len(overlap_scores) if overlap_scores else 1.0
+        vocabulary: Dict[str, int] = {}
+        rows, cols = [], []
+        for group_id, group in enumerate(groups):
+            keywords = {k for sentences in group.values() for sentence in sentences for k in sentence.keywords}
+            for keyword in keywords:
+                rows.append(group_id)
+                cols.append(vocabulary.setdefault(keyword, len(vocabulary)))
+        membership = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)), shape=(len(groups), len(vocabulary))
+        )
+        
+        sizes = np.asarray(membership.sum(axis=1)).ravel()
+        has_keywords = sizes > 0
+        transposed = membership.T.tocsc()
+        scores = np.ones(len(groups), dtype=np.float64)
+        # (그룹 × 그룹) 행렬이 커지지 않도록 행 블록 단위로 계산
+        for start in range(0, len(groups), self.independence_block_size):
+            stop = min(start + self.independence_block_size, len(groups))
+            intersection = (membership[start:stop] @ transposed).toarray()
+            union = sizes[start:stop, np.newaxis] + sizes[np.newaxis, :] - intersection
+            jaccard = np.divide(intersection, union, out=np.zeros(union.shape, dtype=np.float64), where=union > 0)
+            
+            # 자기 자신과 키워드가 없는 그룹은 평균에서 제외
+            compared = np.repeat(has_keywords[np.newaxis, :], stop - start, axis=0)
+            compared[np.arange(stop - start), np.arange(start, stop)] = False
+            counts = compared.sum(axis=1)
+            totals = np.where(compared, 1 - jaccard, 0.0).sum(axis=1)
+            np.divide(totals, counts, out=scores[start:stop], where=counts > 0)
+        return scores
     
     def _calculate_quality(self, group: Dict[str, List[ClassifiedSentence]]) -> float:
         """문장 그룹의 전체 품질 점수 계산"""
@@ -152,34 +171,57 @@ class KeywordExpander:
         return max(keyword_freq.items(), key=lambda x: x[1])[0]
     
     def _create_candidate_groups(self, classified_sentences: Dict[str, List[ClassifiedSentence]]) -> List[Dict[str, List[ClassifiedSentence]]]:
-        """후보 키워드 그룹 생성"""
-        # 임시로 간단한 그룹핑 구현
-        # 실제로는 더 복잡한 클러스터링 알고리즘 사용 필요
+        """후보 키워드 그룹 생성
+        
+        아직 쓰이지 않은 문장을 기준으로, 기준 문장과 공통 키워드가 2개 이상인 미사용 문장을 모아 그룹을 만든다.
+        모든 문장 쌍을 비교하는 대신 키워드 → 문장 번호 역색인에서 기준 문장 키워드의 목록만 모아
+        문장별 공통 키워드 수를 센다. 역색인 목록은 조회할 때마다 이미 쓰인 문장을 걸러내 짧게 유지한다.
+        """
         groups = []
-        used_sentences = set()
+        categories = list(classified_sentences.keys())
         
-        for category, sentences in classified_sentences.items():
-            for sentence in sentences:
-                if sentence in used_sentences:
-                    continue
-                
-                group = {cat: [] for cat in classified_sentences.keys()}
-                group[category].append(sentence)
-                used_sentences.add(sentence)
-                
-                # 관련 문장 찾기
-                for other_cat, other_sentences in classified_sentences.items():
-                    for other_sentence in other_sentences:
-                        if other_sentence in used_sentences:
-                            continue
-                        
-                        # 키워드 유사도로 관련 문장 판단
-                        common_keywords = set(sentence.keywords) & set(other_sentence.keywords)
-                        if len(common_keywords) >= 2:  # 최소 2개 이상의 공통 키워드
-                            group[other_cat].append(other_sentence)
-                            used_sentences.add(other_sentence)
+        # 문장 번호는 카테고리 순서 → 카테고리 내 순서 (기존 순회 순서와 같음)
+        entries = [
+            (category, sentence)
+            for category, sentences in classified_sentences.items()
+            for sentence in sentences
+        ]
+        # 문장별 키워드 집합은 한 번만 생성 (인터닝된 토큰으로 비교)
+        keyword_sets = [frozenset(sys.intern(k) for k in sentence.keywords) for _, sentence in entries]
+        
+        postings_lists: Dict[str, List[int]] = {}
+        for index, keywords in enumerate(keyword_sets):
+            for keyword in keywords:
+                postings_lists.setdefault(keyword, []).append(index)
+        postings = {k: np.asarray(v, dtype=np.int64) for k, v in postings_lists.items()}
+        
+        used = np.zeros(len(entries), dtype=bool)
+        
+        for index, (category, sentence) in enumerate(entries):
+            if used[index]:
+                continue
+            used[index] = True
+            
+            group = {cat: [] for cat in categories}
+            group[category].append(sentence)
+            
+            # 관련 문장 찾기: 기준 문장 키워드의 역색인 목록에서 공통 키워드 수 집계
+            touched = []
+            for keyword in keyword_sets[index]:
+                live = postings[keyword]
+                live = live[~used[live]]
+                postings[keyword] = live
+                touched.append(live)
+            if touched:
+                candidates, common = np.unique(np.concatenate(touched), return_counts=True)
+                members = candidates[common >= 2]  # 최소 2개 이상의 공통 키워드
                 
-                if self._meets_minimum_requirements(group):
-                    groups.append(group)
+                used[members] = True
+                for member in members.tolist():
+                    other_category, other_sentence = entries[member]
+                    group[other_category].append(other_sentence)
+            
+            if self._meets_minimum_requirements(group):
+                groups.append(group)
         
         return groups
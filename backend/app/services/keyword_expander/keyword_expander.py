@@ -1,11 +1,13 @@
 from typing import Dict, List, Any
 from collections import defaultdict
 from dataclasses import dataclass
+import numpy as np
+from scipy import sparse
 from ..sentence_analyzer.sentence_analyzer import AnalyzedSentence
 from ..content_context.content_context import ContentContext
 from ..sentence_connector.sentence_connector import SentenceConnector
 
-@dataclass
+@dataclass(slots=True)
 class KeywordCluster:
     """키워드 클러스터 정보"""
     main_keyword: str
@@ -15,7 +17,7 @@ class KeywordCluster:
     sentence_count: Dict[str, int]  # 문장 유형별 개수
     connected_sentences: List[Dict[str, Any]]  # 서비스 연결된 문장들
 
-@dataclass
+@dataclass(slots=True)
 class ExpandedKeyword:
     """확장 키워드 정보"""
     keyword: str
@@ -29,6 +31,8 @@ class KeywordExpander:
     def __init__(self, content_context: ContentContext):
         self.min_cluster_size = 8  # 최소 필요 문장 수
         self.min_relevance_score = 0.7  # 메인 키워드와의 최소 연관성 점수
+        self.related_overlap_threshold = 0.3  # 연관 키워드로 볼 문장 중복도
+        self.cooccurrence_block_size = 4096  # 공유 문장 수를 한 번에 계산할 키워드 수
         self.content_context = content_context
         self.sentence_connector = SentenceConnector(content_context)
         
@@ -62,24 +66,33 @@ class KeywordExpander:
         
     def _cluster_sentences(self, 
                          analyzed_sentences: List[AnalyzedSentence]) -> List[KeywordCluster]:
-        """문장들을 키워드 기반으로 클러스터링"""
+        """문장들을 키워드 기반으로 클러스터링
+        
+        키워드 × 문장 텍스트 희소 행렬 A로 키워드 쌍의 공유 문장 수(A·Aᵀ)를 한 번에 계산하고,
+        공유 문장 수 / 기준 키워드의 문장 수 > related_overlap_threshold인 키워드를 연관 키워드로 묶는다.
+        """
         # 키워드별 문장 그룹화
         keyword_groups = defaultdict(list)
         for sentence in analyzed_sentences:
             for keyword in sentence.keywords:
                 keyword_groups[keyword].append(sentence)
         
+        keywords = list(keyword_groups)
+        related_ids = self._related_keyword_ids(keyword_groups)
+        
         # 클러스터 생성
         clusters = []
-        processed_keywords = set()
+        processed = np.zeros(len(keywords), dtype=bool)
         
-        for keyword, sentences in keyword_groups.items():
-            if keyword in processed_keywords:
+        for keyword_id, keyword in enumerate(keywords):
+            if processed[keyword_id]:
                 continue
                 
-            # 연관 키워드 찾기
-            related_keywords = self._find_related_keywords(keyword, keyword_groups)
-            processed_keywords.update(related_keywords)
+            # 연관 키워드 (자기 자신 포함)
+            related = related_ids[keyword_id]
+            processed[related] = True
+            
+            sentences = keyword_groups[keyword]
             
             # 문장 유형별 개수 계산
             sentence_count = self._count_sentence_types(sentences)
@@ -87,7 +100,7 @@ class KeywordExpander:
             # 클러스터 생성
             cluster = KeywordCluster(
                 main_keyword=keyword,
-                related_keywords=list(related_keywords),
+                related_keywords=[keywords[i] for i in related],
                 sentences=sentences,
                 relevance_score=0.0,  # 초기값, 나중에 계산
                 sentence_count=sentence_count,
@@ -98,9 +111,49 @@ class KeywordExpander:
         
         return clusters
     
+    def _related_keyword_ids(self, keyword_groups: Dict[str, List[AnalyzedSentence]]) -> List[np.ndarray]:
+        """키워드별 연관 키워드 번호 배열 (keyword_groups 순서 기준)"""
+        incidence = self._keyword_incidence(keyword_groups)
+        sizes = np.asarray(incidence.sum(axis=1)).ravel()
+        transposed = incidence.T.tocsc()
+        
+        related_ids = []
+        # 공유 문장 수 행렬이 커지지 않도록 키워드 블록 단위로 계산
+        for start in range(0, incidence.shape[0], self.cooccurrence_block_size):
+            block = (incidence[start:start + self.cooccurrence_block_size] @ transposed).tocsr()
+            block_sizes = sizes[start:start + self.cooccurrence_block_size]
+            rows = np.repeat(np.arange(block.shape[0]), np.diff(block.indptr))
+            keep = block.data / block_sizes[rows] > self.related_overlap_threshold
+            related = sparse.csr_matrix(
+                (np.ones(int(keep.sum()), dtype=bool), (rows[keep], block.indices[keep])), shape=block.shape
+            )
+            related.sort_indices()
+            related_ids.extend(
+                related.indices[related.indptr[i]:related.indptr[i + 1]] for i in range(related.shape[0])
+            )
+        return related_ids
+    
+    @staticmethod
+    def _keyword_incidence(keyword_groups: Dict[str, List[AnalyzedSentence]]) -> sparse.csr_matrix:
+        """(키워드 × 고유 문장 텍스트) 0/1 희소 행렬"""
+        text_ids: Dict[str, int] = {}
+        rows, cols = [], []
+        for keyword_id, sentences in enumerate(keyword_groups.values()):
+            for sentence in sentences:
+                rows.append(keyword_id)
+                cols.append(text_ids.setdefault(sentence.text, len(text_ids)))
+        
+        incidence = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(len(keyword_groups), len(text_ids))
+        )
+        # 같은 (키워드, 문장) 쌍이 여러 번 나와도 1로 계산
+        incidence.data[:] = 1
+        return incidence
+    
     def _find_related_keywords(self, keyword: str, 
                              keyword_groups: Dict[str, List[AnalyzedSentence]]) -> set:
-        """주어진 키워드와 연관된 키워드 찾기"""
+        """주어진 키워드와 연관된 키워드 찾기 (단일 키워드용, 클러스터링은 _related_keyword_ids 사용)"""
         related = {keyword}
         base_sentences = set(s.text for s in keyword_groups[keyword])
         
@@ -110,7 +163,7 @@ class KeywordExpander:
                 
             other_texts = set(s.text for s in other_sentences)
             # 문장 중복도가 높은 키워드를 연관 키워드로 판단
-            if len(base_sentences & other_texts) / len(base_sentences) > 0.3:
+            if len(base_sentences & other_texts) / len(base_sentences) > self.related_overlap_threshold:
                 related.add(other_keyword)
                 
         return related
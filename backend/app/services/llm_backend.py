@@ -0,0 +1,221 @@
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+from abc import ABC, abstractmethod
+import json
+import logging
+import os
+import threading
+from openai import OpenAI
+from .generation_profiles import GenerationProfile
+
+logger = logging.getLogger(__name__)
+
+class CompletionBackend(ABC):
+    """LMStudioClient가 사용하는 텍스트 생성 백엔드 인터페이스"""
+
+    model_id = "local-model"  # 캐시 키에 사용하는 모델 식별자
+
+    @abstractmethod
+    def complete(self, prompt: str, profile: GenerationProfile) -> str:
+        """프롬프트 하나를 생성 (실패 시 빈 문자열)"""
+
+    def complete_batch(self, prompts: List[str], profile: GenerationProfile) -> List[str]:
+        """여러 프롬프트를 한 번에 생성 (기본 구현은 순차 호출)"""
+        return [self.complete(prompt, profile) for prompt in prompts]
+
+    def stream(self, prompt: str, profile: GenerationProfile) -> Iterator[str]:
+        """생성되는 텍스트 조각을 순서대로 반환 (기본 구현은 전체 결과를 한 번에 반환)"""
+        text = self.complete(prompt, profile)
+        if text:
+            yield text
+
+class OpenAICompatibleBackend(CompletionBackend):
+    """OpenAI 호환 HTTP 서버(LM Studio 등) 백엔드"""
+
+    def __init__(self, base_url: str = "http://localhost:1234/v1", model: str = "local-model"):
+        self.base_url = base_url
+        self.model_id = model
+        self.client = OpenAI(base_url=base_url, api_key="not-needed")
+
+    def complete(self, prompt: str, profile: GenerationProfile) -> str:
+        try:
+            completion = self.client.completions.create(
+                model=self.model_id,
+                prompt=prompt,
+                stream=False,
+                **profile.request_params()
+            )
+            logger.debug(f"Raw response: {completion}")
+
+            if not completion or not getattr(completion, 'choices', None):
+                logger.warning("Received empty response from LM Studio")
+                return ""
+
+            text = completion.choices[0].text
+            if not text:
+                logger.warning("Choice has no text")
+                return ""
+
+            return text.strip()
+
+        except Exception as e:
+            logger.exception(f"Error generating response: {e}")
+            return ""
+
+    def complete_batch(self, prompts: List[str], profile: GenerationProfile) -> List[str]:
+        """프롬프트 목록을 한 번의 completions 요청으로 전송 (choice.index로 결과 매칭)"""
+        if not prompts:
+            return []
+        try:
+            completion = self.client.completions.create(
+                model=self.model_id,
+                prompt=prompts,
+                stream=False,
+                **profile.request_params()
+            )
+        except Exception as e:
+            logger.error(f"Error generating batch response: {e}")
+            return [""] * len(prompts)
+
+        results = [""] * len(prompts)
+        for choice in getattr(completion, 'choices', None) or []:
+            if 0 <= choice.index < len(prompts) and choice.text:
+                results[choice.index] = choice.text.strip()
+        return results
+
+    def stream(self, prompt: str, profile: GenerationProfile) -> Iterator[str]:
+        try:
+            chunks = self.client.completions.create(
+                model=self.model_id,
+                prompt=prompt,
+                stream=True,
+                **profile.request_params()
+            )
+            for chunk in chunks:
+                if chunk.choices and chunk.choices[0].text:
+                    yield chunk.choices[0].text
+        except Exception as e:
+            logger.error(f"Error streaming response: {e}")
+
+# 프로세스당 한 번만 GGUF 모델을 로드하기 위한 캐시 (설정 → (모델, 모델 컨텍스트 락))
+_LLAMA_MODELS: Dict[Tuple, Tuple[Any, threading.Lock]] = {}
+_LLAMA_MODELS_LOCK = threading.Lock()
+
+# 접두사 KV 캐시 기본 크기 (256MiB)
+DEFAULT_PREFIX_CACHE_BYTES = 256 << 20
+
+def load_llama_model(model_path: str, n_ctx: int = 4096, n_threads: Optional[int] = None,
+                     n_batch: int = 512, n_gpu_layers: int = 0,
+                     prefix_cache_bytes: int = DEFAULT_PREFIX_CACHE_BYTES) -> Tuple[Any, threading.Lock]:
+    """GGUF 모델과 그 모델 전용 락 반환 (같은 설정이면 프로세스 내에서 재사용)
+
+    모델 컨텍스트는 하나이므로 같은 모델을 쓰는 모든 백엔드는 반환된 락으로 생성 호출을 직렬화해야 한다.
+    prefix_cache_bytes > 0이면 LlamaRAMCache를 붙여 공통 프롬프트 접두사의
+    KV 상태를 저장해 두고, 다음 요청에서 가장 긴 접두사부터 이어서 평가한다.
+    """
+    n_threads = n_threads or os.cpu_count() or 1
+    key = (os.path.abspath(model_path), n_ctx, n_threads, n_batch, n_gpu_layers)
+    with _LLAMA_MODELS_LOCK:
+        entry = _LLAMA_MODELS.get(key)
+        if entry is None:
+            from llama_cpp import Llama, LlamaRAMCache  # 임베디드 백엔드를 쓸 때만 필요
+
+            model = Llama(
+                model_path=model_path,
+                n_ctx=n_ctx,
+                n_threads=n_threads,
+                n_batch=n_batch,
+                n_gpu_layers=n_gpu_layers,
+                verbose=False
+            )
+            if prefix_cache_bytes > 0:
+                model.set_cache(LlamaRAMCache(capacity_bytes=prefix_cache_bytes))
+            entry = (model, threading.Lock())
+            _LLAMA_MODELS[key] = entry
+        return entry
+
+class LlamaCppBackend(CompletionBackend):
+    """llama-cpp-python으로 GGUF 모델을 프로세스 안에서 직접 실행하는 백엔드
+
+    - 모델은 load_llama_model()로 프로세스당 한 번만 로드
+    - 모델 컨텍스트는 하나이므로 생성 호출은 모델과 함께 공유되는 락으로 직렬화
+      (같은 모델을 쓰는 다른 백엔드 인스턴스와도 동시에 실행되지 않음)
+    - complete_batch는 프롬프트를 정렬해 공통 접두사가 긴 것끼리 연속으로 평가하므로
+      섹션 프롬프트처럼 지시문 헤더가 같은 요청은 KV 캐시를 재사용한다
+    - JSON 스키마가 있는 프로필은 GBNF 문법으로 변환해 출력 구조를 강제
+    """
+
+    def __init__(self, model_path: str, n_ctx: int = 4096, n_threads: Optional[int] = None,
+                 n_batch: int = 512, n_gpu_layers: int = 0,
+                 prefix_cache_bytes: int = DEFAULT_PREFIX_CACHE_BYTES, llm: Any = None):
+        self.model_path = model_path
+        self.model_id = os.path.basename(model_path)
+        self.n_ctx = n_ctx
+        self.n_threads = n_threads or os.cpu_count() or 1
+        if llm is not None:
+            # 이미 로드된 모델 (또는 create_completion을 가진 객체)을 그대로 사용
+            self.llm, self._lock = llm, threading.Lock()
+        else:
+            self.llm, self._lock = load_llama_model(model_path, n_ctx=n_ctx, n_threads=self.n_threads,
+                                                    n_batch=n_batch, n_gpu_layers=n_gpu_layers,
+                                                    prefix_cache_bytes=prefix_cache_bytes)
+        self._grammars: Dict[str, Any] = {}
+
+    def complete(self, prompt: str, profile: GenerationProfile) -> str:
+        try:
+            with self._lock:
+                result = self.llm.create_completion(prompt, **self._completion_params(profile))
+        except Exception as e:
+            logger.error(f"Error generating response: {e}")
+            return ""
+
+        choices = result.get('choices') or []
+        text = choices[0].get('text') if choices else None
+        return text.strip() if text else ""
+
+    def stream(self, prompt: str, profile: GenerationProfile) -> Iterator[str]:
+        # 스트림이 끝날 때까지 모델 컨텍스트를 점유하며, 소비자가 중간에 close()하면
+        # (SSE 클라이언트 연결 종료 등) finally에서 바로 락을 반환
+        self._lock.acquire()
+        chunks = None
+        try:
+            chunks = self.llm.create_completion(prompt, stream=True, **self._completion_params(profile))
+            for chunk in chunks:
+                text = chunk['choices'][0].get('text') if chunk.get('choices') else None
+                if text:
+                    yield text
+        except Exception as e:
+            logger.error(f"Error streaming response: {e}")
+        finally:
+            if chunks is not None and hasattr(chunks, 'close'):
+                chunks.close()
+            self._lock.release()
+
+    def complete_batch(self, prompts: List[str], profile: GenerationProfile) -> List[str]:
+        # 같은 접두사를 가진 프롬프트가 이어지도록 정렬 후 평가하고 원래 순서로 반환
+        order = sorted(range(len(prompts)), key=lambda i: prompts[i])
+        results = [""] * len(prompts)
+        for i in order:
+            results[i] = self.complete(prompts[i], profile)
+        return results
+
+    def _completion_params(self, profile: GenerationProfile) -> Dict[str, Any]:
+        params: Dict[str, Any] = {
+            'max_tokens': profile.max_tokens,
+            'temperature': profile.temperature
+        }
+        if profile.stop:
+            params['stop'] = profile.stop
+        if profile.json_schema is not None:
+            params['grammar'] = self._grammar(profile.json_schema)
+        return params
+
+    def _grammar(self, schema: Dict[str, Any]) -> Any:
+        """JSON 스키마 → LlamaGrammar (스키마별로 한 번만 변환)"""
+        key = json.dumps(schema, sort_keys=True)
+        grammar = self._grammars.get(key)
+        if grammar is None:
+            from llama_cpp import LlamaGrammar
+
+            grammar = LlamaGrammar.from_json_schema(key, verbose=False)
+            self._grammars[key] = grammar
+        return grammar
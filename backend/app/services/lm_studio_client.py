@@ -1,122 +1,339 @@
-from typing import Dict, Any, Optional
-from openai import OpenAI
+from typing import Callable, Dict, List, Any, Optional, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from .completion_cache import CompletionCache
+from .llm_backend import CompletionBackend, OpenAICompatibleBackend
+from .generation_profiles import GenerationProfile, get_profile
+from .prompt_builder import PromptBuilder, PromptBuildResult, estimate_tokens
+from .semantic_cache import SemanticCache
+from .micro_batcher import MicroBatcher
+from .vector_index import VectorIndex
+
+TITLE_PROMPT = """
+    다음 정보를 바탕으로 SEO 최적화된 블로그 제목을 생성해주세요:
+    - 이모지 1-2개 사용
+    - 핵심 키워드를 앞부분에 배치
+    - 구체적인 수치나 혜택 포함
+    - 전체 길이 30-45자 유지
+    
+    정보:
+    {facts}
+    
+    제목 형식:
+    [핵심 키워드] [구체적 수치/혜택] - [추가 정보]
+    """
+
+SECTION_PROMPTS = {
+    "intro": """
+    다음 정보를 바탕으로 블로그 도입부를 작성해주세요:
+    - 첫 3줄이 검색결과에 노출됨을 고려
+    - 핵심 메시지를 먼저 전달
+    - 신뢰성 있는 데이터나 통계 포함
+    - 독자의 관심을 유도하는 문구
+    - 자연스러운 키워드 포함 (2-3회)
+    
+    정보:
+    {facts}
+    """,
+    
+    "main": """
+    다음 정보를 바탕으로 블로그 본문을 작성해주세요:
+    - 섹션별로 이모지로 구분
+    - 각 섹션은 4줄 이내로 작성
+    - 내부/외부 링크 자연스럽게 포함
+    - 리스트나 표 형식 활용
+    - 구체적인 데이터와 예시 포함
+    
+    정보:
+    {facts}
+    """,
+    
+    "qa": """
+    다음 정보를 바탕으로 자주 묻는 질문 섹션을 작성해주세요:
+    - 실제 사용자들이 자주 묻는 질문 5-7개
+    - 각 답변은 100-200자 내외
+    - 질문에 핵심 키워드 포함
+    - 답변은 구체적이고 실용적으로
+    
+    정보:
+    {facts}
+    """,
+    
+    "conclusion": """
+    다음 정보를 바탕으로 블로그 결론을 작성해주세요:
+    - 핵심 내용 요약
+    - 구체적인 행동 유도 문구
+    - 연락처나 신청 방법 안내
+    - 자연스러운 키워드 마무리
+    
+    정보:
+    {facts}
+    """
+}
+
+POST_SECTIONS = ("intro", "main", "qa", "conclusion")
 
 class LMStudioClient:
-    def __init__(self, base_url="http://localhost:1234/v1"):  # /v1 추가
+    def __init__(self, base_url="http://localhost:1234/v1", context_length: int = 4096,
+                 model: str = "local-model", cache: Optional[CompletionCache] = None,
+                 backend: Optional[CompletionBackend] = None, max_concurrency: int = 4,
+                 prompt_builder: Optional[PromptBuilder] = None,
+                 semantic_cache: Optional[SemanticCache] = None,
+                 micro_batcher: Optional[MicroBatcher] = None,
+                 vector_index: Optional[VectorIndex] = None, retrieval_top_k: int = 20):  # /v1 추가
         self.base_url = base_url
-        self.client = OpenAI(base_url=base_url, api_key="not-needed")
+        self.context_length = context_length  # 모델 컨텍스트 크기 (배치 크기 결정에 사용)
+        self.max_concurrency = max_concurrency  # 동시에 보낼 수 있는 요청 수 (서버 병렬 슬롯 수)
+        self.cache = cache  # 프롬프트 → 응답 영구 캐시 (없으면 사용 안 함)
+        # 생성 백엔드 (기본: LM Studio HTTP 서버, LlamaCppBackend로 프로세스 내 실행 가능)
+        self.backend = backend or OpenAICompatibleBackend(base_url=base_url, model=model)
+        self.model = self.backend.model_id
+        # facts를 섹션별 토큰 예산에 맞게 골라 프롬프트에 넣음
+        self.prompt_builder = prompt_builder or PromptBuilder()
+        # 사실 집합이 비슷한 이전 섹션 생성 결과를 재사용 (없으면 사용 안 함)
+        self.semantic_cache = semantic_cache
+        # 동시 호출자의 프롬프트를 모아 다중 프롬프트 요청으로 전송 (없으면 요청마다 단건 전송)
+        self.micro_batcher = micro_batcher
+        # 섹션별로 사실 인덱스에서 관련 문장을 검색해 facts에 더함 (없으면 사용 안 함)
+        self.vector_index = vector_index
+        self.retrieval_top_k = retrieval_top_k
         
     def generate_title(self, facts: Dict[str, Any]) -> str:
-        prompt = """
-        다음 정보를 바탕으로 SEO 최적화된 블로그 제목을 생성해주세요:
-        - 이모지 1-2개 사용
-        - 핵심 키워드를 앞부분에 배치
-        - 구체적인 수치나 혜택 포함
-        - 전체 길이 30-45자 유지
-        
-        정보:
-        {facts}
-        
-        제목 형식:
-        [핵심 키워드] [구체적 수치/혜택] - [추가 정보]
-        """
-        
-        response = self._generate_response(prompt.format(facts=facts))
+        response = self._generate_response(self.build_title_prompt(facts), profile='title')
         return response.strip()
 
     def write_blog_section(self, facts: Dict[str, Any], section_type: str) -> Optional[str]:
-        section_prompts = {
-            "intro": """
-            다음 정보를 바탕으로 블로그 도입부를 작성해주세요:
-            - 첫 3줄이 검색결과에 노출됨을 고려
-            - 핵심 메시지를 먼저 전달
-            - 신뢰성 있는 데이터나 통계 포함
-            - 독자의 관심을 유도하는 문구
-            - 자연스러운 키워드 포함 (2-3회)
-            
-            정보:
-            {facts}
-            """,
-            
-            "main": """
-            다음 정보를 바탕으로 블로그 본문을 작성해주세요:
-            - 섹션별로 이모지로 구분
-            - 각 섹션은 4줄 이내로 작성
-            - 내부/외부 링크 자연스럽게 포함
-            - 리스트나 표 형식 활용
-            - 구체적인 데이터와 예시 포함
-            
-            정보:
-            {facts}
-            """,
-            
-            "qa": """
-            다음 정보를 바탕으로 자주 묻는 질문 섹션을 작성해주세요:
-            - 실제 사용자들이 자주 묻는 질문 5-7개
-            - 각 답변은 100-200자 내외
-            - 질문에 핵심 키워드 포함
-            - 답변은 구체적이고 실용적으로
-            
-            정보:
-            {facts}
-            """,
-            
-            "conclusion": """
-            다음 정보를 바탕으로 블로그 결론을 작성해주세요:
-            - 핵심 내용 요약
-            - 구체적인 행동 유도 문구
-            - 연락처나 신청 방법 안내
-            - 자연스러운 키워드 마무리
+        built = self._build_section(facts, section_type)
+        if built is None:
+            return None
+        
+        cached = self._semantic_lookup(section_type, built)
+        if cached is not None:
+            return cached
             
-            정보:
-            {facts}
-            """
-        }
+        response = self._generate_response(built.prompt, profile='section').strip()
+        self._semantic_store(section_type, built, response)
+        return response
+
+    def generate_post_sections(self, facts: Dict[str, Any], sections: Sequence[str] = POST_SECTIONS,
+                               include_title: bool = False) -> Dict[str, Any]:
+        """섹션 프롬프트(및 제목)를 동시에 요청하고 섹션 순서대로 결과 반환
         
-        if section_type not in section_prompts:
+        각 섹션은 facts만 필요하므로 서로 독립적이며, 최대 max_concurrency개까지 동시에 요청한다.
+        반환: {'title': 제목 또는 None, 'sections': {섹션명: 본문 또는 None}}
+        """
+        with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as executor:
+            title_future = executor.submit(self.generate_title, facts) if include_title else None
+            section_futures = [
+                (section_type, executor.submit(self.write_blog_section, facts, section_type))
+                for section_type in sections
+            ]
+            return {
+                'title': title_future.result() if title_future else None,
+                'sections': {section_type: future.result() for section_type, future in section_futures}
+            }
+
+    def stream_blog_post(self, facts: Dict[str, Any], sections: Sequence[str] = POST_SECTIONS,
+                         include_title: bool = True) -> Iterator[Dict[str, Any]]:
+        """제목/섹션을 순서대로 스트리밍 생성하며 이벤트를 반환
+        
+        이벤트 형식:
+        - {'event': 'section_start', 'section': 이름}
+        - {'event': 'token', 'section': 이름, 'text': 텍스트 조각}
+        - {'event': 'section_end', 'section': 이름, 'content': 전체 텍스트}
+        - {'event': 'done', 'title': 제목, 'sections': {이름: 전체 텍스트}}
+        """
+        parts = [('title', self.build_title_prompt(facts), None)] if include_title else []
+        for section_type in sections:
+            built = self._build_section(facts, section_type)
+            if built is not None:
+                parts.append((section_type, built.prompt, built))
+        
+        results: Dict[str, str] = {}
+        for name, prompt, built in parts:
+            yield {'event': 'section_start', 'section': name}
+            cached = self._semantic_lookup(name, built) if built is not None else None
+            if cached is not None:
+                results[name] = cached
+                yield {'event': 'token', 'section': name, 'text': cached}
+            else:
+                chunks = []
+                stream = self.stream_response(prompt, profile='title' if built is None else 'section')
+                try:
+                    for text in stream:
+                        chunks.append(text)
+                        yield {'event': 'token', 'section': name, 'text': text}
+                finally:
+                    stream.close()
+                results[name] = ''.join(chunks).strip()
+                if built is not None:
+                    self._semantic_store(name, built, results[name])
+            yield {'event': 'section_end', 'section': name, 'content': results[name]}
+        
+        yield {
+            'event': 'done',
+            'title': results.pop('title', None),
+            'sections': results
+        }
+
+    def build_title_prompt(self, facts: Dict[str, Any]) -> str:
+        return self.prompt_builder.build(TITLE_PROMPT, facts, 'title').prompt
+
+    def build_section_prompt(self, facts: Dict[str, Any], section_type: str) -> Optional[str]:
+        built = self._build_section(facts, section_type)
+        return built.prompt if built is not None else None
+
+    def _build_section(self, facts: Dict[str, Any], section_type: str) -> Optional[PromptBuildResult]:
+        if section_type not in SECTION_PROMPTS:
             return None
-            
-        prompt = section_prompts[section_type]
-        response = self._generate_response(prompt.format(facts=facts))
-        return response.strip()
+        return self.prompt_builder.build(SECTION_PROMPTS[section_type], self._retrieve(facts, section_type), section_type)
+
+    def _retrieve(self, facts: Dict[str, Any], section_type: str) -> Dict[str, Any]:
+        """벡터 인덱스에서 섹션에 맞는 사실을 검색해 facts에 추가"""
+        if self.vector_index is None or not isinstance(facts, dict):
+            return facts
+        keyword = facts.get('keyword') or facts.get('main_keyword')
+        if not keyword:
+            return facts
+        hits = self.vector_index.query_section(keyword, section_type, top_k=self.retrieval_top_k)
+        if not hits:
+            return facts
+        return {**facts, 'retrieved': [hit.to_fact() for hit in hits]}
+
+    def _semantic_lookup(self, section_type: str, built: PromptBuildResult) -> Optional[str]:
+        if self.semantic_cache is None or not built.facts:
+            return None
+        return self.semantic_cache.lookup(section_type, built.facts_text, built.keyword)
 
-    def _generate_response(self, prompt: str) -> str:
+    def _semantic_store(self, section_type: str, built: PromptBuildResult, response: str) -> None:
+        if self.semantic_cache is not None and built.facts and response:
+            self.semantic_cache.store(section_type, built.facts_text, response, built.keyword)
+
+    def _generate_response(self, prompt: str, max_tokens: Optional[int] = None,
+                           temperature: Optional[float] = None, use_cache: Optional[bool] = None,
+                           profile: Any = 'default',
+                           validate: Optional[Callable[[str], bool]] = None) -> str:
+        """응답 생성
+        
+        profile(classify, analyze, title, section ...)의 설정을 기본으로 하고
+        max_tokens/temperature를 넘기면 해당 값만 덮어쓴다.
+        use_cache가 None이면 temperature가 0인 결정적 호출만 캐시를 사용하고,
+        False면 캐시를 우회한다 (샘플링 결과가 달라야 하는 창작 호출).
+        validate를 넘기면 통과한 응답만 캐시에 저장하고, 통과하지 못한 캐시 항목은 무시한다.
+        """
+        profile = self._resolve_profile(profile, max_tokens, temperature)
+        if use_cache is None:
+            use_cache = profile.temperature == 0
+        params = profile.cache_params()
+        
+        if use_cache:
+            cached = self._cache_get(prompt, params, validate)
+            if cached is not None:
+                return cached
+        
+        text = self._request_completion(prompt, profile)
+        
+        if use_cache:
+            self._cache_put(prompt, params, text, validate)
+        return text
+    
+    def stream_response(self, prompt: str, max_tokens: Optional[int] = None,
+                        temperature: Optional[float] = None, use_cache: Optional[bool] = None,
+                        profile: Any = 'default',
+                        validate: Optional[Callable[[str], bool]] = None) -> Iterator[str]:
+        """생성되는 텍스트 조각을 바로 반환 (캐시 규칙은 _generate_response와 동일)
+        
+        캐시에 있으면 저장된 응답을 한 번에 반환하고,
+        없으면 스트림이 끝난 뒤 전체 응답을 캐시에 저장한다.
+        """
+        profile = self._resolve_profile(profile, max_tokens, temperature)
+        if use_cache is None:
+            use_cache = profile.temperature == 0
+        params = profile.cache_params()
+        
+        if use_cache:
+            cached = self._cache_get(prompt, params, validate)
+            if cached is not None:
+                yield cached
+                return
+        
+        chunks = []
+        stream = self.backend.stream(prompt, profile)
         try:
-            completion = self.client.completions.create(
-                model="local-model",
-                prompt=prompt,
-                temperature=0.7,
-                max_tokens=2000,
-                stream=False
-            )
-            
-            # 응답 디버깅
-            print("Raw response:", completion)
-            
-            if completion is None:
-                print("Warning: Received None response from LM Studio")
-                return ""
-                
-            if not hasattr(completion, 'choices'):
-                print("Warning: Response has no 'choices' attribute")
-                return ""
-                
-            if not completion.choices:
-                print("Warning: Response has empty choices")
-                return ""
-                
-            text = completion.choices[0].text
-            if not text:
-                print("Warning: Choice has no text")
-                return ""
-                
-            return text.strip()
-                
-        except Exception as e:
-            print(f"Error generating response: {e}")
-            import traceback
-            print("Traceback:", traceback.format_exc())
-            return ""
+            for text in stream:
+                if not chunks:
+                    # 응답 앞쪽의 빈 줄/공백은 건너뜀
+                    text = text.lstrip()
+                    if not text:
+                        continue
+                if profile.first_line and '\n' in text:
+                    # 첫 줄이 끝나면 스트림을 닫아 나머지 생성을 중단
+                    text = text.split('\n', 1)[0]
+                    if text:
+                        chunks.append(text)
+                        yield text
+                    break
+                chunks.append(text)
+                yield text
+        finally:
+            # 소비자가 중간에 닫으면 백엔드 스트림도 바로 닫아 모델 점유를 해제
+            stream.close()
+        
+        if use_cache:
+            self._cache_put(prompt, params, ''.join(chunks).strip(), validate)
+    
+    def generate_batch(self, prompts: List[str], max_tokens: Optional[int] = None,
+                       temperature: Optional[float] = None, use_cache: Optional[bool] = None,
+                       profile: Any = 'default',
+                       validate: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """여러 프롬프트를 백엔드 배치 호출로 생성 (캐시 규칙은 _generate_response와 동일)"""
+        profile = self._resolve_profile(profile, max_tokens, temperature)
+        if use_cache is None:
+            use_cache = profile.temperature == 0
+        params = profile.cache_params()
+        
+        results: List[Optional[str]] = [None] * len(prompts)
+        if use_cache:
+            for i, prompt in enumerate(prompts):
+                results[i] = self._cache_get(prompt, params, validate)
+        
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            texts = self.backend.complete_batch([prompts[i] for i in pending], profile)
+            for i, text in zip(pending, texts):
+                text = profile.finish(text)
+                results[i] = text
+                if use_cache:
+                    self._cache_put(prompts[i], params, text, validate)
+        return results
+    
+    def _cache_get(self, prompt: str, params: Dict[str, Any],
+                   validate: Optional[Callable[[str], bool]]) -> Optional[str]:
+        """캐시 조회 (검증에 실패한 항목은 제거하고 없는 것으로 처리)"""
+        if self.cache is None:
+            return None
+        cached = self.cache.get(self.model, prompt, params)
+        if cached is not None and validate is not None and not validate(cached):
+            self.cache.invalidate(self.model, prompt, params)
+            return None
+        return cached
+    
+    def _cache_put(self, prompt: str, params: Dict[str, Any], text: str,
+                   validate: Optional[Callable[[str], bool]]) -> None:
+        """비어 있지 않고 검증을 통과한 응답만 캐시에 저장"""
+        if self.cache is None or not text:
+            return
+        if validate is not None and not validate(text):
+            return
+        self.cache.put(self.model, prompt, params, text)
+    
+    def _resolve_profile(self, profile: Any, max_tokens: Optional[int],
+                         temperature: Optional[float]) -> GenerationProfile:
+        return get_profile(profile).with_overrides(max_tokens=max_tokens, temperature=temperature)
+    
+    def _request_completion(self, prompt: str, profile: GenerationProfile) -> str:
+        if self.micro_batcher is not None:
+            return profile.finish(self.micro_batcher.complete(prompt, profile))
+        return profile.finish(self.backend.complete(prompt, profile))
             
 # 테스트 코드
 if __name__ == "__main__":
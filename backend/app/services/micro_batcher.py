@@ -0,0 +1,156 @@
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import json
+import logging
+import queue
+import threading
+import time
+from .generation_profiles import GenerationProfile
+from .llm_backend import CompletionBackend
+
+logger = logging.getLogger(__name__)
+
+class MicroBatcher:
+    """여러 호출자의 프롬프트를 잠깐 모아 한 번의 다중 프롬프트 요청으로 보내는 클래스
+
+    첫 요청이 들어온 뒤 max_wait_ms 동안(또는 max_batch_size개가 찰 때까지) 요청을 모으고,
+    같은 생성 프로필끼리 묶어 backend.complete_batch()로 보낸다.
+    배치 요청은 스레드 풀에서 최대 max_concurrent_batches개까지 동시에 보내므로
+    요청을 모으는 동안이나 앞 배치가 처리되는 동안 다른 배치가 기다리지 않는다.
+    결과는 각 호출자의 Future로 돌려주며, 결과를 받지 못한 Future는 예외로 끝낸다.
+    """
+
+    def __init__(self, backend: CompletionBackend, max_batch_size: int = 16, max_wait_ms: float = 5.0,
+                 max_concurrent_batches: int = 4):
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_concurrent_batches = max_concurrent_batches
+
+        self._queue: 'queue.Queue[Optional[Tuple[str, GenerationProfile, Future, float]]]' = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._closed = False
+
+        self.batches = 0
+        self.requests = 0
+        self.max_observed_batch = 0
+        self.total_batch_latency = 0.0  # 배치 요청 처리 시간 합계 (초)
+        self.total_queue_wait = 0.0     # 요청이 배치로 묶이기까지 기다린 시간 합계 (초)
+
+    def submit(self, prompt: str, profile: GenerationProfile) -> Future:
+        """프롬프트 등록, 생성 결과를 받을 Future 반환"""
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed")
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((prompt, profile, future, time.monotonic()))
+        return future
+
+    def complete(self, prompt: str, profile: GenerationProfile) -> str:
+        """프롬프트를 배치에 넣고 결과를 기다림"""
+        return self.submit(prompt, profile).result()
+
+    def close(self) -> None:
+        """남은 요청을 처리한 뒤 작업 스레드 종료"""
+        self._closed = True
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """배치 크기/지연 통계"""
+        with self._stats_lock:
+            return {
+                'batches': self.batches,
+                'requests': self.requests,
+                'avg_batch_size': self.requests / self.batches if self.batches else 0.0,
+                'max_batch_size': self.max_observed_batch,
+                'avg_batch_latency_ms': 1000 * self.total_batch_latency / self.batches if self.batches else 0.0,
+                'avg_queue_wait_ms': 1000 * self.total_queue_wait / self.requests if self.requests else 0.0
+            }
+
+    def _ensure_worker(self) -> None:
+        with self._start_lock:
+            if self._worker is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_batches, thread_name_prefix='micro-batch'
+                )
+                self._worker = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            pending = [item]
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while len(pending) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                pending.append(item)
+
+            self._dispatch(pending)
+            if stop:
+                return
+
+    def _dispatch(self, pending: List[Tuple[str, GenerationProfile, Future, float]]) -> None:
+        """같은 프로필끼리 묶어 스레드 풀에서 배치 요청"""
+        groups: Dict[str, List[Tuple[str, GenerationProfile, Future, float]]] = {}
+        for item in pending:
+            key = json.dumps(item[1].cache_params(), sort_keys=True, ensure_ascii=False)
+            groups.setdefault(key, []).append(item)
+
+        for items in groups.values():
+            self._executor.submit(self._send, items)
+
+    def _send(self, items: List[Tuple[str, GenerationProfile, Future, float]]) -> None:
+        """배치 요청 후 결과를 각 Future에 전달 (결과가 모자라면 남은 Future는 예외로 끝냄)"""
+        started = time.monotonic()
+        # 호출자가 이미 취소한 요청은 제외
+        items = [item for item in items if item[2].set_running_or_notify_cancel()]
+        if not items:
+            return
+
+        try:
+            results = self.backend.complete_batch([prompt for prompt, _, _, _ in items], items[0][1])
+        except Exception as e:
+            logger.error(f"Error in micro-batch request: {e}")
+            for _, _, future, _ in items:
+                future.set_exception(e)
+            return
+
+        finished = time.monotonic()
+        for i, (_, _, future, _) in enumerate(items):
+            if i < len(results):
+                future.set_result(results[i])
+            else:
+                future.set_exception(RuntimeError(
+                    f"Micro-batch returned {len(results)} results for {len(items)} prompts"
+                ))
+        if len(results) != len(items):
+            logger.error(f"Micro-batch returned {len(results)} results for {len(items)} prompts")
+
+        with self._stats_lock:
+            self.batches += 1
+            self.requests += len(items)
+            self.max_observed_batch = max(self.max_observed_batch, len(items))
+            self.total_batch_latency += finished - started
+            self.total_queue_wait += sum(started - submitted for _, _, _, submitted in items)
@@ -1,6 +1,9 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass
+import heapq
+import math
 from .sentence_classifier import ClassifiedSentence
+from .sentence_usage_index import SentenceUsageIndex, new_post_id
 
 @dataclass
 class PostStructure:
@@ -11,9 +14,40 @@ class PostStructure:
     cost_sentences: List[ClassifiedSentence]
     review_sentences: List[ClassifiedSentence]
     quality_score: float
+    post_id: Optional[str] = None  # 사용 색인에 기록한 포스트 식별자
+
+@dataclass
+class PostAssignment:
+    """문장 → 포스트 배정 결과"""
+    posts: List[Dict[str, List[ClassifiedSentence]]]  # 포스트별 섹션 문장 (품질 높은 포스트부터)
+    unassigned: Dict[str, List[ClassifiedSentence]]    # 어느 포스트에도 들어가지 않은 문장
+    total_quality: float                               # 배정된 문장 점수 합
+    swaps: int = 0                                     # 지역 개선 단계에서 교환한 횟수
+
+class _PostState:
+    """배정 중인 포스트 하나의 섹션 문장과 점수 합"""
+    __slots__ = ('sections', 'total', 'count', 'keywords', 'version')
+
+    def __init__(self, categories: List[str]):
+        self.sections: Dict[str, List[ClassifiedSentence]] = {c: [] for c in categories}
+        self.total = 0.0
+        self.count = 0
+        self.keywords: Set[str] = set()
+        self.version = 0  # 힙 항목이 최신인지 확인하는 번호
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, category: str, sentence: ClassifiedSentence, score: float) -> None:
+        self.sections[category].append(sentence)
+        self.total += score
+        self.count += 1
+        self.keywords.update(sentence.keywords)
+        self.version += 1
 
 class PostDistributor:
-    def __init__(self):
+    def __init__(self, usage_index: Optional[SentenceUsageIndex] = None):
         # 각 섹션별 필요한 최소/최대 문장 수
         self.section_requirements = {
             'usage': {'min': 2, 'max': 4},
@@ -25,73 +59,322 @@ class PostDistributor:
         
         # 하나의 포스트에 필요한 최소 품질 점수
         self.min_post_quality = 0.7
+        # 포스트에 넣을 수 있는 문장의 최소 점수 ((quality_score + confidence) / 2)
+        self.min_sentence_score = 0.6
+        # 배정 순서에서 많이 반복된 주장(cluster_size)에 주는 가산점 가중치 (× log(cluster_size))
+        self.popularity_weight = 0.05
+        # 지역 개선 단계에서 기준 포스트마다 살펴볼 문장 제공 포스트 수
+        self.swap_candidates = 8
+        # 이전 포스트에 이미 쓰인 문장을 제외하고, 분배한 포스트의 문장을 기록할 영구 사용 색인
+        self.usage_index = usage_index
+    
+    def candidate_budget(self, max_posts: int = 3, safety_factor: float = 3.0) -> Dict[str, int]:
+        """카테고리별로 LLM 단계에 보낼 후보 문장 수 (섹션 최대 문장 수 × 포스트 수 × 여유 배수)"""
+        return {
+            category: math.ceil(requirements['max'] * max_posts * safety_factor)
+            for category, requirements in self.section_requirements.items()
+        }
     
     def distribute_sentences(self, classified_data: Dict[str, List[ClassifiedSentence]], 
-                           max_posts: int = 3) -> List[PostStructure]:
-        """분류된 문장들을 여러 개의 포스트 구조로 분배"""
+                           max_posts: Optional[int] = 3,
+                           min_keyword_overlap: int = 0,
+                           keyword: Optional[str] = None) -> List[PostStructure]:
+        """분류된 문장들을 여러 개의 포스트 구조로 분배 (assign() 결과를 PostStructure로 변환)
+        
+        usage_index가 있으면 유효한 포스트마다 post_id를 붙이고 그 문장을 사용된 것으로 기록해
+        이후 호출에서 다시 쓰지 않는다.
+        """
+        assignment = self.assign(classified_data, max_posts, min_keyword_overlap)
         posts = []
+        for sections in assignment.posts:
+            post = self._create_post_structure(sections)
+            if self._validate_post_structure(post):
+                posts.append(post)
+                if self.usage_index is not None:
+                    post.post_id = new_post_id()
+                    self.usage_index.mark_used(
+                        (s.text for sentences in sections.values() for s in sentences),
+                        keyword=keyword, post_id=post.post_id
+                    )
+        return posts
+    
+    def assign(self, classified_data: Dict[str, List[ClassifiedSentence]], max_posts: Optional[int] = 3,
+               min_keyword_overlap: int = 0) -> PostAssignment:
+        """섹션별 최소/최대 문장 수와 포스트 최소 품질을 지키며 유효한 포스트 수와 점수 합을 최대화하는 배정
         
-        # 1. 각 카테고리별로 품질 점수 기준으로 정렬
-        sorted_sentences = self._sort_sentences_by_quality(classified_data)
+        포스트 수 P의 상한은 카테고리별 (문장 수 // 최소 문장 수)의 최솟값과 max_posts 중 작은 값이다.
+        상한으로 배정한 포스트가 모두 최소 품질을 넘으면 그대로 쓰고, 아니면 모든 포스트가 최소 품질을
+        넘는 가장 큰 P를 이분 탐색한다 (P가 클수록 좋은 문장이 여러 포스트로 나뉘어 품질을 지키기 어려움).
+        상한 배정에서 미달 포스트만 해체하고 재배정한 결과가 더 많은 포스트를 남기면 그 결과를 쓴다.
+        P 하나의 배정은 _assign_posts() 참고.
         
-        # 2. 가능한 포스트 수 계산
-        possible_posts = self._calculate_possible_posts(sorted_sentences)
-        num_posts = min(possible_posts, max_posts)
+        _assign_posts()를 최대 1 + ⌈log₂ P⌉번 실행하므로 전체 비용은
+        O(log P · (N log N + N·C·log P + W·K·(C·M + log P))) (기호는 _assign_posts() 참고).
         
-        # 3. 문장 분배
-        for i in range(num_posts):
-            post = self._create_post_structure(sorted_sentences, i)
-            if post and self._validate_post_structure(post):
-                posts.append(post)
+        같은 문장(텍스트)은 한 포스트에만 들어가며, usage_index에 기록된 (거의) 같은 문장은 처음부터 제외한다.
+        min_keyword_overlap > 0이면 추가 문장은 포스트에 이미 있는 키워드와 그 수 이상 겹칠 때만 넣는다 (주제 일관성).
+        """
+        pools = self._qualified_pools(classified_data)
         
-        return posts
+        limit = min(len(pools[c]) // requirements['min'] for c, requirements in self.section_requirements.items())
+        upper = limit if max_posts is None else min(limit, max_posts)
+        if upper <= 0:
+            return PostAssignment([], pools, 0.0)
+        
+        states, remaining, swaps = self._assign_posts(pools, upper, min_keyword_overlap)
+        if all(state.mean >= self.min_post_quality for state in states):
+            return self._to_assignment(states, remaining, swaps)
+        
+        # 모든 포스트가 최소 품질을 넘는 가장 큰 포스트 수 탐색
+        best = None
+        low, high = 1, upper - 1
+        while low <= high:
+            middle = (low + high) // 2
+            run = self._assign_posts(pools, middle, min_keyword_overlap)
+            if all(state.mean >= self.min_post_quality for state in run[0]):
+                best, low = run, middle + 1
+            else:
+                high = middle - 1
+        
+        # 상한 배정에서 미달 포스트를 해체하고 그 문장을 나머지 포스트에 다시 배정
+        valid = [state for state in states if state.mean >= self.min_post_quality]
+        for state in states:
+            if state.mean < self.min_post_quality:
+                for category, sentences in state.sections.items():
+                    remaining[category].extend(sentences)
+        remaining = self._fill(valid, remaining, min_keyword_overlap)
+        valid = [state for state in valid if state.mean >= self.min_post_quality]
+        
+        if best is not None and len(best[0]) >= len(valid):
+            return self._to_assignment(*best)
+        return self._to_assignment(valid, remaining, swaps)
     
-    def _sort_sentences_by_quality(self, classified_data: Dict[str, List[ClassifiedSentence]]) -> Dict[str, List[ClassifiedSentence]]:
-        """각 카테고리별 문장을 품질 점수로 정렬"""
-        sorted_data = {}
-        for category, sentences in classified_data.items():
-            sorted_data[category] = sorted(sentences, 
-                                        key=lambda x: (x.quality_score + x.confidence), 
-                                        reverse=True)
-        return sorted_data
-    
-    def _calculate_possible_posts(self, sorted_sentences: Dict[str, List[ClassifiedSentence]]) -> int:
-        """생성 가능한 포스트 수 계산"""
-        max_posts = float('inf')
-        
-        for category, requirements in self.section_requirements.items():
-            if category in sorted_sentences:
-                # 각 카테고리별로 최소 요구사항을 만족하는 문장 수로 가능한 포스트 수 계산
-                available_sentences = len([s for s in sorted_sentences[category] 
-                                        if (s.quality_score + s.confidence) / 2 >= 0.6])
-                possible_posts = available_sentences // requirements['min']
-                max_posts = min(max_posts, possible_posts)
-        
-        return max(0, int(max_posts))
-    
-    def _create_post_structure(self, sorted_sentences: Dict[str, List[ClassifiedSentence]], 
-                             post_index: int) -> PostStructure:
-        """하나의 포스트 구조 생성"""
-        post_sentences = {
-            'usage': [],
-            'benefits': [],
-            'features': [],
-            'costs': [],
-            'reviews': []
-        }
+    def _assign_posts(self, pools: Dict[str, List[ClassifiedSentence]], num_posts: int,
+                      min_keyword_overlap: int) -> Tuple[List[_PostState], Dict[str, List[ClassifiedSentence]], int]:
+        """포스트 수를 고정한 배정 (포스트 상태, 남은 문장, 교환 횟수)
         
-        # 각 카테고리별로 문장 할당
-        for category, requirements in self.section_requirements.items():
-            if category in sorted_sentences:
-                sentences = sorted_sentences[category]
-                start_idx = post_index * requirements['min']
-                end_idx = start_idx + requirements['max']
-                
-                # 품질 기준을 만족하는 문장만 선택
-                qualified_sentences = [s for s in sentences[start_idx:end_idx]
-                                    if (s.quality_score + s.confidence) / 2 >= 0.6]
-                post_sentences[category] = qualified_sentences[:requirements['max']]
+        1. 최소 문장 배정: 문장이 부족한 카테고리부터, 점수 높은 문장을 여유(점수 합 - 최소 품질 × 문장 수)가
+           가장 적은 포스트에 준다 (힙).
+        2. 추가 문장 배정: 남은 문장을 점수 순으로, 최대 문장 수를 넘지 않고 최소 품질을 지키는 포스트에 준다.
+        3. 지역 개선: 품질 미달 포스트의 가장 낮은 문장을 여유 있는 포스트의 더 좋은 문장과 교환한다.
+        
+        문장 수 N, 포스트 수 P, 카테고리 수 C, 교환 횟수 W, swap_candidates K, 섹션 최대 문장 수 M에 대해
+        O(N log N + N·C·log P + P log P + W·K·(C·M + log P)) (마지막 항이 교환 단계, 힙 크기는 P 이하).
+        """
+        categories = list(self.section_requirements)
+        states = [_PostState(categories) for _ in range(num_posts)]
+        remaining: Dict[str, List[ClassifiedSentence]] = {}
+        
+        # 1. 최소 문장 배정 (문장 여유가 적은 카테고리부터)
+        for category in sorted(categories, key=lambda c: len(pools[c]) / self.section_requirements[c]['min']):
+            need = self.section_requirements[category]['min']
+            reserved, remaining[category] = pools[category][:num_posts * need], pools[category][num_posts * need:]
+            heap = [(self._slack(state), i) for i, state in enumerate(states)]
+            heapq.heapify(heap)
+            for sentence in reserved:
+                _, i = heapq.heappop(heap)
+                states[i].add(category, sentence, self._sentence_score(sentence))
+                if len(states[i].sections[category]) < need:
+                    heapq.heappush(heap, (self._slack(states[i]), i))
+        
+        # 2. 추가 문장 배정
+        remaining = self._fill(states, remaining, min_keyword_overlap)
         
+        # 3. 지역 개선
+        swaps = self._improve(states)
+        return states, remaining, swaps
+    
+    def _to_assignment(self, states: List[_PostState], remaining: Dict[str, List[ClassifiedSentence]],
+                       swaps: int) -> PostAssignment:
+        """포스트 상태를 품질 높은 포스트부터 정렬한 배정 결과로 변환"""
+        states = sorted(states, key=lambda state: state.mean, reverse=True)
+        posts = [
+            {c: sorted(sentences, key=self._sort_key, reverse=True) for c, sentences in state.sections.items()}
+            for state in states
+        ]
+        return PostAssignment(
+            posts=posts,
+            unassigned=remaining,
+            total_quality=sum(state.total for state in states),
+            swaps=swaps
+        )
+    
+    def _qualified_pools(self, classified_data: Dict[str, List[ClassifiedSentence]]) -> Dict[str, List[ClassifiedSentence]]:
+        """카테고리별 기준 점수 이상 문장 (점수 내림차순, 같은 텍스트는 점수가 가장 높은 하나만, 사용된 문장 제외)"""
+        entries = [
+            (category, sentence)
+            for category, sentences in classified_data.items()
+            if category in self.section_requirements
+            for sentence in sentences
+            if self._sentence_score(sentence) >= self.min_sentence_score
+        ]
+        entries.sort(key=lambda entry: self._sort_key(entry[1]), reverse=True)
+        
+        pools: Dict[str, List[ClassifiedSentence]] = {c: [] for c in self.section_requirements}
+        seen_texts = set()
+        for category, sentence in entries:
+            if sentence.text in seen_texts:
+                continue
+            seen_texts.add(sentence.text)
+            if self.usage_index is not None and self.usage_index.is_used(sentence.text):
+                continue
+            pools[category].append(sentence)
+        return pools
+    
+    def _fill(self, states: List[_PostState], remaining: Dict[str, List[ClassifiedSentence]],
+              min_keyword_overlap: int) -> Dict[str, List[ClassifiedSentence]]:
+        """남은 문장을 점수 순으로 추가 배정하고 배정되지 않은 문장 반환
+        
+        최소 품질 이상인 문장은 여유가 가장 적은 포스트에 (미달 포스트 보강),
+        그보다 낮은 문장은 넣어도 최소 품질을 지키는 여유가 가장 큰 포스트에 넣는다.
+        카테고리마다 여유 기준 최소/최대 힙을 두고, 오래된 항목은 version으로 걸러낸다.
+        """
+        unassigned: Dict[str, List[ClassifiedSentence]] = {c: [] for c in remaining}
+        if not states:
+            for category, sentences in remaining.items():
+                unassigned[category].extend(sentences)
+            return unassigned
+        
+        low_heaps = {c: [] for c in remaining}   # (여유, 포스트 번호, version)
+        high_heaps = {c: [] for c in remaining}  # (-여유, 포스트 번호, version)
+        for i in range(len(states)):
+            self._push_post(states, i, low_heaps, high_heaps)
+        
+        candidates = sorted(
+            ((category, sentence) for category, sentences in remaining.items() for sentence in sentences),
+            key=lambda entry: self._sort_key(entry[1]), reverse=True
+        )
+        for category, sentence in candidates:
+            score = self._sentence_score(sentence)
+            if score >= self.min_post_quality:
+                target = self._pop_post(states, low_heaps[category], category, sentence, min_keyword_overlap, None)
+            else:
+                target = self._pop_post(states, high_heaps[category], category, sentence, min_keyword_overlap, score)
+            
+            if target is None:
+                unassigned[category].append(sentence)
+                continue
+            states[target].add(category, sentence, score)
+            self._push_post(states, target, low_heaps, high_heaps)
+        return unassigned
+    
+    def _push_post(self, states: List[_PostState], i: int,
+                   low_heaps: Dict[str, list], high_heaps: Dict[str, list]) -> None:
+        """문장을 더 받을 수 있는 카테고리 힙에 포스트 등록"""
+        state = states[i]
+        slack = self._slack(state)
+        for category in low_heaps:
+            if len(state.sections[category]) < self.section_requirements[category]['max']:
+                heapq.heappush(low_heaps[category], (slack, i, state.version))
+                heapq.heappush(high_heaps[category], (-slack, i, state.version))
+    
+    def _pop_post(self, states: List[_PostState], heap: list, category: str, sentence: ClassifiedSentence,
+                  min_keyword_overlap: int, score: Optional[float]) -> Optional[int]:
+        """힙에서 문장을 받을 수 있는 포스트 번호를 꺼냄 (없으면 None)
+        
+        score를 넘기면 추가 후에도 최소 품질을 지키는 포스트만, min_keyword_overlap > 0이면
+        키워드가 충분히 겹치는 포스트만 고른다. 조건에 맞지 않아 건너뛴 포스트는 힙에 되돌린다.
+        """
+        skipped = []
+        target = None
+        while heap:
+            entry = heapq.heappop(heap)
+            _, i, version = entry
+            state = states[i]
+            if version != state.version:
+                continue  # 이후 문장이 추가되어 새 항목이 들어간 포스트
+            if len(state.sections[category]) >= self.section_requirements[category]['max']:
+                continue
+            if score is not None and (state.total + score) / (state.count + 1) < self.min_post_quality:
+                # 여유가 가장 큰 포스트도 품질을 못 지키면 다른 포스트도 불가능
+                skipped.append(entry)
+                break
+            if min_keyword_overlap and len(state.keywords.intersection(sentence.keywords)) < min_keyword_overlap:
+                skipped.append(entry)
+                continue
+            target = i
+            break
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        return target
+    
+    def _improve(self, states: List[_PostState]) -> int:
+        """품질 미달 포스트의 낮은 문장을 여유 있는 포스트의 같은 카테고리 높은 문장과 교환, 교환 횟수 반환
+        
+        최소 품질을 넘는 포스트를 여유 기준 최대 힙에 두고 교환마다 여유가 큰 swap_candidates개만 꺼내 본다.
+        교환으로 바뀐 포스트는 version을 올려 새 항목을 넣고, 오래된 항목은 꺼낼 때 버린다 (_fill과 같은 방식).
+        """
+        swaps = 0
+        donor_heap = [(-self._slack(other), i, other.version)
+                      for i, other in enumerate(states) if other.mean >= self.min_post_quality]
+        heapq.heapify(donor_heap)
+        for index in sorted(range(len(states)), key=lambda i: self._slack(states[i])):
+            state = states[index]
+            deficient = state.mean < self.min_post_quality
+            while state.mean < self.min_post_quality:
+                donors = []
+                while donor_heap and len(donors) < self.swap_candidates:
+                    entry = heapq.heappop(donor_heap)
+                    if entry[2] == states[entry[1]].version:
+                        donors.append(entry)
+                
+                best = None
+                for _, i, _ in donors:
+                    donor = states[i]
+                    for category, sentences in state.sections.items():
+                        if not sentences or not donor.sections[category]:
+                            continue
+                        low = min(sentences, key=self._sentence_score)
+                        high = max(donor.sections[category], key=self._sentence_score)
+                        gain = self._sentence_score(high) - self._sentence_score(low)
+                        if gain <= 0 or (donor.total - gain) / donor.count < self.min_post_quality:
+                            continue
+                        if best is None or gain > best[0]:
+                            best = (gain, i, category, low, high)
+                if best is None:
+                    for entry in donors:
+                        heapq.heappush(donor_heap, entry)
+                    break
+                
+                gain, i, category, low, high = best
+                donor = states[i]
+                state.sections[category].remove(low)
+                state.sections[category].append(high)
+                donor.sections[category].remove(high)
+                donor.sections[category].append(low)
+                state.total += gain
+                donor.total -= gain
+                state.keywords.update(high.keywords)
+                donor.keywords.update(low.keywords)
+                state.version += 1
+                donor.version += 1
+                swaps += 1
+                
+                for entry in donors:
+                    if entry[1] != i:
+                        heapq.heappush(donor_heap, entry)
+                heapq.heappush(donor_heap, (-self._slack(donor), i, donor.version))
+            
+            if deficient and state.mean >= self.min_post_quality:
+                # 교환으로 최소 품질을 넘은 포스트는 이후 포스트의 문장 제공 후보가 됨
+                heapq.heappush(donor_heap, (-self._slack(state), index, state.version))
+        return swaps
+    
+    def _slack(self, state: _PostState) -> float:
+        """최소 품질을 넘는 점수 여유 (점수 합 - 최소 품질 × 문장 수)"""
+        return state.total - self.min_post_quality * state.count
+    
+    @staticmethod
+    def _sentence_score(sentence: ClassifiedSentence) -> float:
+        return (sentence.quality_score + sentence.confidence) / 2
+    
+    def _sort_key(self, sentence: ClassifiedSentence) -> float:
+        # 많이 반복된 주장일수록 조금 먼저 배정 (품질 기준 판단에는 쓰지 않음)
+        return (sentence.quality_score + sentence.confidence
+                + self.popularity_weight * math.log(max(sentence.cluster_size, 1)))
+    
+    def _create_post_structure(self, post_sentences: Dict[str, List[ClassifiedSentence]]) -> PostStructure:
+        """배정된 섹션 문장으로 포스트 구조 생성"""
         # 전체 품질 점수 계산
         total_quality = self._calculate_total_quality(post_sentences)
         
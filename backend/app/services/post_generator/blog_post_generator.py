@@ -2,12 +2,14 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import json
+import logging
 import os
 from pathlib import Path
 
 from ..content_context.content_context import ContentContext
 from ..sentence_analyzer.sentence_analyzer import SentenceAnalyzer, AnalyzedSentence
 from ..fact_extractor.fact_extractor import FactExtractor
+from ..prompt_builder import PromptBuilder, estimate_tokens
 from .content_assembler import ContentAssembler
 from .title_generator import TitleGenerator
 from .section_assembler import SectionAssemblerFactory
@@ -15,6 +17,12 @@ from ..content_quality.content_quality_checker import ContentQualityChecker, Qua
 from ..content_quality.content_styler import ContentStyler, StyleConfig, StyleResult
 from ..content_quality.content_optimizer import ContentOptimizer, OptimizationResult
 
+logger = logging.getLogger(__name__)
+
+# 사실 문장 순위를 낮출 부정적 단어와 품질 점수 감점
+NEGATIVE_WORDS = ('사기', '불법', '문제')
+NEGATIVE_WORD_PENALTY = 0.5
+
 @dataclass
 class TitleSet:
     """제목 세트"""
@@ -87,6 +95,7 @@ class BlogPostGenerator:
         self.fact_extractor = FactExtractor()
         self.sentence_analyzer = SentenceAnalyzer()
         self.content_assembler = ContentAssembler(content_context)
+        self.prompt_builder = PromptBuilder()
         
     def generate_post(self, raw_data: Dict[str, Any]) -> BlogPost:
         """블로그 포스트 생성"""
@@ -163,21 +172,28 @@ class BlogPostGenerator:
                     if cleaned and len(cleaned) > 10:  # 너무 짧은 문장 제외
                         facts.append(cleaned)
         
-        # 중복 제거
-        facts = list(set(facts))
-        
-        # 문장 품질 기준으로 정렬
-        facts.sort(key=lambda x: (
-            self.context.keyword in x,  # 키워드 포함 여부
-            len(x) >= 20 and len(x) <= 100,  # 적절한 길이
-            not any(bad_word in x for bad_word in ['사기', '불법', '문제'])  # 부정적 단어 제외
-        ), reverse=True)
-        
-        # 상위 10개 문장만 선택
-        selected_facts = facts[:10]
+        facts = list(dict.fromkeys(facts))
+        
+        # 문장 분석기 품질 점수와 키워드 관련도로 순위를 매기고 (부정적 단어가 있으면 감점),
+        # 중복을 제거한 뒤 토큰 예산 안에 들어가는 문장만 선택
+        items = self.prompt_builder.flatten(self.sentence_analyzer.analyze_sentences(facts))
+        for item in items:
+            if any(bad_word in item.text for bad_word in NEGATIVE_WORDS):
+                item.quality = max(0.0, item.quality - NEGATIVE_WORD_PENALTY)
+        selected_facts, _ = self.prompt_builder.select(
+            items,
+            self.prompt_builder.budgets['post'],
+            self.context.keyword
+        )
         
         # 문자열로 변환
-        return "\n".join(f"- {fact}" for fact in selected_facts)
+        facts_text = "\n".join(f"- {fact.text}" for fact in selected_facts)
+        original_tokens = estimate_tokens("\n".join(f"- {fact}" for fact in facts))
+        logger.info(
+            f"Selected {len(selected_facts)}/{len(facts)} facts: "
+            f"{estimate_tokens(facts_text)} tokens (saved {max(0, original_tokens - estimate_tokens(facts_text))})"
+        )
+        return facts_text
 
     def _split_content_into_sections(self, content: str) -> List[Dict[str, Any]]:
         """생성된 콘텐츠를 섹션별로 분리"""
@@ -1,4 +1,4 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import random
@@ -10,6 +10,7 @@ from .section_assembler import (
 from .title_generator import TitleGenerator
 from ..content_context.content_context import ContentContext
 from ..sentence_analyzer.sentence_analyzer import AnalyzedSentence
+from ..sentence_usage_index import SentenceUsageIndex, new_post_id
 
 @dataclass
 class BlogPost:
@@ -18,10 +19,12 @@ class BlogPost:
     meta: Dict[str, Any]   # description, keywords, tags
     content: Dict[str, Any]  # intro, main_sections, conclusion
     footer: Dict[str, str]  # company_info, contact
+    post_id: Optional[str] = None  # 사용 색인에 기록한 포스트 식별자
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
         return {
+            'post_id': self.post_id,
             'title': self.title,
             'meta': self.meta,
             'content': self.content,
@@ -31,8 +34,10 @@ class BlogPost:
 class ContentAssembler:
     """블로그 포스트 조립기"""
     
-    def __init__(self, content_context: ContentContext):
+    def __init__(self, content_context: ContentContext,
+                 usage_index: Optional[SentenceUsageIndex] = None):
         self.context = content_context
+        self.usage_index = usage_index  # 이전 포스트에 쓰인 문장 제외 및 기록
         self.section_factory = SectionAssemblerFactory()
         self.title_generator = TitleGenerator(content_context)
         
@@ -76,7 +81,10 @@ class ContentAssembler:
         }
         
     def assemble_post(self, analyzed_sentences: List[AnalyzedSentence]) -> Dict[str, Any]:
-        """블로그 포스트 조립"""
+        """블로그 포스트 조립 (usage_index가 있으면 이미 쓰인 문장은 빼고 조립한 뒤 사용 기록)"""
+        if self.usage_index is not None:
+            analyzed_sentences = self.usage_index.filter_unused(analyzed_sentences)
+        
         # 1. 섹션별 문장 분류
         sentence_groups = self._group_sentences(analyzed_sentences)
         
@@ -107,7 +115,13 @@ class ContentAssembler:
                 'main_sections': main_content.to_dict(),
                 'conclusion': conclusion_content.to_dict()
             },
-            footer=footer
+            footer=footer,
+            post_id=new_post_id()
         )
         
+        if self.usage_index is not None:
+            self.usage_index.mark_used(
+                (s.text for s in analyzed_sentences), keyword=self.context.keyword, post_id=post.post_id
+            )
+        
         return post.to_dict()
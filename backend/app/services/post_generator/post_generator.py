@@ -1,6 +1,7 @@
-from typing import Dict, List
+from typing import Dict, List, Any, Iterator, Optional
 import logging
 from ..crawlers.keyword_crawler import KeywordCrawler
+from ..lm_studio_client import LMStudioClient
 from .content_analyzer import ContentAnalyzer
 from .blog_post_writer import BlogPostWriter
 from .quality_checker import QualityChecker
@@ -9,36 +10,19 @@ import traceback
 logger = logging.getLogger(__name__)
 
 class PostGenerator:
-	def __init__(self, crawler: KeywordCrawler):
+	def __init__(self, crawler: KeywordCrawler, lm_client: Optional[LMStudioClient] = None):
 		self.crawler = crawler
 		self.content_analyzer = ContentAnalyzer()
 		self.blog_writer = BlogPostWriter()
 		self.quality_checker = QualityChecker()
+		self.lm_client = lm_client or LMStudioClient()
 
 	
 	def generate_post(self, keyword: str, search_results: Dict = None) -> Dict:
 		"""검색 결과를 바탕으로 고품질 포스트 생성"""
 		try:
-			# 1. 검색 결과 사용 또는 수집
-			if search_results is None:
-				search_results = self.crawler.search_with_long_tail(keyword)
-			
-			# 검색 결과 구조 변환
-			materials = {
-				'keyword': keyword,
-				'blog_results': [],
-				'news_results': []
-			}
-			
-			# 결과를 블로그와 뉴스로 분리
-			for result in search_results.get('results', []):
-				if result.get('source') == 'blog':
-					materials['blog_results'].append(result)
-				elif result.get('source') == 'news':
-					materials['news_results'].append(result)
-			
-			# 2. 소재 분석
-			analyzed_materials = self.content_analyzer.analyze_materials(materials)
+			# 1-2. 검색 결과 수집 및 소재 분석
+			analyzed_materials = self._prepare_materials(keyword, search_results)
 			
 			# 3. 블로그 포스트 작성
 			post = self.blog_writer.create_post(analyzed_materials, keyword)
@@ -64,6 +48,40 @@ class PostGenerator:
 			logger.error(traceback.format_exc())
 			raise
 	
+	def stream_post(self, keyword: str, search_results: Dict = None) -> Iterator[Dict[str, Any]]:
+		"""LLM으로 포스트를 섹션별로 스트리밍 생성 (LMStudioClient.stream_blog_post 이벤트 반환)"""
+		yield {'event': 'status', 'message': '검색 결과 분석 중'}
+		analyzed_materials = self._prepare_materials(keyword, search_results)
+		
+		facts = {
+			'keyword': keyword,
+			'topics': analyzed_materials.get('topics', []),
+			'key_points': analyzed_materials.get('key_points', [])
+		}
+		yield from self.lm_client.stream_blog_post(facts)
+	
+	def _prepare_materials(self, keyword: str, search_results: Dict = None) -> Dict:
+		"""검색 결과를 블로그/뉴스로 나누고 소재 분석"""
+		# 검색 결과 사용 또는 수집
+		if search_results is None:
+			search_results = self.crawler.search_with_long_tail(keyword)
+		
+		# 검색 결과 구조 변환
+		materials = {
+			'keyword': keyword,
+			'blog_results': [],
+			'news_results': []
+		}
+		
+		# 결과를 블로그와 뉴스로 분리
+		for result in search_results.get('results', []):
+			if result.get('source') == 'blog':
+				materials['blog_results'].append(result)
+			elif result.get('source') == 'news':
+				materials['news_results'].append(result)
+		
+		return self.content_analyzer.analyze_materials(materials)
+	
 	def _improve_post_quality(self, post: Dict, issues: List[str], materials: Dict) -> Dict:
 		"""품질 이슈 개선"""
 		improved_post = post.copy()
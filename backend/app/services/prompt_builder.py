@@ -0,0 +1,213 @@
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
+import logging
+import re
+from .tokenizer.tokenizer import get_tokenizer, normalize_whitespace, is_near_duplicate
+
+logger = logging.getLogger(__name__)
+
+HANGUL_PATTERN = re.compile(r'[가-힣]')
+
+def estimate_tokens(text: str) -> int:
+    """프롬프트 토큰 수 추정 (한글은 글자당 약 1토큰, 그 외는 4글자당 1토큰)"""
+    hangul = len(HANGUL_PATTERN.findall(text))
+    return hangul + (len(text) - hangul) // 4 + 1
+
+# 섹션별로 프롬프트에 넣을 사실 정보의 토큰 예산
+SECTION_TOKEN_BUDGETS = {
+    'title': 300,
+    'intro': 600,
+    'main': 1200,
+    'qa': 900,
+    'conclusion': 500,
+    'post': 1500,
+}
+DEFAULT_TOKEN_BUDGET = 800
+
+# 사실 항목으로 사용할 텍스트 필드와 점수 필드 (앞쪽 우선)
+TEXT_FIELDS = ('title', 'text', 'content', 'summary', 'description')
+SCORE_FIELDS = ('quality_score', 'confidence', 'score')
+
+@dataclass(slots=True)
+class FactItem:
+    """프롬프트 후보 사실"""
+    text: str
+    quality: float = 0.5  # 분석기 점수 (0~1, 없으면 0.5)
+    source: str = ''      # 원본 facts에서의 위치 (예: 'topics')
+    relevance: float = 0.0
+
+@dataclass
+class PromptBuildResult:
+    """압축된 프롬프트와 토큰 절감 정보"""
+    prompt: str
+    facts: List[FactItem]
+    prompt_tokens: int
+    original_tokens: int
+    dropped: int = 0  # 예산/중복으로 제외된 사실 수
+    budget: int = 0
+    keyword: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.original_tokens - self.prompt_tokens)
+
+    @property
+    def facts_text(self) -> str:
+        """선택된 사실만 이어 붙인 텍스트 (의미 캐시 키로 사용)"""
+        return "\n".join(item.text for item in self.facts)
+
+class PromptBuilder:
+    """사실 정보를 관련도/품질 순으로 골라 섹션별 토큰 예산 안에 담는 프롬프트 빌더
+
+    1. facts(dict/list/문자열/분석 결과 객체)를 FactItem 목록으로 펼침
+    2. 키워드와의 관련도(키워드 겹침 비율)와 분석기 품질 점수로 순위 결정
+    3. 같은 문장이거나 키워드 집합이 거의 같은 사실은 하나만 남김
+    4. 예산을 넘지 않는 범위에서 상위 사실부터 채움
+    """
+
+    def __init__(self, budgets: Optional[Dict[str, int]] = None, relevance_weight: float = 0.6,
+                 dedup_threshold: float = 0.8):
+        self.budgets = dict(SECTION_TOKEN_BUDGETS)
+        if budgets:
+            self.budgets.update(budgets)
+        self.relevance_weight = relevance_weight
+        self.dedup_threshold = dedup_threshold
+        self.tokenizer = get_tokenizer()
+
+        self.requests = 0
+        self.total_tokens_saved = 0
+
+    def build(self, template: str, facts: Any, section_type: str,
+              keyword: Optional[str] = None) -> PromptBuildResult:
+        """template의 {facts} 자리에 예산에 맞게 고른 사실을 넣어 프롬프트 생성"""
+        original_tokens = estimate_tokens(template.format(facts=facts))
+        if keyword is None and isinstance(facts, dict):
+            keyword = facts.get('keyword') or facts.get('main_keyword')
+
+        budget = self.budgets.get(section_type, DEFAULT_TOKEN_BUDGET)
+        items = self.flatten(facts)
+        selected, dropped = self.select(items, budget, keyword)
+
+        lines = [f"키워드: {keyword}"] if keyword else []
+        lines.extend(f"- {item.text}" for item in selected)
+        prompt = template.format(facts="\n".join(lines))
+
+        result = PromptBuildResult(
+            prompt=prompt,
+            facts=selected,
+            prompt_tokens=estimate_tokens(prompt),
+            original_tokens=original_tokens,
+            dropped=dropped,
+            budget=budget,
+            keyword=keyword,
+            details={'section_type': section_type, 'candidates': len(items)}
+        )
+        self.requests += 1
+        self.total_tokens_saved += result.tokens_saved
+        logger.info(
+            f"Prompt for {section_type}: {result.prompt_tokens} tokens "
+            f"(saved {result.tokens_saved}, {len(selected)}/{len(items)} facts)"
+        )
+        return result
+
+    def select(self, items: List[FactItem], budget: int,
+               keyword: Optional[str] = None) -> Tuple[List[FactItem], int]:
+        """순위 → 중복 제거 → 예산 채우기, (선택된 사실, 제외된 수) 반환"""
+        ranked = self.rank(items, keyword)
+
+        selected: List[FactItem] = []
+        seen_texts = set()
+        selected_keywords: List[frozenset] = []
+        used = 0
+        for item in ranked:
+            normalized = normalize_whitespace(item.text)
+            if normalized in seen_texts:
+                continue
+            keywords = frozenset(self.tokenizer.keywords(normalized))
+            if is_near_duplicate(keywords, selected_keywords, self.dedup_threshold):
+                continue
+
+            cost = estimate_tokens(normalized) + 1  # 줄머리 "- " 포함
+            if used + cost > budget:
+                continue  # 더 짧은 사실은 들어갈 수 있으므로 계속 확인
+
+            seen_texts.add(normalized)
+            selected_keywords.append(keywords)
+            selected.append(item)
+            used += cost
+
+        return selected, len(items) - len(selected)
+
+    def rank(self, items: List[FactItem], keyword: Optional[str] = None) -> List[FactItem]:
+        """관련도와 품질 점수의 가중합으로 정렬"""
+        query = set(self.tokenizer.keywords(keyword)) if keyword else set()
+        for item in items:
+            if query:
+                terms = set(self.tokenizer.keywords(item.text))
+                overlap = len(query & terms) / len(query)
+                # 띄어쓰기가 달라 토큰이 겹치지 않아도 키워드 문자열이 있으면 관련 있음
+                item.relevance = max(overlap, 1.0 if keyword in item.text else 0.0)
+            else:
+                item.relevance = 0.0
+
+        weight = self.relevance_weight if query else 0.0
+        return sorted(items, key=lambda item: weight * item.relevance + (1 - weight) * item.quality,
+                      reverse=True)
+
+    def flatten(self, facts: Any, source: str = '') -> List[FactItem]:
+        """facts 구조를 사실 항목 목록으로 펼침"""
+        if facts is None:
+            return []
+        if isinstance(facts, str):
+            lines = (line.strip().lstrip('-•*').strip() for line in facts.splitlines())
+            return [FactItem(text=line, source=source) for line in lines if line]
+        if isinstance(facts, (list, tuple)):
+            items = []
+            for value in facts:
+                items.extend(self.flatten(value, source))
+            return items
+        if isinstance(facts, dict):
+            text = self._first_text(facts)
+            if text is not None:
+                return [FactItem(text=text, quality=self._score(facts), source=source)]
+            items = []
+            for key, value in facts.items():
+                if key in ('keyword', 'main_keyword'):
+                    continue
+                if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+                    items.append(FactItem(text=f"{key}: {value}", source=source or key))
+                else:
+                    items.extend(self.flatten(value, source or key))
+            return items
+
+        # AnalyzedSentence / ClassifiedSentence 등 text 속성을 가진 분석 결과
+        text = getattr(facts, 'text', None)
+        if isinstance(text, str) and text.strip():
+            quality = next((getattr(facts, name) for name in SCORE_FIELDS if hasattr(facts, name)), 0.5)
+            return [FactItem(text=text.strip(), quality=float(quality), source=source)]
+        return [FactItem(text=str(facts), source=source)]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'total_tokens_saved': self.total_tokens_saved,
+            'avg_tokens_saved': self.total_tokens_saved / self.requests if self.requests else 0.0
+        }
+
+    @staticmethod
+    def _first_text(item: Dict[str, Any]) -> Optional[str]:
+        # 제목과 본문/요약이 함께 있으면 이어 붙여 한 항목으로 사용
+        texts = [item[name].strip() for name in TEXT_FIELDS
+                 if isinstance(item.get(name), str) and item[name].strip()]
+        if not texts:
+            return None
+        return ' - '.join(texts[:2])
+
+    @staticmethod
+    def _score(item: Dict[str, Any]) -> float:
+        for name in SCORE_FIELDS:
+            value = item.get(name)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return float(value)
+        return 0.5
@@ -0,0 +1,149 @@
+from typing import Dict, List, Any, Optional
+from dataclasses import dataclass
+import logging
+import re
+import threading
+import numpy as np
+from .embeddings.sentence_embedder import SentenceEmbedder, get_embedder
+
+logger = logging.getLogger(__name__)
+
+# 재사용 정책
+REUSE_POLICIES = ('reuse', 'adapt', 'same_keyword')
+
+@dataclass
+class SemanticMatch:
+    """유사한 이전 생성 결과"""
+    response: str
+    similarity: float
+    keyword: Optional[str]
+    facts_text: str
+
+class SemanticCache:
+    """압축된 사실 집합의 임베딩 유사도로 이전 섹션 생성 결과를 찾는 캐시
+
+    섹션 유형별로 (사실 텍스트 임베딩, 키워드, 생성 결과)를 보관하고,
+    새 요청의 사실 집합과 코사인 유사도가 threshold 이상인 가장 가까운 결과를 반환한다.
+
+    재사용 정책 (policy):
+    - 'reuse': 유사한 결과를 그대로 사용
+    - 'adapt': 이전 키워드를 새 키워드로 바꿔서 사용
+    - 'same_keyword': 키워드가 같을 때만 그대로 사용
+
+    임베딩은 섹션 유형별로 미리 잡아둔 배열에 채우며 (가득 차면 두 배로 늘림),
+    max_entries에 이르면 가장 오래된 칸부터 덮어쓴다.
+    """
+
+    def __init__(self, embedder: Optional[SentenceEmbedder] = None, threshold: float = 0.95,
+                 policy: str = 'adapt', max_entries: int = 5000):
+        if policy not in REUSE_POLICIES:
+            raise ValueError(f"Unknown reuse policy: {policy}")
+        self.embedder = embedder or get_embedder()
+        self.threshold = threshold
+        self.policy = policy
+        self.max_entries = max_entries  # 섹션 유형별 최대 항목 수
+
+        self._vectors: Dict[str, np.ndarray] = {}
+        self._entries: Dict[str, List[SemanticMatch]] = {}
+        self._next_slot: Dict[str, int] = {}  # max_entries에 이른 뒤 다음에 덮어쓸 칸
+        self._lock = threading.Lock()
+
+        self.lookups = 0
+        self.hits = 0
+        self.adapted = 0
+
+    def lookup(self, section_type: str, facts_text: str,
+               keyword: Optional[str] = None) -> Optional[str]:
+        """재사용할 수 있는 이전 결과 반환 (정책 적용 후), 없으면 None"""
+        match = self.find(section_type, facts_text)
+        with self._lock:
+            self.lookups += 1
+            if match is None:
+                return None
+
+            if self.policy == 'same_keyword' and match.keyword != keyword:
+                return None
+
+            response = match.response
+            if self.policy == 'adapt' and keyword and match.keyword and match.keyword != keyword:
+                adapted = self.adapt(response, match.keyword, keyword)
+                if adapted != response:
+                    response = adapted
+                    self.adapted += 1
+
+            self.hits += 1
+        logger.info(f"Semantic cache hit for {section_type} (similarity {match.similarity:.3f})")
+        return response
+
+    @staticmethod
+    def adapt(response: str, old_keyword: str, new_keyword: str) -> str:
+        """이전 키워드(띄어쓰기를 뺀 표기 포함)를 새 키워드로 바꿈
+
+        긴 표기부터 한 번에 바꾸므로, 새 키워드가 이미 들어 있거나 이전 키워드를 포함해도 다시 바뀌지 않는다.
+        """
+        variants = sorted({old_keyword, old_keyword.replace(' ', '')}, key=len, reverse=True)
+        pattern = '|'.join(re.escape(variant) for variant in variants if variant)
+        return re.sub(pattern, lambda _: new_keyword, response) if pattern else response
+
+    def find(self, section_type: str, facts_text: str) -> Optional[SemanticMatch]:
+        """유사도가 threshold 이상인 가장 가까운 항목"""
+        with self._lock:
+            if not self._entries.get(section_type):
+                return None
+
+        query = self.embedder.embed(facts_text)
+        with self._lock:
+            entries = self._entries[section_type]
+            similarities = self._vectors[section_type][:len(entries)] @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            entry = entries[best]
+        return SemanticMatch(entry.response, float(similarities[best]), entry.keyword, entry.facts_text)
+
+    def store(self, section_type: str, facts_text: str, response: str,
+              keyword: Optional[str] = None) -> None:
+        """생성 결과 저장 (최대 개수 초과 시 오래된 항목부터 제거)"""
+        if not response:
+            return
+        vector = self.embedder.embed(facts_text)
+        entry = SemanticMatch(response, 1.0, keyword, facts_text)
+        with self._lock:
+            entries = self._entries.setdefault(section_type, [])
+            vectors = self._vectors.get(section_type)
+            if len(entries) >= self.max_entries:
+                # 가장 오래된 칸을 덮어씀
+                slot = self._next_slot.get(section_type, 0) % len(entries)
+                self._next_slot[section_type] = slot + 1
+                entries[slot] = entry
+                vectors[slot] = vector
+                return
+
+            if vectors is None or len(entries) == len(vectors):
+                capacity = min(self.max_entries, max(16, 2 * len(entries)))
+                grown = np.empty((capacity, len(vector)), dtype=vector.dtype)
+                if vectors is not None:
+                    grown[:len(entries)] = vectors[:len(entries)]
+                self._vectors[section_type] = vectors = grown
+            vectors[len(entries)] = vector
+            entries.append(entry)
+
+    @property
+    def generations_avoided(self) -> int:
+        return self.hits
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """생성 회피 통계"""
+        with self._lock:
+            entries = sum(len(e) for e in self._entries.values())
+        return {
+            'lookups': self.lookups,
+            'generations_avoided': self.hits,
+            'adapted': self.adapted,
+            'hit_rate': self.hit_rate,
+            'entries': entries
+        }
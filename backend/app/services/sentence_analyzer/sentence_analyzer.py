@@ -1,9 +1,40 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Sequence, Union
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
 import re
 from dataclasses import dataclass
+import numpy as np
+from ..keyword_engine.keyword_engine import KeywordEngine
+from ..sentence_table.sentence_table import SentenceTable, infer_schema
+from ..tokenizer.tokenizer import get_tokenizer
 
-@dataclass
+# 문장 분석 패턴 (모듈 로드 시 한 번만 컴파일)
+STRUCTURE_PATTERNS = [
+    re.compile(r'^[가-힣]+.*[다요]$'),  # 기본 문장 구조 완화
+    re.compile(r'.*[을를].*[다요]$'),  # 목적어가 있는 구조
+    re.compile(r'.*[에서].*[다요]$'),  # 장소/시간 표현이 있는 구조
+]
+SUBJECT_PATTERN = re.compile(r'[가-힣]+[은는이가]')
+PREDICATE_PATTERN = re.compile(r'[가-힣]+[다요]$')
+STATISTIC_PATTERN = re.compile(r'\d+(?:[.,%]\d+)?')
+EXAMPLE_MARKERS = ['예를 들어', '예시', '사례']
+SUBJECTIVE_MARKERS = ['것 같', '보이', '생각하', '느끼']
+SENTENCE_ENDINGS = ('다', '요', '죠', '까')
+
+# 여러 문장을 줄바꿈으로 이어 붙인 버퍼에서 한 번에 찾기 위한 줄 단위 패턴
+_LINE_PATTERNS = {
+    'structure': re.compile(
+        r'^(?:[가-힣]+.*[다요]|.*[을를].*[다요]|.*[에서].*[다요])$', re.MULTILINE
+    ),
+    'subject': SUBJECT_PATTERN,
+    'predicate': re.compile(r'[가-힣]+[다요]$', re.MULTILINE),
+    'statistics': STATISTIC_PATTERN,
+    'example': re.compile('|'.join(map(re.escape, EXAMPLE_MARKERS))),
+    'subjective': re.compile('|'.join(map(re.escape, SUBJECTIVE_MARKERS))),
+}
+
+@dataclass(slots=True)
 class AnalyzedSentence:
     """분석된 문장 정보를 담는 클래스"""
     text: str
@@ -16,37 +47,157 @@ class AnalyzedSentence:
     structure_score: float  # 문장 구조 완성도
     sentence_type: str = 'core'  # 'hook', 'core', 'detail', 'example', 'conclusion'
 
+ANALYZED_SCHEMA = infer_schema(AnalyzedSentence)
+
+def _analyze_shard(args) -> Dict[str, Any]:
+    """프로세스 풀 작업: 문장 묶음 하나를 분석해 컬럼 반환"""
+    keyword_engine, max_document_ratio, texts = args
+    return SentenceAnalyzer(keyword_engine, max_document_ratio)._analyze_columns(texts)
+
 class SentenceAnalyzer:
     """추출된 사실 문장을 분석하고 품질을 평가하는 클래스"""
     
-    def __init__(self):
+    def __init__(self, keyword_engine: Optional[KeywordEngine] = None, max_document_ratio: float = 0.5):
+        self.keyword_engine = keyword_engine
+        self.tokenizer = get_tokenizer()
+        self.max_document_ratio = max_document_ratio  # 이 비율 이상의 문서에 나오는 단어는 키워드에서 제외
         self.min_sentence_length = 5  # 최소 길이 완화
         self.max_sentence_length = 200  # 최대 길이 증가
-        self.structure_patterns = [
-            r'^[가-힣]+.*[다요]$',  # 기본 문장 구조 완화
-            r'.*[을를].*[다요]$',  # 목적어가 있는 구조
-            r'.*[에서].*[다요]$',  # 장소/시간 표현이 있는 구조
-        ]
+        self.structure_patterns = STRUCTURE_PATTERNS
         
     def analyze_sentences(self, sentences: List[str]) -> List[AnalyzedSentence]:
         """문장들을 분석하여 품질 평가"""
-        analyzed_sentences = []
-        
-        for sentence in sentences:
-            if self._is_valid_sentence(sentence):
-                analyzed = self._analyze_single_sentence(sentence)
-                analyzed_sentences.append(analyzed)
-                
-        return analyzed_sentences
-    
-    def filter_quality_sentences(self, analyzed_sentences: List[AnalyzedSentence], 
-                               min_quality_score: float = 0.6) -> List[AnalyzedSentence]:
-        """품질 기준을 충족하는 문장만 필터링"""
+        columns = self._analyze_columns([s for s in sentences if self._is_valid_sentence(s)])
         return [
-            sent for sent in analyzed_sentences 
-            if sent.quality_score >= min_quality_score
+            AnalyzedSentence(
+                text=text,
+                quality_score=quality,
+                has_statistics=has_statistics,
+                has_example=has_example,
+                keywords=keywords,
+                sentiment=sentiment,
+                length=length,
+                structure_score=structure,
+                sentence_type='fact'
+            )
+            for text, quality, has_statistics, has_example, keywords, sentiment, length, structure in zip(
+                columns['text'], columns['quality_score'].tolist(), columns['has_statistics'].tolist(),
+                columns['has_example'].tolist(), columns['keywords'], columns['sentiment'],
+                columns['length'].tolist(), columns['structure_score'].tolist()
+            )
         ]
     
+    def analyze_batch(self, sentences: Sequence[str], processes: Optional[int] = None,
+                      chunk_size: int = 100000) -> SentenceTable:
+        """문장 목록을 한 번에 분석해 컬럼 단위 SentenceTable로 반환 (유효한 문장만)
+        
+        모든 문장을 줄바꿈으로 이어 붙인 버퍼에 미리 컴파일한 패턴을 한 번씩 적용하고,
+        점수는 NumPy 배열 연산으로 계산한다. processes를 지정하면 chunk_size 단위로
+        나눠 프로세스 풀에서 분석한다.
+        """
+        texts = [s for s in sentences if self._is_valid_sentence(s)]
+        if processes and processes > 1 and len(texts) > chunk_size:
+            shards = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                parts = list(executor.map(
+                    _analyze_shard, [(self.keyword_engine, self.max_document_ratio, shard) for shard in shards]
+                ))
+            columns = {
+                name: np.concatenate([part[name] for part in parts]) if isinstance(parts[0][name], np.ndarray)
+                else [value for part in parts for value in part[name]]
+                for name in parts[0]
+            }
+        else:
+            columns = self._analyze_columns(texts)
+        columns['sentence_type'] = ['fact'] * len(texts)
+        return SentenceTable.from_columns(ANALYZED_SCHEMA, columns, AnalyzedSentence)
+    
+    def valid_mask(self, sentences: Sequence[str]) -> np.ndarray:
+        """문장별 기본 유효성 검사 결과 (bool 배열)"""
+        return np.fromiter((self._is_valid_sentence(s) for s in sentences), dtype=bool, count=len(sentences))
+    
+    def quality_mask(self, analyzed_sentences: Union[SentenceTable, List[AnalyzedSentence]],
+                     min_quality_score: float = 0.6) -> np.ndarray:
+        """품질 기준을 충족하는지 여부 (bool 배열)"""
+        if isinstance(analyzed_sentences, SentenceTable):
+            scores = analyzed_sentences.column('quality_score')
+        else:
+            scores = np.fromiter((s.quality_score for s in analyzed_sentences),
+                                 dtype=np.float64, count=len(analyzed_sentences))
+        return scores >= min_quality_score
+    
+    def filter_quality_sentences(self, analyzed_sentences: Union[SentenceTable, List[AnalyzedSentence]], 
+                               min_quality_score: float = 0.6) -> Union[SentenceTable, List[AnalyzedSentence]]:
+        """품질 기준을 충족하는 문장만 필터링 (SentenceTable을 넘기면 SentenceTable 반환)"""
+        mask = self.quality_mask(analyzed_sentences, min_quality_score)
+        if isinstance(analyzed_sentences, SentenceTable):
+            return analyzed_sentences.take(np.flatnonzero(mask))
+        return list(compress(analyzed_sentences, mask))
+    
+    def _analyze_columns(self, texts: List[str]) -> Dict[str, Any]:
+        """유효한 문장 목록의 분석 결과를 컬럼별로 계산"""
+        n = len(texts)
+        flags = self._match_flags(texts)
+        keywords = [self._extract_keywords(t) for t in texts]
+        lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=n)
+        keyword_counts = np.fromiter((len(k) for k in keywords), dtype=np.float64, count=n)
+        
+        # _calculate_structure_score와 같은 순서로 더함
+        structure = np.zeros(n, dtype=np.float64)
+        structure += np.where(flags['structure'], 0.3, 0.0)
+        structure += np.where(flags['subject'], 0.3, 0.0)
+        structure += np.where(flags['predicate'], 0.4, 0.0)
+        structure = np.minimum(1.0, structure)
+        
+        # _calculate_quality_score와 같은 순서로 더함
+        quality = np.zeros(n, dtype=np.float64)
+        quality += 0.2 * (1.0 - np.abs(50 - lengths) / 50)
+        quality += np.where(flags['statistics'], 0.2, 0.0)
+        quality += np.where(flags['example'], 0.1, 0.0)
+        quality += 0.3 * structure
+        quality += 0.2 * np.minimum(1.0, keyword_counts / 3)
+        quality = np.minimum(1.0, quality)
+        
+        return {
+            'text': texts,
+            'quality_score': quality,
+            'has_statistics': flags['statistics'],
+            'has_example': flags['example'],
+            'keywords': keywords,
+            'sentiment': np.where(flags['subjective'], 'subjective', 'objective').tolist(),
+            'length': lengths,
+            'structure_score': structure,
+        }
+    
+    def _match_flags(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """패턴별로 일치하는 문장 여부 (bool 배열)
+        
+        문장들을 줄바꿈으로 이어 붙여 패턴마다 한 번만 탐색하고,
+        일치 위치를 문장 시작 오프셋에 이진 탐색해 문장 번호로 바꾼다.
+        줄바꿈이 들어 있는 문장은 줄 단위 패턴의 의미가 달라지므로 따로 계산한다.
+        """
+        n = len(texts)
+        lengths = np.fromiter((len(t) + 1 for t in texts), dtype=np.int64, count=n)
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]) if n else np.zeros(0, dtype=np.int64)
+        buffer = '\n'.join(texts)
+        
+        flags = {}
+        for name, pattern in _LINE_PATTERNS.items():
+            positions = np.fromiter((m.start() for m in pattern.finditer(buffer)), dtype=np.int64)
+            mask = np.zeros(n, dtype=bool)
+            mask[np.searchsorted(starts, positions, side='right') - 1] = True
+            flags[name] = mask
+        
+        for i in (i for i, t in enumerate(texts) if '\n' in t):
+            text = texts[i]
+            flags['structure'][i] = any(p.match(text) for p in self.structure_patterns)
+            flags['subject'][i] = bool(SUBJECT_PATTERN.search(text))
+            flags['predicate'][i] = bool(PREDICATE_PATTERN.search(text))
+            flags['statistics'][i] = bool(STATISTIC_PATTERN.search(text))
+            flags['example'][i] = any(marker in text for marker in EXAMPLE_MARKERS)
+            flags['subjective'][i] = any(marker in text for marker in SUBJECTIVE_MARKERS)
+        return flags
+    
     def _analyze_single_sentence(self, sentence: str) -> AnalyzedSentence:
         """개별 문장 분석"""
         # 1. 기본 정보 추출
@@ -54,10 +205,10 @@ class SentenceAnalyzer:
         keywords = self._extract_keywords(sentence)
         
         # 2. 통계 포함 여부 확인
-        has_statistics = bool(re.search(r'\d+(?:[.,%]\d+)?', sentence))
+        has_statistics = bool(STATISTIC_PATTERN.search(sentence))
         
         # 3. 예시 포함 여부 확인
-        has_example = any(marker in sentence for marker in ['예를 들어', '예시', '사례'])
+        has_example = any(marker in sentence for marker in EXAMPLE_MARKERS)
         
         # 4. 문장 구조 점수 계산
         structure_score = self._calculate_structure_score(sentence)
@@ -96,21 +247,22 @@ class SentenceAnalyzer:
             return False
             
         # 문장 종결 검사
-        if not sentence[-1] in ['다', '요', '죠', '까']:
+        if not sentence[-1] in SENTENCE_ENDINGS:
             return False
             
         return True
     
     def _extract_keywords(self, sentence: str) -> List[str]:
         """문장에서 키워드 추출"""
-        # 조사 제거
-        text = re.sub(r'[은는이가을를에서의로]([ ]|$)', ' ', sentence)
+        # 조사 제거 후 2글자 이상의 명사만 선택 (공유 토큰화 캐시)
+        keywords = list(self.tokenizer.keywords(sentence))
         
-        # 단어 추출
-        words = text.split()
-        
-        # 2글자 이상의 명사만 선택
-        keywords = [w for w in words if len(w) >= 2]
+        # 말뭉치 전체에서 흔한 단어 제외 후 IDF 순으로 정렬
+        if self.keyword_engine is not None and self.keyword_engine.num_docs:
+            keywords = [w for w in keywords
+                        if self.keyword_engine.document_ratio(w) < self.max_document_ratio]
+            idf = self.keyword_engine.idf(keywords)
+            keywords = [keywords[i] for i in sorted(range(len(keywords)), key=lambda i: -idf[i])]
         
         return keywords
     
@@ -120,25 +272,23 @@ class SentenceAnalyzer:
         
         # 기본 문장 구조 패턴 매칭
         for pattern in self.structure_patterns:
-            if re.match(pattern, sentence):
+            if pattern.match(sentence):
                 score += 0.3
                 break
         
         # 주어 포함 여부
-        if re.search(r'[가-힣]+[은는이가]', sentence):
+        if SUBJECT_PATTERN.search(sentence):
             score += 0.3
             
         # 서술어 포함 여부
-        if re.search(r'[가-힣]+[다요]$', sentence):
+        if PREDICATE_PATTERN.search(sentence):
             score += 0.4
             
         return min(1.0, score)
     
     def _analyze_sentiment(self, sentence: str) -> str:
         """문장의 객관성/주관성 분석"""
-        subjective_markers = ['것 같', '보이', '생각하', '느끼']
-        
-        for marker in subjective_markers:
+        for marker in SUBJECTIVE_MARKERS:
             if marker in sentence:
                 return 'subjective'
         
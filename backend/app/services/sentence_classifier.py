@@ -1,8 +1,22 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass
-from .lm_studio_client import LMStudioClient
+import asyncio
+import json
+import logging
+import re
+from .lm_studio_client import LMStudioClient, estimate_tokens
+from .completion_cache import get_completion_cache
+from .tokenizer.tokenizer import get_tokenizer
+from .embedding_classifier import EmbeddingClassifier
+from .sentence_scorer import SentenceScorer
+from .sentence_deduplicator import SentenceDeduplicator
 
-@dataclass
+if TYPE_CHECKING:
+    from .sentence_preranker import SentencePreranker
+
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
 class ClassifiedSentence:
     text: str
     category: str  # usage, benefits, features, costs, reviews
@@ -10,10 +24,29 @@ class ClassifiedSentence:
     keywords: List[str]
     sentiment: float
     quality_score: float
+    cluster_size: int = 1  # 의미 중복 제거 시 같은 클러스터로 묶인 문장 수 (인기도)
 
 class SentenceClassifier:
-    def __init__(self):
-        self.lm_client = LMStudioClient()
+    def __init__(self, max_batch_size: int = 32, max_retries: int = 2,
+                 lm_client: Optional[LMStudioClient] = None,
+                 embedding_classifier: Optional[EmbeddingClassifier] = None,
+                 scorer: Optional[SentenceScorer] = None):
+        # AsyncLMStudioClient를 넘기면 aclassify_batch가 배치를 동시에 요청
+        # 기본 클라이언트는 공유 완성 캐시를 사용 (같은 문장을 다시 분류/분석하지 않음)
+        self.lm_client = lm_client or LMStudioClient(cache=get_completion_cache())
+        # 학습된 임베딩 분류기가 있으면 신뢰도가 낮은 문장만 LLM으로 분류
+        self.embedding_classifier = embedding_classifier
+        self.local_classified = 0
+        self.escalated = 0
+        # 품질/감성/신뢰도를 LLM 없이 일괄 계산하는 특징 기반 점수 모델
+        self.scorer = scorer or SentenceScorer()
+        self.tokenizer = get_tokenizer()
+        self.categories = ['usage', 'benefits', 'features', 'costs', 'reviews']
+        self.max_batch_size = max_batch_size  # 한 번의 요청에 담을 최대 문장 수
+        self.max_retries = max_retries  # 잘못된 항목 재요청 횟수
+        # 재요청은 캐시를 거치지 않고 이 온도로 샘플링 (온도 0이면 같은 잘못된 응답이 반복됨)
+        self.retry_temperature = 0.3
+        self.output_tokens_per_entry = 60  # 항목당 JSON 출력 토큰 추정치
         
         # 카테고리별 프롬프트
         self.category_prompts = {
@@ -41,18 +74,126 @@ reviews - 제품/서비스에 대한 사용자 후기나 평가
 
 답변:"""
         
-        response = self.lm_client._generate_response(prompt)
+        response = self.lm_client._generate_response(
+            prompt, use_cache=True, profile='classify',
+            validate=lambda text: self._parse_category(text) is not None
+        )
         if not response:
             return None
-            
-        # 응답에서 카테고리 추출
-        categories = ['usage', 'benefits', 'features', 'costs', 'reviews']
+        return self._parse_category(response)
+    
+    def _parse_category(self, response: str) -> Optional[str]:
+        """응답에서 카테고리 추출"""
         response = response.lower().strip()
-        for category in categories:
+        for category in self.categories:
             if category in response:
                 return category
         return None
     
+    def classify_candidates(self, sentences: List[str], keyword: Optional[str] = None,
+                            max_posts: int = 3,
+                            preranker: Optional['SentencePreranker'] = None,
+                            deduplicator: Optional[SentenceDeduplicator] = None) -> Dict[str, List[ClassifiedSentence]]:
+        """값싼 신호로 추린 후보 문장만 LLM으로 분류/분석해 카테고리별로 반환
+        
+        deduplicator(SentenceDeduplicator)가 같은 주장을 바꿔 말한 문장들을 대표 문장 하나로 합치고,
+        preranker(SentencePreranker)가 PostDistributor의 섹션 요구사항에 맞춰
+        카테고리별 상위 후보만 남기므로 LLM 호출 수가 후보 수로 제한된다.
+        결과는 PostDistributor.distribute_sentences()에 그대로 넘길 수 있다.
+        """
+        if deduplicator is None:
+            deduplicator = SentenceDeduplicator(scorer=self.scorer)
+        if preranker is None:
+            # sentence_preranker → post_distributor → sentence_classifier 순환 import 방지
+            from .sentence_preranker import SentencePreranker
+            preranker = SentencePreranker()
+        
+        deduplicated = deduplicator.deduplicate(sentences)
+        popularity = deduplicated.popularity()
+        ranked = preranker.select(deduplicated.sentences, keyword=keyword, max_posts=max_posts)
+        logger.info(
+            f"Deduplication and pre-ranking kept {len(ranked.sentences)}/{len(sentences)} sentences "
+            f"({len(deduplicated.sentences)} after deduplication, {ranked.reduction:.0%} fewer LLM calls)"
+        )
+        
+        classified: Dict[str, List[ClassifiedSentence]] = {category: [] for category in self.categories}
+        for result in self.classify_batch(ranked.sentences):
+            if result is not None and result.category in classified:
+                result.cluster_size = popularity.get(result.text, 1)
+                classified[result.category].append(result)
+        return classified
+    
+    def classify_sentences(self, sentences: List[str]) -> List[Optional[str]]:
+        """여러 문장을 카테고리로 분류 (임베딩 분류기 → 신뢰도가 낮으면 LLM)"""
+        if self.embedding_classifier is None or not self.embedding_classifier.is_trained:
+            return [self.classify_sentence(sentence) for sentence in sentences]
+        
+        categories, confidence = self.embedding_classifier.predict(sentences)
+        threshold = self.embedding_classifier.confidence_threshold
+        results: List[Optional[str]] = []
+        for sentence, category, score in zip(sentences, categories, confidence):
+            if score >= threshold:
+                results.append(category)
+                self.local_classified += 1
+            else:
+                results.append(self.classify_sentence(sentence))
+                self.escalated += 1
+        return results
+    
+    def cascade_stats(self) -> Dict[str, Any]:
+        """임베딩 분류기/LLM 분류 비율"""
+        total = self.local_classified + self.escalated
+        return {
+            'local': self.local_classified,
+            'escalated': self.escalated,
+            'escalation_rate': self.escalated / total if total else 0.0
+        }
+    
+    def analyze_batch(self, sentences: List[str],
+                      categories: Optional[List[Optional[str]]] = None) -> List[Optional[ClassifiedSentence]]:
+        """특징 기반 점수 모델로 여러 문장을 한 번에 분석 (문장별 LLM 호출 없음)
+        
+        categories를 넘기지 않으면 classify_sentences로 분류하며,
+        카테고리를 정하지 못한 문장은 None으로 반환한다.
+        """
+        if categories is None:
+            categories = self.classify_sentences(sentences)
+        scores = self.scorer.score(sentences)
+        
+        results: List[Optional[ClassifiedSentence]] = []
+        for i, (sentence, category) in enumerate(zip(sentences, categories)):
+            if not category:
+                results.append(None)
+                continue
+            results.append(ClassifiedSentence(
+                text=sentence,
+                category=category,
+                confidence=float(scores['confidence'][i]),
+                keywords=list(self.tokenizer.keywords(sentence)),
+                sentiment=float(scores['sentiment'][i]),
+                quality_score=float(scores['quality_score'][i])
+            ))
+        return results
+    
+    def calibrate_scorer(self, sentences: List[str], categories: List[str]) -> Dict[str, float]:
+        """표본 문장을 LLM으로 분석해 점수 모델 가중치를 보정 (선택 단계)"""
+        analyzed = [
+            self.analyze_sentence(sentence, category)
+            for sentence, category in zip(sentences, categories)
+        ]
+        analyzed = [a for a in analyzed if a is not None]
+        if not analyzed:
+            raise ValueError("No LLM analysis results for calibration")
+        
+        return self.scorer.calibrate(
+            [a.text for a in analyzed],
+            {
+                'quality_score': [a.quality_score for a in analyzed],
+                'sentiment': [a.sentiment for a in analyzed],
+                'confidence': [a.confidence for a in analyzed]
+            }
+        )
+    
     def analyze_sentence(self, sentence: str, category: str) -> ClassifiedSentence:
         """문장 상세 분석"""
         prompt = f"""다음 문장을 분석하여 JSON 형식으로 결과를 출력해주세요.
@@ -76,23 +217,22 @@ reviews - 제품/서비스에 대한 사용자 후기나 평가
 
 답변:"""
         
-        response = self.lm_client._generate_response(prompt)
+        response = self.lm_client._generate_response(
+            prompt, use_cache=True, profile='analyze',
+            validate=lambda text: re.search(r'\{.*\}', text, re.DOTALL) is not None
+        )
         if not response:
             return None
             
         # JSON 형식이 아닐 경우를 대비한 기본값
         result = {
             "confidence": 0.8,  # 기본 신뢰도
-            "keywords": [word.strip() for word in sentence.split() if len(word.strip()) > 1],  # 기본 키워드
+            "keywords": [word for word in self.tokenizer.words(sentence) if len(word) > 1],  # 기본 키워드
             "sentiment": 0.0,  # 중립
             "quality_score": 0.7  # 기본 품질 점수
         }
         
         try:
-            # JSON 응답 파싱 시도
-            import json
-            import re
-            
             # JSON 부분만 추출
             json_match = re.search(r'\{.*\}', response, re.DOTALL)
             if json_match:
@@ -108,8 +248,11 @@ reviews - 제품/서비스에 대한 사용자 후기나 평가
                     result['sentiment'] = float(parsed['sentiment'])
                 if isinstance(parsed.get('quality_score'), (int, float)):
                     result['quality_score'] = float(parsed['quality_score'])
-        except:
-            pass  # 파싱 실패 시 기본값 사용
+            else:
+                logger.warning(f"Analysis response has no JSON object: {response[:100]}")
+        except (json.JSONDecodeError, ValueError, AttributeError) as e:
+            # 파싱 실패 시 기본값 사용
+            logger.warning(f"Failed to parse analysis response: {e}")
             
         return ClassifiedSentence(
             text=sentence,
@@ -119,3 +262,203 @@ reviews - 제품/서비스에 대한 사용자 후기나 평가
             sentiment=result['sentiment'],
             quality_score=result['quality_score']
         )
+
+    def classify_batch(self, sentences: List[str]) -> List[Optional[ClassifiedSentence]]:
+        """여러 문장을 하나의 프롬프트로 분류 및 분석
+        
+        모델 컨텍스트 크기에 맞춰 배치를 나누고, 응답 JSON 배열에서 누락되거나
+        잘못된 항목만 다시 요청한다. 모든 항목이 유효한 응답만 캐시에 저장하며, 재요청은 캐시를 거치지 않고
+        retry_temperature로 샘플링한다. 재시도 후에도 실패한 문장은 문장 단위 분류로 처리한다.
+        """
+        results: List[Optional[ClassifiedSentence]] = [None] * len(sentences)
+        pending = list(range(len(sentences)))
+        
+        for attempt in range(self.max_retries + 1):
+            if not pending:
+                break
+            
+            failed = []
+            for batch in self._split_batches(sentences, pending):
+                parsed = self._classify_batch_once([sentences[i] for i in batch], retry=attempt > 0)
+                for position, index in enumerate(batch):
+                    if position in parsed:
+                        results[index] = parsed[position]
+                    else:
+                        failed.append(index)
+            pending = failed
+        
+        # 재시도 후에도 실패한 문장은 문장 단위로 처리
+        for index in pending:
+            logger.warning(f"Batch classification failed, falling back to single request: {sentences[index]}")
+            category = self.classify_sentence(sentences[index])
+            if category:
+                results[index] = self.analyze_sentence(sentences[index], category)
+        
+        return results
+    
+    def _split_batches(self, sentences: List[str], indices: List[int]) -> List[List[int]]:
+        """컨텍스트 크기에 맞게 문장 인덱스를 배치로 분할"""
+        overhead = estimate_tokens(self._build_batch_prompt([]))
+        budget = self.lm_client.context_length - overhead
+        
+        batches = []
+        current: List[int] = []
+        used = 0
+        for index in indices:
+            # 입력 문장 + 출력 JSON(키워드 포함) 토큰
+            cost = 2 * estimate_tokens(sentences[index]) + self.output_tokens_per_entry
+            if current and (used + cost > budget or len(current) >= self.max_batch_size):
+                batches.append(current)
+                current, used = [], 0
+            current.append(index)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _build_batch_prompt(self, sentences: List[str]) -> str:
+        numbered = "\n".join(f'[{i}] "{sentence}"' for i, sentence in enumerate(sentences))
+        return f"""다음 문장들을 각각 분류하고 분석하여 JSON 배열로 출력해주세요.
+
+문장 목록:
+{numbered}
+
+가능한 카테고리:
+usage - 제품/서비스의 사용 방법이나 절차를 설명
+benefits - 제품/서비스의 장점이나 이점을 설명
+features - 제품/서비스의 특징이나 기능을 설명
+costs - 제품/서비스의 가격이나 비용을 설명
+reviews - 제품/서비스에 대한 사용자 후기나 평가
+
+각 문장마다 하나의 객체를 출력하세요:
+- index: 문장 번호
+- category: 위 카테고리명 중 하나
+- confidence: 0.0~1.0
+- keywords: 핵심 키워드 배열
+- sentiment: -1.0(매우 부정)~1.0(매우 긍정)
+- quality_score: 0.0~1.0
+
+답변 형식:
+[
+    {{"index": 0, "category": "usage", "confidence": 0.9, "keywords": ["키워드1"], "sentiment": 0.2, "quality_score": 0.8}},
+    ...
+]
+
+답변:"""
+    
+    async def aclassify_batch(self, sentences: List[str]) -> List[Optional[ClassifiedSentence]]:
+        """classify_batch의 비동기 버전 (배치들을 동시에 요청)"""
+        results: List[Optional[ClassifiedSentence]] = [None] * len(sentences)
+        pending = list(range(len(sentences)))
+        
+        for attempt in range(self.max_retries + 1):
+            if not pending:
+                break
+            
+            batches = self._split_batches(sentences, pending)
+            parsed_batches = await asyncio.gather(*[
+                self._aclassify_batch_once([sentences[i] for i in batch], retry=attempt > 0) for batch in batches
+            ])
+            
+            failed = []
+            for batch, parsed in zip(batches, parsed_batches):
+                for position, index in enumerate(batch):
+                    if position in parsed:
+                        results[index] = parsed[position]
+                    else:
+                        failed.append(index)
+            pending = failed
+        
+        for index in pending:
+            logger.warning(f"Batch classification failed, falling back to single request: {sentences[index]}")
+            category = await asyncio.to_thread(self.classify_sentence, sentences[index])
+            if category:
+                results[index] = await asyncio.to_thread(self.analyze_sentence, sentences[index], category)
+        
+        return results
+    
+    def _classify_batch_once(self, sentences: List[str], retry: bool = False) -> Dict[int, ClassifiedSentence]:
+        """배치 한 번 요청하고 유효한 항목만 {배치 내 위치: 결과}로 반환"""
+        response = self.lm_client._generate_response(
+            self._build_batch_prompt(sentences), **self._batch_request_params(sentences, retry)
+        )
+        return self._parse_batch_response(response, sentences)
+    
+    async def _aclassify_batch_once(self, sentences: List[str], retry: bool = False) -> Dict[int, ClassifiedSentence]:
+        prompt = self._build_batch_prompt(sentences)
+        params = self._batch_request_params(sentences, retry)
+        if hasattr(self.lm_client, '_agenerate_response'):
+            response = await self.lm_client._agenerate_response(prompt, **params)
+        else:
+            response = await asyncio.to_thread(self.lm_client._generate_response, prompt, **params)
+        return self._parse_batch_response(response, sentences)
+    
+    def _batch_request_params(self, sentences: List[str], retry: bool) -> Dict[str, Any]:
+        """배치 요청 옵션: 모든 항목이 유효한 응답만 캐시, 재요청은 캐시 우회 + 샘플링"""
+        params = {
+            'max_tokens': self._batch_max_tokens(sentences),
+            'profile': 'classify_batch',
+            'validate': lambda text: len(self._parse_batch_response(text, sentences)) == len(sentences)
+        }
+        if retry:
+            params.update(use_cache=False, temperature=self.retry_temperature)
+        return params
+    
+    def _batch_max_tokens(self, sentences: List[str]) -> int:
+        return self.output_tokens_per_entry * len(sentences) + sum(estimate_tokens(s) for s in sentences)
+    
+    def _parse_batch_response(self, response: str, sentences: List[str]) -> Dict[int, ClassifiedSentence]:
+        """배치 응답 JSON 배열에서 유효한 항목만 추출"""
+        if not response:
+            return {}
+        
+        json_match = re.search(r'\[.*\]', response, re.DOTALL)
+        if not json_match:
+            return {}
+        try:
+            entries = json.loads(json_match.group())
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(entries, list):
+            return {}
+        
+        results = {}
+        for entry in entries:
+            parsed = self._parse_batch_entry(entry, sentences)
+            if parsed is not None:
+                position, classified = parsed
+                results.setdefault(position, classified)
+        return results
+    
+    def _parse_batch_entry(self, entry: Any, sentences: List[str]) -> Optional[tuple]:
+        """응답 항목 검증 후 (위치, ClassifiedSentence) 반환"""
+        if not isinstance(entry, dict):
+            return None
+        
+        index = entry.get('index')
+        if not isinstance(index, int) or not 0 <= index < len(sentences):
+            return None
+        
+        category = str(entry.get('category', '')).lower().strip()
+        if category not in self.categories:
+            return None
+        
+        numbers = {}
+        for field, low, high in (('confidence', 0.0, 1.0), ('sentiment', -1.0, 1.0), ('quality_score', 0.0, 1.0)):
+            value = entry.get(field)
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or not low <= value <= high:
+                return None
+            numbers[field] = float(value)
+        
+        keywords = entry.get('keywords')
+        if not isinstance(keywords, list) or not all(isinstance(k, str) for k in keywords):
+            return None
+        
+        return index, ClassifiedSentence(
+            text=sentences[index],
+            category=category,
+            confidence=numbers['confidence'],
+            keywords=keywords,
+            sentiment=numbers['sentiment'],
+            quality_score=numbers['quality_score']
+        )
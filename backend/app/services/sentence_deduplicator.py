@@ -0,0 +1,151 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+import logging
+import numpy as np
+from .embeddings.sentence_embedder import SentenceEmbedder, get_embedder
+from .sentence_scorer import SentenceScorer
+from .tokenizer.tokenizer import normalize_whitespace
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class DedupResult:
+    """의미 중복 제거 결과"""
+    indices: List[int]         # 클러스터 대표 문장의 원래 위치
+    sentences: List[str]
+    cluster_sizes: List[int]   # 대표 문장별 클러스터 크기 (인기도 신호)
+    labels: np.ndarray         # 원래 문장별 대표 문장 위치
+    comparisons: int = 0       # 실제로 계산한 유사도 쌍 수
+
+    @property
+    def reduction(self) -> float:
+        """제거된 문장 비율"""
+        return 1 - len(self.indices) / len(self.labels) if len(self.labels) else 0.0
+
+    def popularity(self) -> Dict[str, int]:
+        """대표 문장 텍스트 → 클러스터 크기"""
+        return dict(zip(self.sentences, self.cluster_sizes))
+
+class SentenceDeduplicator:
+    """임베딩 유사도로 같은 주장을 바꿔 말한 문장들을 묶고 대표 문장만 남기는 클래스
+
+    모든 쌍을 비교하지 않도록 랜덤 초평면 LSH로 후보를 블로킹한다.
+    num_bands개의 밴드마다 num_bits개의 초평면 부호로 버킷을 나누고,
+    같은 버킷 안의 문장끼리만 코사인 유사도를 계산해 threshold 이상이면 합친다 (union-find).
+    클러스터마다 품질 점수가 가장 높은 문장을 대표로 남기고 클러스터 크기를 기록한다.
+    """
+
+    def __init__(self, embedder: Optional[SentenceEmbedder] = None,
+                 scorer: Optional[SentenceScorer] = None, threshold: float = 0.9,
+                 num_bits: int = 12, num_bands: int = 8, block_size: int = 512, seed: int = 0):
+        self.embedder = embedder or get_embedder()
+        self.scorer = scorer
+        self.threshold = threshold
+        self.num_bits = num_bits      # 밴드당 초평면 수 (클수록 버킷이 작아짐)
+        self.num_bands = num_bands    # 밴드 수 (클수록 놓치는 쌍이 줄어듦)
+        self.block_size = block_size  # 큰 버킷을 나눠 계산할 행 수
+        self.seed = seed
+        self._planes: Optional[np.ndarray] = None
+
+    def deduplicate(self, sentences: Sequence[str],
+                    quality: Optional[Sequence[float]] = None) -> DedupResult:
+        """문장 목록의 의미 중복 제거 (quality가 없으면 SentenceScorer 품질 점수 사용)"""
+        n = len(sentences)
+        if not n:
+            return DedupResult([], [], [], np.zeros(0, dtype=np.int64))
+
+        parent = list(range(n))
+
+        # 1. 공백만 다른 동일 문장은 임베딩 없이 바로 합침
+        first_seen: Dict[str, int] = {}
+        unique: List[int] = []
+        for i, sentence in enumerate(sentences):
+            normalized = normalize_whitespace(sentence)
+            j = first_seen.setdefault(normalized, i)
+            if j == i:
+                unique.append(i)
+            else:
+                self._union(parent, j, i)
+
+        # 2. 나머지는 LSH 버킷 안에서만 유사도 비교
+        comparisons = 0
+        if len(unique) > 1:
+            X = self.embedder.embed_many([sentences[i] for i in unique])
+            pairs, comparisons = self._similar_pairs(X)
+            for a, b in pairs:
+                self._union(parent, unique[a], unique[b])
+
+        # 3. 클러스터별 대표 문장 선택
+        if quality is None:
+            scorer = self.scorer or SentenceScorer()
+            quality = scorer.score(sentences)['quality_score']
+        quality = np.asarray(quality, dtype=np.float64)
+
+        roots = np.fromiter((self._find(parent, i) for i in range(n)), dtype=np.int64, count=n)
+        representative: Dict[int, int] = {}
+        sizes: Dict[int, int] = {}
+        for i, root in enumerate(roots.tolist()):
+            sizes[root] = sizes.get(root, 0) + 1
+            best = representative.get(root)
+            if best is None or quality[i] > quality[best]:
+                representative[root] = i
+
+        indices = sorted(representative.values())
+        labels = np.fromiter((representative[root] for root in roots.tolist()), dtype=np.int64, count=n)
+        result = DedupResult(
+            indices=indices,
+            sentences=[sentences[i] for i in indices],
+            cluster_sizes=[sizes[roots[i]] for i in indices],
+            labels=labels,
+            comparisons=comparisons
+        )
+        logger.info(
+            f"Deduplicated {n} sentences into {len(indices)} clusters "
+            f"({comparisons} comparisons instead of {n * (n - 1) // 2})"
+        )
+        return result
+
+    def _similar_pairs(self, X: np.ndarray) -> Tuple[List[Tuple[int, int]], int]:
+        """같은 LSH 버킷에 들어간 쌍 중 유사도가 threshold 이상인 쌍과 비교 횟수"""
+        pairs: List[Tuple[int, int]] = []
+        comparisons = 0
+        weights = 1 << np.arange(self.num_bits, dtype=np.int64)
+        for band in self._hyperplanes(X.shape[1]):
+            codes = (X @ band.T > 0) @ weights
+            order = np.argsort(codes, kind='stable')
+            boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+            for bucket in np.split(order, boundaries):
+                if len(bucket) < 2:
+                    continue
+                vectors = X[bucket]
+                for start in range(0, len(bucket), self.block_size):
+                    block = vectors[start:start + self.block_size] @ vectors.T
+                    comparisons += block.size
+                    rows, cols = np.nonzero(block >= self.threshold)
+                    rows += start
+                    upper = rows < cols
+                    pairs.extend(zip(bucket[rows[upper]].tolist(), bucket[cols[upper]].tolist()))
+        return pairs, comparisons
+
+    def _hyperplanes(self, dim: int) -> np.ndarray:
+        """(밴드 × 비트 × 차원) 랜덤 초평면 (같은 seed면 항상 같은 버킷)"""
+        if self._planes is None or self._planes.shape[2] != dim:
+            rng = np.random.default_rng(self.seed)
+            self._planes = rng.standard_normal((self.num_bands, self.num_bits, dim)).astype(np.float32)
+        return self._planes
+
+    @staticmethod
+    def _find(parent: List[int], i: int) -> int:
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    @classmethod
+    def _union(cls, parent: List[int], a: int, b: int) -> None:
+        root_a, root_b = cls._find(parent, a), cls._find(parent, b)
+        if root_a != root_b:
+            # 앞쪽 위치를 루트로 유지
+            parent[max(root_a, root_b)] = min(root_a, root_b)
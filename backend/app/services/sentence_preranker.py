@@ -0,0 +1,166 @@
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+import re
+import numpy as np
+from .keyword_engine.keyword_engine import KeywordEngine
+from .post_distributor import PostDistributor
+from .sentence_analyzer.sentence_analyzer import SentenceAnalyzer
+from .tokenizer.tokenizer import get_tokenizer, normalize_whitespace, is_near_duplicate
+
+# 카테고리 추정용 단서 표현 (LLM 분류 전 사전 확률 계산에만 사용)
+CATEGORY_CUES = {
+    'usage': re.compile(r'방법|절차|신청|등록|가입|시작|하는 법|단계|준비'),
+    'benefits': re.compile(r'장점|혜택|이점|좋|유리|보장|안정|자유'),
+    'features': re.compile(r'특징|기능|제공|지원|시스템|서비스|구성|방식'),
+    'costs': re.compile(r'비용|가격|수수료|요금|\d+\s*(?:만\s*)?원|수입|수익|월급|단가'),
+    'reviews': re.compile(r'후기|경험|해보니|느꼈|만족|솔직|직접|추천'),
+}
+
+@dataclass
+class PrerankResult:
+    """사전 순위 결과"""
+    indices: List[int]                     # 선택된 문장의 원래 위치 (카테고리를 번갈아 고른 순서)
+    sentences: List[str]
+    candidates: int                        # 유효성 검사를 통과한 문장 수
+    budget: Dict[str, int] = field(default_factory=dict)
+    by_category: Dict[str, List[int]] = field(default_factory=dict)
+
+    @property
+    def reduction(self) -> float:
+        """LLM 단계로 보내지 않게 된 후보 비율"""
+        return 1 - len(self.indices) / self.candidates if self.candidates else 0.0
+
+class SentencePreranker:
+    """LLM 분류/분석 전에 값싼 신호로 문장을 추려내는 단계
+
+    점수 = quality_weight × SentenceAnalyzer 품질 점수
+         + relevance_weight × 키워드 관련도 (KeywordEngine BM25 또는 키워드 겹침)
+         + prior_weight × 카테고리 단서 기반 사전 확률
+    카테고리마다 단서 표현상 그 카테고리에 속하는 문장과 나머지 문장을 각각 점수 순으로 줄 세우고,
+    먼저 소속 문장만으로, 이어서 나머지 문장으로 카테고리를 번갈아 한 문장씩
+    PostDistributor.candidate_budget()까지 채운다. 앞 카테고리가 다른 카테고리의 상위 문장을
+    가져가지 않도록 하기 위함이며, 같은 문장이나 키워드 집합이 거의 같은 문장은 하나만 남긴다.
+    """
+
+    def __init__(self, distributor: Optional[PostDistributor] = None,
+                 analyzer: Optional[SentenceAnalyzer] = None,
+                 keyword_engine: Optional[KeywordEngine] = None,
+                 quality_weight: float = 0.5, relevance_weight: float = 0.3,
+                 prior_weight: float = 0.2, dedup_threshold: float = 0.8):
+        self.distributor = distributor or PostDistributor()
+        self.analyzer = analyzer or SentenceAnalyzer(keyword_engine=keyword_engine)
+        self.keyword_engine = keyword_engine
+        self.tokenizer = get_tokenizer()
+        self.quality_weight = quality_weight
+        self.relevance_weight = relevance_weight
+        self.prior_weight = prior_weight
+        self.dedup_threshold = dedup_threshold
+
+    def select(self, sentences: Sequence[str], keyword: Optional[str] = None,
+               max_posts: int = 3, safety_factor: float = 3.0) -> PrerankResult:
+        """카테고리별 상위 K개 문장 선택"""
+        budget = self.distributor.candidate_budget(max_posts, safety_factor)
+        categories = list(budget)
+
+        analyzed = {a.text: a for a in self.analyzer.analyze_sentences(list(sentences))}
+        valid = [i for i, s in enumerate(sentences) if s in analyzed]
+        if not valid:
+            return PrerankResult([], [], 0, budget)
+
+        texts = [sentences[i] for i in valid]
+        quality = np.fromiter((analyzed[t].quality_score for t in texts), dtype=np.float64, count=len(texts))
+        relevance = self.relevance(texts, keyword)
+        priors = self.category_priors(texts, categories)
+        base = self.quality_weight * quality + self.relevance_weight * relevance
+        scores = base[:, np.newaxis] + self.prior_weight * priors  # (문장 × 카테고리)
+
+        rankings = self.rank_by_category(scores, priors)
+
+        selected: List[int] = []
+        selected_set = set()
+        seen_texts = set()
+        selected_keywords: List[frozenset] = []
+        by_category: Dict[str, List[int]] = {category: [] for category in categories}
+        # 1단계는 소속 문장, 2단계는 나머지 문장으로 카테고리를 번갈아 한 문장씩 고르며,
+        # 이미 다른 카테고리 몫으로 뽑힌 문장은 건너뜀
+        for stage in range(2):
+            cursors = [0] * len(categories)
+            open_categories = [k for k, category in enumerate(categories)
+                               if len(by_category[category]) < budget[category]]
+            while open_categories:
+                for k in list(open_categories):
+                    category = categories[k]
+                    ranking = rankings[k][stage]
+                    while cursors[k] < len(ranking):
+                        position = ranking[cursors[k]]
+                        cursors[k] += 1
+                        index = valid[position]
+                        if index in selected_set:
+                            continue
+                        normalized = normalize_whitespace(texts[position])
+                        if normalized in seen_texts:
+                            continue
+                        terms = frozenset(self.tokenizer.keywords(normalized))
+                        if is_near_duplicate(terms, selected_keywords, self.dedup_threshold):
+                            continue
+
+                        seen_texts.add(normalized)
+                        selected_keywords.append(terms)
+                        selected_set.add(index)
+                        selected.append(index)
+                        by_category[category].append(index)
+                        break
+                    if len(by_category[category]) >= budget[category] or cursors[k] >= len(ranking):
+                        open_categories.remove(k)
+
+        return PrerankResult(
+            indices=selected,
+            sentences=[sentences[i] for i in selected],
+            candidates=len(valid),
+            budget=budget,
+            by_category=by_category
+        )
+
+    def relevance(self, texts: List[str], keyword: Optional[str]) -> np.ndarray:
+        """키워드 관련도 (0~1로 정규화)"""
+        if not keyword:
+            return np.zeros(len(texts), dtype=np.float64)
+
+        if self.keyword_engine is not None and self.keyword_engine.num_docs:
+            scores = np.asarray(self.keyword_engine.rank_sentences(texts, keyword), dtype=np.float64)
+        else:
+            query = set(self.tokenizer.keywords(keyword))
+            if not query:
+                return np.zeros(len(texts), dtype=np.float64)
+            scores = np.fromiter(
+                (len(query & set(self.tokenizer.keywords(t))) / len(query) for t in texts),
+                dtype=np.float64, count=len(texts)
+            )
+        peak = scores.max() if len(scores) else 0.0
+        return scores / peak if peak > 0 else scores
+
+    @staticmethod
+    def rank_by_category(scores: np.ndarray, priors: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """카테고리별 (소속 문장, 나머지 문장) 위치를 각각 점수 순으로 반환
+
+        소속 문장은 사전 확률이 가장 높은 카테고리가 그 카테고리인 문장이며,
+        단서가 하나도 없는 문장(균등 사전 확률)은 어느 카테고리에도 소속되지 않는다.
+        """
+        home = np.argmax(priors, axis=1)
+        cued = priors.max(axis=1) > priors.min(axis=1)
+        rankings = []
+        for k in range(scores.shape[1]):
+            order = np.argsort(-scores[:, k], kind='stable')
+            member = (cued & (home == k))[order]
+            rankings.append((order[member], order[~member]))
+        return rankings
+
+    def category_priors(self, texts: List[str], categories: List[str]) -> np.ndarray:
+        """(문장 × 카테고리) 단서 표현 기반 사전 확률 (단서가 없으면 균등)"""
+        counts = np.zeros((len(texts), len(categories)), dtype=np.float64)
+        for k, category in enumerate(categories):
+            pattern = CATEGORY_CUES.get(category)
+            if pattern is not None:
+                counts[:, k] = [len(pattern.findall(t)) for t in texts]
+        counts += 0.5  # 평활화
+        return counts / counts.sum(axis=1, keepdims=True)
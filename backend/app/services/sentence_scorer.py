@@ -0,0 +1,169 @@
+from typing import Dict, Any, Optional, Sequence
+import logging
+import os
+import re
+import numpy as np
+from .sentence_analyzer.sentence_analyzer import SentenceAnalyzer, STATISTIC_PATTERN
+from .tokenizer.tokenizer import get_tokenizer
+
+logger = logging.getLogger(__name__)
+
+NUMBER_PATTERN = re.compile(r'\d+(?:[.,]\d+)?')
+EXAMPLE_PATTERN = re.compile(r'예를 들어|예시|사례')
+SUBJECTIVE_PATTERN = re.compile(r'것 같|보이|생각하|느끼')
+# spaCy NER 대신 쓰는 간이 개체 패턴 (금액/비율/날짜/기관명/따옴표 고유명사)
+ENTITY_PATTERN = re.compile(
+    r'\d+(?:[.,]\d+)?\s*(?:%|원|만원|억원?|조원?)'
+    r'|\d{2,4}년(?:\s*\d{1,2}월)?(?:\s*\d{1,2}일)?'
+    r'|[가-힣A-Za-z]+(?:공사|협회|부|청|처|센터|연구원|은행|그룹|주식회사|\(주\))'
+    r'|["“][^"”]{2,20}["”]'
+)
+POSITIVE_PATTERN = re.compile(r'좋|만족|추천|편리|안정|쉽|혜택|장점|유리|높은 수입|효과|성공')
+NEGATIVE_PATTERN = re.compile(r'힘들|불만|어렵|단점|문제|위험|사기|불법|손해|부족|비싸|피해|실패')
+# 광고성 문구 (keyword_crawler의 품질 점수와 같은 기준)
+AD_PATTERNS = [
+    re.compile(r'문의|상담|예약|신청|클릭|링크|할인|이벤트|프로모션'),
+    re.compile(r'무료|공짜|특가|세일|쿠폰|적립|마감|한정'),
+    re.compile(r'(?:광고|제휴|후원).*(?:포함|기사|내용)'),
+]
+
+FEATURE_NAMES = [
+    'bias', 'length_score', 'has_statistics', 'number_count', 'entity_count',
+    'structure_score', 'has_example', 'keyword_score', 'subjective',
+    'positive_hits', 'negative_hits', 'ad_hits'
+]
+
+# 출력별 값 범위
+TARGET_RANGES = {
+    'quality_score': (0.0, 1.0),
+    'sentiment': (-1.0, 1.0),
+    'confidence': (0.0, 1.0),
+}
+
+def _default_weights() -> Dict[str, np.ndarray]:
+    """LLM 보정 전 기본 가중치 (SentenceAnalyzer의 품질 점수 공식 + 감성 사전)"""
+    index = {name: i for i, name in enumerate(FEATURE_NAMES)}
+    weights = {target: np.zeros(len(FEATURE_NAMES), dtype=np.float64) for target in TARGET_RANGES}
+
+    quality = weights['quality_score']
+    quality[index['length_score']] = 0.2
+    quality[index['has_statistics']] = 0.2
+    quality[index['has_example']] = 0.1
+    quality[index['structure_score']] = 0.3
+    quality[index['keyword_score']] = 0.2
+    quality[index['ad_hits']] = -0.15
+
+    sentiment = weights['sentiment']
+    sentiment[index['positive_hits']] = 0.3
+    sentiment[index['negative_hits']] = -0.3
+
+    confidence = weights['confidence']
+    confidence[index['bias']] = 0.5
+    confidence[index['structure_score']] = 0.3
+    confidence[index['entity_count']] = 0.05
+    confidence[index['ad_hits']] = -0.1
+    return weights
+
+class SentenceScorer:
+    """문장 묶음의 특징 행렬로 품질/감성/신뢰도를 한 번에 계산하는 선형 모델
+
+    특징: 길이, 통계 포함, 숫자/개체 수, SentenceAnalyzer 구조 점수, 예시 표현,
+    키워드 수, 주관 표현, 긍/부정 사전 매칭 수, 광고성 문구 매칭 수.
+    각 출력은 (문장 × 특징) 행렬과 가중치 벡터의 곱을 범위에 맞게 자른 값이다.
+    calibrate()로 LLM 분석 결과에 맞춰 가중치를 다시 추정할 수 있다 (ridge 회귀).
+    """
+
+    def __init__(self, analyzer: Optional[SentenceAnalyzer] = None,
+                 weights: Optional[Dict[str, np.ndarray]] = None, nlp: Any = None):
+        self.analyzer = analyzer or SentenceAnalyzer()
+        self.tokenizer = get_tokenizer()
+        self.weights = weights or _default_weights()
+        self.nlp = nlp  # spaCy 모델을 넘기면 개체 수를 NER로 계산
+
+    def features(self, sentences: Sequence[str]) -> np.ndarray:
+        """(문장 수 × 특징 수) 특징 행렬"""
+        n = len(sentences)
+        X = np.zeros((n, len(FEATURE_NAMES)), dtype=np.float64)
+        if not n:
+            return X
+
+        lengths = np.fromiter((len(s) for s in sentences), dtype=np.float64, count=n)
+        keyword_counts = np.fromiter((len(self.tokenizer.keywords(s)) for s in sentences),
+                                     dtype=np.float64, count=n)
+
+        columns = {
+            'bias': np.ones(n),
+            'length_score': 1.0 - np.abs(50 - lengths) / 50,  # 50자 기준
+            'has_statistics': self._matches(STATISTIC_PATTERN, sentences) > 0,
+            'number_count': np.minimum(self._matches(NUMBER_PATTERN, sentences), 5) / 5,
+            'entity_count': np.minimum(self._entity_counts(sentences), 5),
+            'structure_score': np.fromiter(
+                (self.analyzer._calculate_structure_score(s) for s in sentences), dtype=np.float64, count=n
+            ),
+            'has_example': self._matches(EXAMPLE_PATTERN, sentences) > 0,
+            'keyword_score': np.minimum(keyword_counts / 3, 1.0),  # 3개 키워드 기준
+            'subjective': self._matches(SUBJECTIVE_PATTERN, sentences) > 0,
+            'positive_hits': np.minimum(self._matches(POSITIVE_PATTERN, sentences), 3),
+            'negative_hits': np.minimum(self._matches(NEGATIVE_PATTERN, sentences), 3),
+            'ad_hits': sum(self._matches(pattern, sentences) > 0 for pattern in AD_PATTERNS),
+        }
+        for i, name in enumerate(FEATURE_NAMES):
+            X[:, i] = columns[name]
+        return X
+
+    def score(self, sentences: Sequence[str]) -> Dict[str, np.ndarray]:
+        """출력별 점수 배열 {'quality_score', 'sentiment', 'confidence'}"""
+        return self.predict(self.features(sentences))
+
+    def predict(self, X: np.ndarray) -> Dict[str, np.ndarray]:
+        return {
+            target: np.clip(X @ self.weights[target], low, high)
+            for target, (low, high) in TARGET_RANGES.items()
+        }
+
+    def calibrate(self, sentences: Sequence[str], targets: Dict[str, Sequence[float]],
+                  l2: float = 1e-2) -> Dict[str, float]:
+        """LLM 분석 결과에 맞춰 가중치 재추정, 출력별 평균 절대 오차 반환"""
+        X = self.features(sentences)
+        errors = {}
+        regularizer = l2 * np.eye(X.shape[1])
+        regularizer[0, 0] = 0.0  # 편향은 정규화하지 않음
+        for target, values in targets.items():
+            if target not in TARGET_RANGES:
+                raise ValueError(f"Unknown score target: {target}")
+            y = np.asarray(values, dtype=np.float64)
+            self.weights[target] = np.linalg.solve(X.T @ X + regularizer, X.T @ y)
+            low, high = TARGET_RANGES[target]
+            errors[target] = float(np.abs(np.clip(X @ self.weights[target], low, high) - y).mean())
+        logger.info(f"Calibrated sentence scorer on {len(sentences)} sentences: {errors}")
+        return errors
+
+    def save(self, path: str = None) -> str:
+        path = path or self.default_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez(path, feature_names=np.array(FEATURE_NAMES), **self.weights)
+        return path
+
+    @classmethod
+    def load(cls, path: str = None, analyzer: Optional[SentenceAnalyzer] = None) -> 'SentenceScorer':
+        path = path or cls.default_path()
+        with np.load(path) as data:
+            if list(data['feature_names']) != FEATURE_NAMES:
+                raise ValueError("Saved scorer was trained with different features")
+            weights = {target: data[target] for target in TARGET_RANGES}
+        return cls(analyzer=analyzer, weights=weights)
+
+    @staticmethod
+    def default_path() -> str:
+        return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'models', 'sentence_scorer.npz')
+
+    def _entity_counts(self, sentences: Sequence[str]) -> np.ndarray:
+        if self.nlp is not None:
+            return np.fromiter((len(doc.ents) for doc in self.nlp.pipe(sentences)),
+                               dtype=np.float64, count=len(sentences))
+        return self._matches(ENTITY_PATTERN, sentences)
+
+    @staticmethod
+    def _matches(pattern: 're.Pattern', sentences: Sequence[str]) -> np.ndarray:
+        return np.fromiter((len(pattern.findall(s)) for s in sentences),
+                           dtype=np.float64, count=len(sentences))
@@ -1,10 +1,13 @@
 import json
+import logging
 import os
 from datetime import datetime
 from typing import Dict, List
 from dataclasses import asdict
 from .sentence_classifier import ClassifiedSentence
 
+logger = logging.getLogger(__name__)
+
 class SentenceStorage:
     def __init__(self, base_dir: str = None):
         if base_dir is None:
@@ -51,8 +54,31 @@ class SentenceStorage:
                     confidence=sent['confidence'],
                     keywords=sent['keywords'],
                     sentiment=sent['sentiment'],
-                    quality_score=sent['quality_score']
+                    quality_score=sent['quality_score'],
+                    cluster_size=sent.get('cluster_size', 1)
                 ) for sent in sentences
             ]
         
         return classified_data
+    
+    def load_all_classified(self) -> List[ClassifiedSentence]:
+        """저장된 모든 분류 결과를 하나의 목록으로 로드 (임베딩 분류기 학습용)"""
+        sentences = []
+        seen = set()
+        for filename in sorted(os.listdir(self.classified_dir), reverse=True):  # 최신 파일부터
+            if not filename.endswith('.json'):
+                continue
+            try:
+                classified_data = self.load_classified_sentences(os.path.join(self.classified_dir, filename))
+            except (OSError, json.JSONDecodeError, KeyError) as e:
+                logger.error(f"Error loading {filename}: {e}")
+                continue
+            
+            for category_sentences in classified_data.values():
+                for sentence in category_sentences:
+                    # 같은 문장은 가장 최근 파일의 결과만 사용
+                    if sentence.text in seen:
+                        continue
+                    seen.add(sentence.text)
+                    sentences.append(sentence)
+        return sentences
@@ -0,0 +1,3 @@
+from .sentence_table import SentenceTable, SentenceRow, infer_schema
+
+__all__ = ['SentenceTable', 'SentenceRow', 'infer_schema']
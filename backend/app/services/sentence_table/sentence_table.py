@@ -0,0 +1,322 @@
+from typing import Dict, List, Any, Optional, Sequence, Iterator, Union, get_type_hints
+from dataclasses import fields, is_dataclass
+import sys
+import numpy as np
+
+# 컬럼 종류별 NumPy 자료형
+COLUMN_DTYPES = {
+    'float': np.float64,
+    'int': np.int32,
+    'bool': np.bool_,
+    'category': np.uint16,
+}
+
+def infer_schema(record_type: type) -> Dict[str, str]:
+    """데이터클래스 필드 타입으로부터 컬럼 스키마 추론
+
+    text 필드는 공유 텍스트 버퍼, List[str] 필드는 키워드 ID 목록,
+    그 외 str 필드는 범주형 코드로 저장한다.
+    """
+    schema = {}
+    hints = get_type_hints(record_type)
+    for field in fields(record_type):
+        hint = hints[field.name]
+        if field.name == 'text':
+            schema[field.name] = 'text'
+        elif hint is bool:
+            schema[field.name] = 'bool'
+        elif hint is int:
+            schema[field.name] = 'int'
+        elif hint is float:
+            schema[field.name] = 'float'
+        elif hint is str:
+            schema[field.name] = 'category'
+        elif getattr(hint, '__origin__', None) is list:
+            schema[field.name] = 'keywords'
+        else:
+            raise TypeError(f"Unsupported column type for {field.name}: {hint}")
+    return schema
+
+class SentenceRow:
+    """SentenceTable의 한 행을 기존 데이터클래스처럼 속성으로 접근하게 해주는 뷰"""
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: 'SentenceTable', index: int):
+        object.__setattr__(self, '_table', table)
+        object.__setattr__(self, '_index', index)
+
+    def __getattr__(self, name: str) -> Any:
+        return self._table.value(self._index, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._table.set_value(self._index, name, value)
+
+    def to_record(self) -> Any:
+        """원래 데이터클래스 객체로 변환"""
+        return self._table.record(self._index)
+
+    def __repr__(self) -> str:
+        return f"SentenceRow({self._index}, text={self.text!r})"
+
+class SentenceTable:
+    """문장 레코드를 컬럼 단위로 저장하는 테이블
+
+    - 텍스트: 하나의 문자열 버퍼 + 오프셋 배열
+    - 키워드: 인터닝된 어휘 ID 배열 + 행별 오프셋 (CSR 형태)
+    - 점수/길이/플래그: NumPy 배열
+    - 문자열 범주(sentiment, category 등): 코드 배열 + 범주 목록
+
+    행은 SentenceRow로 반환되어 AnalyzedSentence/ClassifiedSentence와 같은
+    속성 이름(text, quality_score, keywords ...)으로 접근할 수 있다.
+    extend()로 추가된 텍스트와 배열 조각은 모아뒀다가 처음 읽을 때 컬럼마다 한 번에 이어 붙이므로,
+    여러 번 나눠 추가해도 기존 배열을 매번 복사하지 않는다.
+    """
+
+    def __init__(self, schema: Dict[str, str], record_type: Optional[type] = None):
+        self.schema = schema
+        self.record_type = record_type
+        self.vocabulary: List[str] = []
+        self._vocab_ids: Dict[str, int] = {}
+        self.categories: Dict[str, List[str]] = {
+            name: [] for name, kind in schema.items() if kind == 'category'
+        }
+        self._category_ids: Dict[str, Dict[str, int]] = {name: {} for name in self.categories}
+
+        self._length = 0
+        self._text_buffer = ''
+        self._text_chunks: List[str] = []  # 아직 버퍼에 붙이지 않은 텍스트 조각
+        self._text_offsets = np.zeros(1, dtype=np.int64)
+        self._text_end = 0
+        self._keyword_ids: Dict[str, np.ndarray] = {}
+        self._keyword_offsets: Dict[str, np.ndarray] = {}
+        self._keyword_end: Dict[str, int] = {}
+        self._columns: Dict[str, np.ndarray] = {}
+        # 아직 이어 붙이지 않은 배열 조각 (키: 배열 이름)
+        self._pending: Dict[Any, List[np.ndarray]] = {}
+
+        for name, kind in schema.items():
+            if kind == 'keywords':
+                self._keyword_ids[name] = np.empty(0, dtype=np.int32)
+                self._keyword_offsets[name] = np.zeros(1, dtype=np.int64)
+                self._keyword_end[name] = 0
+            elif kind != 'text':
+                self._columns[name] = np.empty(0, dtype=COLUMN_DTYPES[kind])
+
+    @classmethod
+    def from_records(cls, records: Sequence[Any], schema: Optional[Dict[str, str]] = None) -> 'SentenceTable':
+        """데이터클래스 레코드 목록으로 테이블 생성"""
+        record_type = type(records[0]) if records else None
+        if schema is None:
+            if record_type is None or not is_dataclass(record_type):
+                raise ValueError("schema is required for empty or non-dataclass records")
+            schema = infer_schema(record_type)
+
+        columns = {name: [getattr(r, name) for r in records] for name in schema}
+        return cls.from_columns(schema, columns, record_type)
+
+    @classmethod
+    def from_columns(cls, schema: Dict[str, str], columns: Dict[str, Any],
+                     record_type: Optional[type] = None) -> 'SentenceTable':
+        """컬럼 값(리스트 또는 배열)으로 테이블 생성"""
+        table = cls(schema, record_type)
+        table._extend_columns(columns)
+        return table
+
+    def extend(self, records: Sequence[Any]) -> None:
+        """레코드 추가"""
+        if records:
+            self._extend_columns({name: [getattr(r, name) for r in records] for name in self.schema})
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[SentenceRow]:
+        for i in range(len(self)):
+            yield SentenceRow(self, i)
+
+    def __getitem__(self, key: Union[int, slice, np.ndarray, List[int]]) -> Union[SentenceRow, 'SentenceTable']:
+        if isinstance(key, (int, np.integer)):
+            index = int(key)
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(key)
+            return SentenceRow(self, index)
+        return self.take(np.arange(len(self))[key])
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        """숫자/불리언/범주 코드 컬럼 배열들"""
+        self._flush()
+        return self._columns
+
+    def column(self, name: str) -> np.ndarray:
+        """숫자/불리언/범주 코드 컬럼 배열"""
+        return self.columns[name]
+
+    def texts(self) -> List[str]:
+        """모든 문장 텍스트"""
+        buffer = self._text()
+        offsets = self._text_offsets
+        return [buffer[offsets[i]:offsets[i + 1]] for i in range(len(self))]
+
+    def value(self, index: int, name: str) -> Any:
+        """한 셀의 값을 파이썬 객체로 반환"""
+        kind = self.schema.get(name)
+        if kind is None:
+            raise AttributeError(name)
+        if kind == 'text':
+            buffer = self._text()
+            return buffer[self._text_offsets[index]:self._text_offsets[index + 1]]
+        if kind == 'keywords':
+            return self.keywords(index, name)
+        if kind == 'category':
+            return self.categories[name][self.columns[name][index]]
+        return self.columns[name][index].item()
+
+    def set_value(self, index: int, name: str, value: Any) -> None:
+        """숫자/범주 셀 값 변경 (텍스트와 키워드는 변경 불가)"""
+        kind = self.schema.get(name)
+        if kind in ('text', 'keywords') or kind is None:
+            raise AttributeError(f"Column {name} is read-only")
+        if kind == 'category':
+            value = self._encode_category(name, value)
+        self.columns[name][index] = value
+
+    def keywords(self, index: int, name: str = 'keywords') -> List[str]:
+        """한 행의 키워드 목록"""
+        self._flush()
+        offsets = self._keyword_offsets[name]
+        ids = self._keyword_ids[name][offsets[index]:offsets[index + 1]]
+        return [self.vocabulary[i] for i in ids]
+
+    def keyword_ids(self, name: str = 'keywords') -> tuple:
+        """(키워드 ID 배열, 행별 오프셋 배열) - 희소 행렬 구성용"""
+        self._flush()
+        return self._keyword_ids[name], self._keyword_offsets[name]
+
+    def record(self, index: int) -> Any:
+        """한 행을 원래 데이터클래스 객체로 변환"""
+        if self.record_type is None:
+            raise ValueError("record_type is not set")
+        return self.record_type(**{name: self.value(index, name) for name in self.schema})
+
+    def to_records(self) -> List[Any]:
+        return [self.record(i) for i in range(len(self))]
+
+    def take(self, indices: np.ndarray) -> 'SentenceTable':
+        """지정한 행만 담은 새 테이블 (어휘/범주 목록은 공유)"""
+        indices = np.asarray(indices, dtype=np.int64)
+        self._flush()
+        table = SentenceTable(self.schema, self.record_type)
+        table.vocabulary = self.vocabulary
+        table._vocab_ids = self._vocab_ids
+        table.categories = self.categories
+        table._category_ids = self._category_ids
+
+        texts = self.texts()
+        selected = [texts[i] for i in indices]
+        table._length = len(selected)
+        table._text_buffer = ''.join(selected)
+        table._text_offsets = np.concatenate(
+            [[0], np.cumsum([len(t) for t in selected], dtype=np.int64)]
+        ).astype(np.int64)
+        table._text_end = int(table._text_offsets[-1])
+
+        for name in self._keyword_ids:
+            offsets = self._keyword_offsets[name]
+            starts, ends = offsets[indices], offsets[indices + 1]
+            lengths = ends - starts
+            table._keyword_offsets[name] = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+            if lengths.sum():
+                gather = np.concatenate([np.arange(s, e) for s, e in zip(starts, ends)])
+            else:
+                gather = np.empty(0, dtype=np.int64)
+            table._keyword_ids[name] = self._keyword_ids[name][gather]
+            table._keyword_end[name] = int(table._keyword_offsets[name][-1])
+
+        table._columns = {name: column[indices] for name, column in self._columns.items()}
+        return table
+
+    @property
+    def nbytes(self) -> int:
+        """대략적인 메모리 사용량 (바이트)"""
+        total = sys.getsizeof(self._text()) + self._text_offsets.nbytes
+        total += sum(a.nbytes for a in self._keyword_ids.values())
+        total += sum(a.nbytes for a in self._keyword_offsets.values())
+        total += sum(a.nbytes for a in self.columns.values())
+        return total
+
+    def _extend_columns(self, columns: Dict[str, Any]) -> None:
+        for name, kind in self.schema.items():
+            values = columns[name]
+            if kind == 'text':
+                self._append_texts(values)
+            elif kind == 'keywords':
+                self._append_keywords(name, values)
+            elif kind == 'category':
+                codes = np.fromiter((self._encode_category(name, v) for v in values),
+                                    dtype=COLUMN_DTYPES[kind], count=len(values))
+                self._pending.setdefault(('column', name), []).append(codes)
+            else:
+                array = np.asarray(values, dtype=COLUMN_DTYPES[kind])
+                self._pending.setdefault(('column', name), []).append(array)
+        self._length += len(next(iter(columns.values()), ()))
+
+    def _append_texts(self, texts: Sequence[str]) -> None:
+        lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+        ends = self._text_end + np.cumsum(lengths)
+        if len(ends):
+            self._text_end = int(ends[-1])
+        self._pending.setdefault(('text_offsets', None), []).append(ends)
+        self._text_chunks.extend(texts)
+
+    def _text(self) -> str:
+        """텍스트 버퍼 (쌓인 조각이 있으면 한 번에 이어 붙임)"""
+        if self._text_chunks:
+            self._text_buffer = ''.join([self._text_buffer] + self._text_chunks)
+            self._text_chunks = []
+        self._flush()
+        return self._text_buffer
+
+    def _append_keywords(self, name: str, keyword_lists: Sequence[Sequence[str]]) -> None:
+        ids = np.fromiter((self._encode_keyword(k) for keywords in keyword_lists for k in keywords),
+                          dtype=np.int32)
+        lengths = np.fromiter((len(k) for k in keyword_lists), dtype=np.int64, count=len(keyword_lists))
+        ends = self._keyword_end[name] + np.cumsum(lengths)
+        if len(ends):
+            self._keyword_end[name] = int(ends[-1])
+        self._pending.setdefault(('keyword_offsets', name), []).append(ends)
+        self._pending.setdefault(('keyword_ids', name), []).append(ids)
+
+    def _flush(self) -> None:
+        """쌓인 배열 조각을 배열마다 한 번의 concatenate로 이어 붙임"""
+        if not self._pending:
+            return
+        for (kind, name), chunks in self._pending.items():
+            if kind == 'column':
+                self._columns[name] = np.concatenate([self._columns[name]] + chunks)
+            elif kind == 'text_offsets':
+                self._text_offsets = np.concatenate([self._text_offsets] + chunks)
+            elif kind == 'keyword_offsets':
+                self._keyword_offsets[name] = np.concatenate([self._keyword_offsets[name]] + chunks)
+            else:
+                self._keyword_ids[name] = np.concatenate([self._keyword_ids[name]] + chunks)
+        self._pending = {}
+
+    def _encode_keyword(self, keyword: str) -> int:
+        keyword_id = self._vocab_ids.get(keyword)
+        if keyword_id is None:
+            keyword_id = len(self.vocabulary)
+            self._vocab_ids[keyword] = keyword_id
+            self.vocabulary.append(sys.intern(keyword))
+        return keyword_id
+
+    def _encode_category(self, name: str, value: str) -> int:
+        ids = self._category_ids[name]
+        code = ids.get(value)
+        if code is None:
+            code = len(self.categories[name])
+            ids[value] = code
+            self.categories[name].append(value)
+        return code
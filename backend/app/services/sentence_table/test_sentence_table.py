@@ -0,0 +1,80 @@
+import unittest
+from dataclasses import dataclass
+from typing import List
+import numpy as np
+from .sentence_table import SentenceTable, infer_schema
+
+@dataclass
+class _Record:
+    text: str
+    category: str
+    keywords: List[str]
+    quality_score: float
+    length: int
+    is_valid: bool
+
+def make_records(count, offset=0):
+    return [
+        _Record(text=f"문장 {i}", category=['usage', 'costs'][i % 2], keywords=[f"키워드{i % 3}", "공통"][:1 + i % 2],
+                quality_score=i / 10, length=len(f"문장 {i}"), is_valid=i % 3 != 0)
+        for i in range(offset, offset + count)
+    ]
+
+class TestSentenceTable(unittest.TestCase):
+    def test_infer_schema(self):
+        self.assertEqual(infer_schema(_Record), {
+            'text': 'text', 'category': 'category', 'keywords': 'keywords',
+            'quality_score': 'float', 'length': 'int', 'is_valid': 'bool'
+        })
+
+    def test_round_trip(self):
+        records = make_records(5)
+        table = SentenceTable.from_records(records)
+        self.assertEqual(len(table), 5)
+        self.assertEqual(table.to_records(), records)
+        self.assertEqual(table[1].keywords, ["키워드1", "공통"])
+        self.assertEqual(table[-1].category, 'usage')
+        self.assertEqual(table.column('length').dtype, np.int32)
+        self.assertEqual(table.categories['category'], ['usage', 'costs'])
+
+    def test_extend_in_many_small_batches(self):
+        table = SentenceTable.from_records(make_records(1))
+        for start in range(1, 200):
+            table.extend(make_records(1, offset=start))
+            if start % 50 == 0:
+                self.assertEqual(table[start].text, f"문장 {start}")
+        self.assertEqual(table.texts(), [f"문장 {i}" for i in range(200)])
+        self.assertEqual(table.to_records(), make_records(200))
+
+    def test_extend_defers_concatenation_until_read(self):
+        table = SentenceTable.from_records(make_records(2))
+        table.column('quality_score')
+        for start in range(2, 12, 2):
+            table.extend(make_records(2, offset=start))
+        self.assertEqual(len(table), 12)
+        # 읽기 전에는 기존 배열을 복사하지 않고 조각만 쌓아 둠
+        self.assertEqual(len(table._columns['quality_score']), 2)
+        self.assertEqual(len(table._pending[('column', 'quality_score')]), 5)
+
+        np.testing.assert_allclose(table.column('quality_score'), np.arange(12) / 10)
+        self.assertEqual(table._pending, {})
+        ids, offsets = table.keyword_ids()
+        self.assertEqual((len(ids), offsets[-1]), (18, 18))
+        self.assertEqual(table.to_records(), make_records(12))
+
+    def test_take_and_set_value(self):
+        table = SentenceTable.from_records(make_records(6))
+        subset = table[np.array([4, 1])]
+        self.assertEqual(subset.texts(), ["문장 4", "문장 1"])
+        self.assertEqual(subset[1].keywords, ["키워드1", "공통"])
+
+        subset[0].category = 'reviews'
+        subset[0].quality_score = 0.9
+        self.assertEqual(subset[0].category, 'reviews')
+        self.assertEqual(subset[0].quality_score, 0.9)
+        self.assertEqual(table[4].quality_score, 0.4)
+        with self.assertRaises(AttributeError):
+            subset[0].text = "변경"
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime
+import numpy as np
+from .tokenizer.tokenizer import WHITESPACE_PATTERN, normalize_whitespace
+
+MINHASH_PRIME = (1 << 31) - 1
+
+def new_post_id() -> str:
+    """사용 색인에 기록할 포스트 식별자 (생성 시각 + 임의 접미사)"""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+class SentenceUsageIndex:
+    """이미 생성/발행된 포스트에 쓰인 문장의 지문을 SQLite에 저장하는 영구 사용 색인
+
+    지문은 공백을 정리한 문장 텍스트의 64비트 해시이며, 시작할 때 메모리 집합으로 불러와
+    배정 중 사용 여부를 O(1)로 확인한다 (지난 포스트를 다시 읽지 않음).
+    near_duplicate=True이면 공백을 뺀 문자 n-gram의 MinHash 서명도 저장해, 추정 Jaccard 유사도가
+    threshold 이상인 문장(조사나 어미만 바꾼 문장 등)도 사용된 것으로 본다.
+    숫자만 바뀐 문장(건당 800원 → 1200원)도 같은 문장으로 보게 되므로 기본값은 정확히 같은 문장만 제외한다.
+    서명을 num_bands개의 밴드로 나눈 LSH 버킷에서 같은 버킷에 든 문장끼리만 비교한다.
+    """
+
+    def __init__(self, db_path: str = None, near_duplicate: bool = False, threshold: float = 0.6,
+                 shingle_size: int = 3, num_perm: int = 64, num_bands: int = 16, seed: int = 0):
+        if db_path is None:
+            db_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'cache', 'sentence_usage.sqlite3')
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self.db_path = db_path
+        self.near_duplicate = near_duplicate
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.num_perm = num_perm    # MinHash 해시 함수 수
+        self.num_bands = num_bands  # 밴드 수 (클수록 놓치는 문장이 줄고 비교가 늘어남)
+        self.rows_per_band = num_perm // num_bands
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        # 같은 seed면 항상 같은 서명 (저장된 서명과 비교 가능해야 함)
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, MINHASH_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, MINHASH_PRIME, size=num_perm, dtype=np.uint64)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS used_sentences (
+                fingerprint INTEGER PRIMARY KEY,
+                signature BLOB NOT NULL,
+                keyword TEXT,
+                post_id TEXT,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+        self._fingerprints: set = set()
+        self._signatures: List[np.ndarray] = []
+        self._buckets: Dict[bytes, List[int]] = {}
+        for fingerprint, signature in self._conn.execute('SELECT fingerprint, signature FROM used_sentences'):
+            self._fingerprints.add(fingerprint)
+            self._add_signature(np.frombuffer(signature, dtype=np.uint32))
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return normalize_whitespace(text)
+
+    @classmethod
+    def fingerprint(cls, text: str) -> int:
+        """정규화한 문장의 64비트 지문 (SQLite 정수 키로 그대로 저장)"""
+        digest = hashlib.blake2b(cls.normalize(text).encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'big', signed=True)
+
+    def signature(self, text: str) -> np.ndarray:
+        """공백을 제외한 문자 n-gram 집합의 MinHash 서명 (num_perm개의 uint32)"""
+        compact = WHITESPACE_PATTERN.sub('', text)
+        shingles = {compact[i:i + self.shingle_size] for i in range(max(1, len(compact) - self.shingle_size + 1))}
+        x = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles),
+                        dtype=np.uint64, count=len(shingles)) % np.uint64(MINHASH_PRIME)
+        # (a·x + b) mod p 는 2^62 미만이므로 uint64에서 넘치지 않음
+        hashed = (self._a[:, np.newaxis] * x[np.newaxis, :] + self._b[:, np.newaxis]) % np.uint64(MINHASH_PRIME)
+        return hashed.min(axis=1).astype(np.uint32)
+
+    def is_used(self, text: str) -> bool:
+        """같은 문장 또는 (near_duplicate이면) 거의 같은 문장이 이미 쓰였는지 확인"""
+        with self._lock:
+            used = self.fingerprint(text) in self._fingerprints or (
+                self.near_duplicate and self._near_used(self.signature(text))
+            )
+            if used:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return used
+
+    def __contains__(self, text: str) -> bool:
+        return self.is_used(text)
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def filter_unused(self, items: Sequence[Any], key: Optional[Callable[[Any], str]] = None) -> List[Any]:
+        """아직 쓰이지 않은 항목만 순서대로 반환 (key가 없으면 항목의 text 속성 또는 문자열 자체)"""
+        if key is None:
+            key = lambda item: item if isinstance(item, str) else item.text
+        return [item for item in items if not self.is_used(key(item))]
+
+    def mark_used(self, texts: Iterable[str], keyword: Optional[str] = None,
+                  post_id: Optional[str] = None) -> int:
+        """포스트에 쓰인 문장 기록, 새로 기록된 문장 수 반환"""
+        now = time.time()
+        rows = []
+        with self._lock:
+            for text in texts:
+                fingerprint = self.fingerprint(text)
+                if fingerprint in self._fingerprints:
+                    continue
+                signature = self.signature(text)
+                self._fingerprints.add(fingerprint)
+                self._add_signature(signature)
+                rows.append((fingerprint, signature.tobytes(), keyword, post_id, now))
+            if rows:
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO used_sentences (fingerprint, signature, keyword, post_id, created_at) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    rows
+                )
+                self._conn.commit()
+        return len(rows)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM used_sentences')
+            self._conn.commit()
+            self._fingerprints.clear()
+            self._signatures = []
+            self._buckets = {}
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """사용 색인 통계"""
+        with self._lock:
+            posts = self._conn.execute(
+                'SELECT COUNT(DISTINCT post_id) FROM used_sentences WHERE post_id IS NOT NULL'
+            ).fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            'sentences': len(self._fingerprints),
+            'posts': posts,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        rows = self.rows_per_band
+        return [band.to_bytes(2, 'big') + signature[band * rows:(band + 1) * rows].tobytes()
+                for band in range(self.num_bands)]
+
+    def _add_signature(self, signature: np.ndarray) -> None:
+        position = len(self._signatures)
+        self._signatures.append(signature)
+        for key in self._band_keys(signature):
+            self._buckets.setdefault(key, []).append(position)
+
+    def _near_used(self, signature: np.ndarray) -> bool:
+        candidates = {p for key in self._band_keys(signature) for p in self._buckets.get(key, ())}
+        if not candidates:
+            return False
+        stored = np.stack([self._signatures[p] for p in candidates])
+        similarity = (stored == signature).mean(axis=1)  # 일치하는 해시 비율 = 추정 Jaccard 유사도
+        return bool((similarity >= self.threshold).any())
@@ -0,0 +1,3 @@
+from .statistics_index import StatisticRecord, StatisticsExtractor, StatisticsIndex
+
+__all__ = ['StatisticRecord', 'StatisticsExtractor', 'StatisticsIndex']
@@ -0,0 +1,340 @@
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
+import json
+import re
+import numpy as np
+
+@dataclass
+class StatisticRecord:
+    """정규화된 수치 정보를 담는 클래스"""
+    value: float
+    unit: str  # 'KRW', 'percent', 'people', 'hour', 'month', ...
+    period: Optional[str]  # 'hourly', 'daily', 'weekly', 'monthly', 'yearly'
+    direction: Optional[str]  # 'increase', 'decrease'
+    sentence_id: int
+    raw: str  # 원문 표기 (예: '월 500만원')
+
+class StatisticsExtractor:
+    """문장에서 한국어 금액/비율 표현을 파싱하여 수치 레코드로 변환하는 클래스"""
+
+    # 한국어 수 단위
+    MAGNITUDES = {
+        '조': 1_000_000_000_000,
+        '억': 100_000_000,
+        '천만': 10_000_000,
+        '백만': 1_000_000,
+        '만': 10_000,
+        '천': 1_000,
+    }
+
+    # 단위 표기 -> 정규화된 단위
+    UNITS = {
+        '원': 'KRW',
+        '%': 'percent',
+        '퍼센트': 'percent',
+        '프로': 'percent',
+        '명': 'people',
+        '시간': 'hour',
+        '분': 'minute',
+        '개월': 'month',
+        '년': 'year',
+        '일': 'day',
+        '건': 'case',
+        '개': 'count',
+        '회': 'times',
+        '배': 'ratio',
+    }
+
+    # 수치 앞에 오는 기간 표현
+    PERIOD_MARKERS = [
+        ('hourly', ['시급', '시간당']),
+        ('daily', ['일당', '하루', '일 평균', '일평균', '매일']),
+        ('weekly', ['주급', '주당', '매주', '일주일']),
+        ('monthly', ['월급', '월평균', '월 평균', '매달', '매월', '한 달', '한달']),
+        ('yearly', ['연봉', '연평균', '연간', '연 ', '매년', '1년']),
+    ]
+
+    # 단독으로 쓰인 '월' (월 300만원, 월300만원) - '9월', '월요일'의 월은 제외
+    MONTHLY_PATTERN = re.compile(r'(?<![\d가-힣])월(?:\s|$)')
+
+    # 날짜 표기 (9월 25일)의 월 부분
+    DATE_PATTERN = re.compile(r'\d{1,2}\s*월\s*$')
+
+    # 수치 뒤에 오는 증감 표현
+    DIRECTION_MARKERS = {
+        'increase': ['증가', '상승', '늘', '올랐', '오른', '인상', '성장'],
+        'decrease': ['감소', '하락', '줄', '떨어', '내린', '인하', '축소'],
+    }
+
+    def __init__(self, context_window: int = 8):
+        self.context_window = context_window  # 기간/증감 판단에 사용할 앞뒤 글자 수
+        magnitudes = '|'.join(sorted(self.MAGNITUDES, key=len, reverse=True))
+        units = '|'.join(sorted((re.escape(u) for u in self.UNITS), key=len, reverse=True))
+        # 예: '3억 5천만원', '500만원', '20%', '15,000원', '2.5배'
+        self.amount_pattern = re.compile(
+            rf'(?P<amount>(?:\d[\d,]*(?:\.\d+)?\s*(?:{magnitudes})\s*)*\d[\d,]*(?:\.\d+)?\s*(?:{magnitudes})?)'
+            rf'\s*(?P<unit>{units})?'
+        )
+        self.part_pattern = re.compile(rf'(\d[\d,]*(?:\.\d+)?)\s*({magnitudes})?')
+
+    def extract(self, sentence: str, sentence_id: int = 0) -> List[StatisticRecord]:
+        """문장에서 수치 레코드 추출"""
+        records = []
+
+        for match in self.amount_pattern.finditer(sentence):
+            value, has_magnitude = self._parse_amount(match.group('amount'))
+            if value is None:
+                continue
+
+            unit = self._normalize_unit(match.group('unit'), has_magnitude)
+            if unit is None:
+                continue
+
+            # 연도 표기(2025년)는 통계가 아닌 날짜로 간주
+            if unit == 'year' and value >= 1900 and not has_magnitude:
+                continue
+
+            before = sentence[max(0, match.start() - self.context_window):match.start()]
+            after = sentence[match.end():match.end() + self.context_window]
+
+            # 날짜 표기(9월 25일)의 일은 통계가 아님
+            if unit == 'day' and not has_magnitude and self.DATE_PATTERN.search(before):
+                continue
+
+            records.append(StatisticRecord(
+                value=value,
+                unit=unit,
+                period=self._detect_period(before),
+                direction=self._detect_direction(after),
+                sentence_id=sentence_id,
+                raw=match.group().strip()
+            ))
+
+        return records
+
+    def extract_all(self, sentences: List[str], start_id: int = 0) -> List[StatisticRecord]:
+        """여러 문장에서 수치 레코드 추출"""
+        records = []
+        for i, sentence in enumerate(sentences):
+            records.extend(self.extract(sentence, start_id + i))
+        return records
+
+    def _parse_amount(self, amount: str) -> Tuple[Optional[float], bool]:
+        """'3억 5천만' 같은 한국어 금액 표기를 숫자로 변환"""
+        total = 0.0
+        has_magnitude = False
+
+        for number, magnitude in self.part_pattern.findall(amount):
+            try:
+                value = float(number.replace(',', ''))
+            except ValueError:
+                return None, False
+            if magnitude:
+                has_magnitude = True
+                value *= self.MAGNITUDES[magnitude]
+            total += value
+
+        return total, has_magnitude
+
+    def _normalize_unit(self, unit: Optional[str], has_magnitude: bool) -> Optional[str]:
+        """단위 정규화"""
+        if unit:
+            return self.UNITS[unit]
+        # '3억', '500만'처럼 단위 없이 큰 수 단위만 있으면 금액으로 간주
+        if has_magnitude:
+            return 'KRW'
+        return None
+
+    def _detect_period(self, before: str) -> Optional[str]:
+        """수치 앞 문맥에서 기간 판단"""
+        for period, markers in self.PERIOD_MARKERS:
+            if any(marker in before for marker in markers):
+                return period
+            if period == 'monthly' and self.MONTHLY_PATTERN.search(before):
+                return period
+        return None
+
+    def _detect_direction(self, after: str) -> Optional[str]:
+        """수치 뒤 문맥에서 증감 방향 판단"""
+        for direction, markers in self.DIRECTION_MARKERS.items():
+            if any(marker in after for marker in markers):
+                return direction
+        return None
+
+class StatisticsIndex:
+    """수치 레코드를 컬럼 단위 배열로 보관하고 범위 검색을 지원하는 인덱스
+
+    레코드는 (unit, value) 순으로 정렬된 NumPy 배열에 저장되며,
+    단위별 구간과 이진 탐색으로 범위 질의를 처리한다.
+    """
+
+    def __init__(self):
+        self._pending: List[Tuple[StatisticRecord, Optional[str]]] = []
+        self._vocab: Dict[str, List[str]] = {'unit': [], 'period': [''], 'direction': [''], 'keyword': ['']}
+        self._codes: Dict[str, Dict[str, int]] = {
+            name: {v: i for i, v in enumerate(values)} for name, values in self._vocab.items()
+        }
+        self._raw: List[str] = []
+        self._columns = self._empty_columns()
+        self._unit_bounds: Dict[int, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._columns['value']) + len(self._pending)
+
+    def add(self, records: List[StatisticRecord], keyword: Optional[str] = None) -> None:
+        """레코드 추가 (다음 질의 시점에 정렬된 배열로 병합)"""
+        self._pending.extend((record, keyword) for record in records)
+
+    def add_sentences(self, sentences: List[str], keyword: Optional[str] = None,
+                      start_id: int = 0, extractor: Optional[StatisticsExtractor] = None) -> int:
+        """문장 목록에서 수치를 추출하여 추가하고 추가된 레코드 수 반환"""
+        extractor = extractor or StatisticsExtractor()
+        records = extractor.extract_all(sentences, start_id)
+        self.add(records, keyword)
+        return len(records)
+
+    def range_query(self, unit: str, low: float = -np.inf, high: float = np.inf,
+                    period: Optional[str] = None, keyword: Optional[str] = None,
+                    direction: Optional[str] = None) -> List[StatisticRecord]:
+        """단위/값 범위 및 조건으로 레코드 검색"""
+        positions = self._query_positions(unit, low, high, period, keyword, direction)
+        return [self._record_at(pos) for pos in positions]
+
+    def top_cited(self, keyword: Optional[str] = None, unit: str = 'KRW',
+                  period: Optional[str] = None, low: float = -np.inf, high: float = np.inf,
+                  top_n: int = 5) -> List[Dict[str, Any]]:
+        """가장 많이 인용된 수치 반환 (예: 키워드 X의 월 수입 금액)"""
+        positions = self._query_positions(unit, low, high, period, keyword, None)
+        if len(positions) == 0:
+            return []
+
+        values, inverse, counts = np.unique(
+            self._columns['value'][positions], return_inverse=True, return_counts=True
+        )
+        order = np.argsort(-counts, kind='stable')[:top_n]
+
+        results = []
+        for value_idx in order:
+            member_positions = positions[inverse == value_idx]
+            results.append({
+                'value': float(values[value_idx]),
+                'unit': unit,
+                'count': int(counts[value_idx]),
+                'sentence_ids': self._columns['sentence_id'][member_positions].tolist(),
+                'example': self._raw[int(self._columns['raw_id'][member_positions[0]])]
+            })
+        return results
+
+    def save(self, filepath: str) -> None:
+        """인덱스를 .npz 파일로 저장"""
+        self._flush()
+        np.savez_compressed(
+            filepath,
+            vocab=np.array(json.dumps(self._vocab, ensure_ascii=False)),
+            raw=np.array(json.dumps(self._raw, ensure_ascii=False)),
+            **self._columns
+        )
+
+    @classmethod
+    def load(cls, filepath: str) -> 'StatisticsIndex':
+        """저장된 인덱스 로드"""
+        index = cls()
+        with np.load(filepath) as data:
+            index._vocab = json.loads(str(data['vocab']))
+            index._raw = json.loads(str(data['raw']))
+            index._columns = {name: data[name] for name in index._columns}
+        index._codes = {
+            name: {v: i for i, v in enumerate(values)} for name, values in index._vocab.items()
+        }
+        index._rebuild_unit_bounds()
+        return index
+
+    def _empty_columns(self) -> Dict[str, np.ndarray]:
+        return {
+            'value': np.empty(0, dtype=np.float64),
+            'unit': np.empty(0, dtype=np.int16),
+            'period': np.empty(0, dtype=np.int16),
+            'direction': np.empty(0, dtype=np.int8),
+            'keyword': np.empty(0, dtype=np.int32),
+            'sentence_id': np.empty(0, dtype=np.int64),
+            'raw_id': np.empty(0, dtype=np.int64),
+        }
+
+    def _encode(self, name: str, value: Optional[str]) -> int:
+        value = value or ''
+        codes = self._codes[name]
+        if value not in codes:
+            codes[value] = len(self._vocab[name])
+            self._vocab[name].append(value)
+        return codes[value]
+
+    def _flush(self) -> None:
+        """추가 대기 중인 레코드를 정렬된 컬럼 배열로 병합"""
+        if not self._pending:
+            return
+
+        raw_start = len(self._raw)
+        self._raw.extend(record.raw for record, _ in self._pending)
+        new_columns = {
+            'value': np.fromiter((r.value for r, _ in self._pending), dtype=np.float64),
+            'unit': np.fromiter((self._encode('unit', r.unit) for r, _ in self._pending), dtype=np.int16),
+            'period': np.fromiter((self._encode('period', r.period) for r, _ in self._pending), dtype=np.int16),
+            'direction': np.fromiter((self._encode('direction', r.direction) for r, _ in self._pending), dtype=np.int8),
+            'keyword': np.fromiter((self._encode('keyword', k) for _, k in self._pending), dtype=np.int32),
+            'sentence_id': np.fromiter((r.sentence_id for r, _ in self._pending), dtype=np.int64),
+            'raw_id': np.arange(raw_start, raw_start + len(self._pending), dtype=np.int64),
+        }
+        self._pending = []
+
+        merged = {
+            name: np.concatenate([self._columns[name], new_columns[name]])
+            for name in self._columns
+        }
+        order = np.lexsort((merged['value'], merged['unit']))
+        self._columns = {name: column[order] for name, column in merged.items()}
+        self._rebuild_unit_bounds()
+
+    def _rebuild_unit_bounds(self) -> None:
+        """단위 코드별 [start, end) 구간 계산"""
+        units = self._columns['unit']
+        codes = np.unique(units)
+        starts = np.searchsorted(units, codes, side='left')
+        ends = np.searchsorted(units, codes, side='right')
+        self._unit_bounds = {int(c): (int(s), int(e)) for c, s, e in zip(codes, starts, ends)}
+
+    def _query_positions(self, unit: str, low: float, high: float,
+                         period: Optional[str], keyword: Optional[str],
+                         direction: Optional[str]) -> np.ndarray:
+        """조건을 만족하는 정렬 배열상의 위치 반환"""
+        self._flush()
+        unit_code = self._codes['unit'].get(unit)
+        if unit_code is None or unit_code not in self._unit_bounds:
+            return np.empty(0, dtype=np.int64)
+
+        start, end = self._unit_bounds[unit_code]
+        values = self._columns['value'][start:end]
+        lo = start + int(np.searchsorted(values, low, side='left'))
+        hi = start + int(np.searchsorted(values, high, side='right'))
+        positions = np.arange(lo, hi, dtype=np.int64)
+
+        filters = (('period', period), ('keyword', keyword), ('direction', direction))
+        for name, value in filters:
+            if value is None:
+                continue
+            code = self._codes[name].get(value)
+            if code is None:
+                return np.empty(0, dtype=np.int64)
+            positions = positions[self._columns[name][positions] == code]
+
+        return positions
+
+    def _record_at(self, pos: int) -> StatisticRecord:
+        columns = self._columns
+        return StatisticRecord(
+            value=float(columns['value'][pos]),
+            unit=self._vocab['unit'][columns['unit'][pos]],
+            period=self._vocab['period'][columns['period'][pos]] or None,
+            direction=self._vocab['direction'][columns['direction'][pos]] or None,
+            sentence_id=int(columns['sentence_id'][pos]),
+            raw=self._raw[int(columns['raw_id'][pos])]
+        )
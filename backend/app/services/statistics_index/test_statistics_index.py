@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+from .statistics_index import StatisticsExtractor, StatisticsIndex
+
+class TestStatisticsExtractor(unittest.TestCase):
+    def setUp(self):
+        self.extractor = StatisticsExtractor()
+
+    def test_korean_money_units(self):
+        records = self.extractor.extract("퀵플렉스로 월 500만원을 벌었고 누적 3억 5천만원을 모았습니다.")
+        self.assertEqual([r.value for r in records], [5_000_000, 350_000_000])
+        self.assertTrue(all(r.unit == 'KRW' for r in records))
+        self.assertEqual(records[0].period, 'monthly')
+
+    def test_percent_with_direction(self):
+        records = self.extractor.extract("전년 대비 15% 증가했습니다.", sentence_id=7)
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].value, 15)
+        self.assertEqual(records[0].unit, 'percent')
+        self.assertEqual(records[0].direction, 'increase')
+        self.assertEqual(records[0].sentence_id, 7)
+
+    def test_year_is_not_statistic(self):
+        records = self.extractor.extract("2025년 시급은 15,000원입니다.")
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].value, 15000)
+        self.assertEqual(records[0].period, 'hourly')
+
+    def test_dates_are_not_monthly_statistics(self):
+        self.assertEqual(self.extractor.extract("9월 25일에 계약했습니다"), [])
+
+        records = self.extractor.extract("12월 31일까지 수수료 15% 할인")
+        self.assertEqual([(r.value, r.unit, r.period) for r in records], [(15, 'percent', None)])
+
+        records = self.extractor.extract("3월에 200만원, 월요일에 3시간 일했습니다")
+        self.assertEqual([r.period for r in records], [None, None])
+
+    def test_standalone_month_marker(self):
+        records = self.extractor.extract("평균 월300만원, 최대 월 500만원을 법니다")
+        self.assertEqual([(r.value, r.period) for r in records], [(3_000_000, 'monthly'), (5_000_000, 'monthly')])
+
+class TestStatisticsIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = StatisticsIndex()
+        self.index.add_sentences([
+            "월 300만원 이상 수익이 납니다.",
+            "보통 월 300만원 정도 법니다.",
+            "잘하면 월 500만원도 가능합니다.",
+            "수수료는 20%입니다.",
+        ], keyword='퀵플렉스')
+        self.index.add_sentences(["월 100만원 부업입니다."], keyword='배민커넥트', start_id=100)
+
+    def test_range_query(self):
+        records = self.index.range_query('KRW', 2_000_000, 4_000_000, period='monthly')
+        self.assertEqual(sorted(r.sentence_id for r in records), [0, 1])
+        self.assertEqual(len(self.index.range_query('percent', keyword='퀵플렉스')), 1)
+        self.assertEqual(self.index.range_query('KRW', keyword='없는키워드'), [])
+
+    def test_top_cited(self):
+        top = self.index.top_cited('퀵플렉스', unit='KRW', period='monthly')
+        self.assertEqual(top[0]['value'], 3_000_000)
+        self.assertEqual(top[0]['count'], 2)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'statistics.npz')
+            self.index.save(path)
+            loaded = StatisticsIndex.load(path)
+        self.assertEqual(len(loaded), len(self.index))
+        self.assertEqual(loaded.top_cited('배민커넥트')[0]['sentence_ids'], [100])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import unittest
+from .async_lm_studio_client import AdaptiveConcurrencyController, AsyncLMStudioClient
+from .generation_profiles import get_profile
+from .llm_backend import CompletionBackend
+
+class _EchoBackend(CompletionBackend):
+    def complete(self, prompt, profile):
+        return f"{profile.name} 응답"
+
+class TestAdaptiveConcurrencyController(unittest.TestCase):
+    def setUp(self):
+        self.controller = AdaptiveConcurrencyController(initial_limit=4, max_limit=16)
+
+    def test_fast_responses_increase_limit(self):
+        for _ in range(20):
+            self.controller._record('classify', 0.1, error=False)
+        self.assertGreater(self.controller.current_limit, 4)
+
+    def test_baselines_are_kept_per_key(self):
+        # 짧은 분류 요청이 긴 섹션 요청의 기준이 되지 않아야 함
+        self.controller._record('classify', 0.05, error=False)
+        limit = self.controller.limit
+        for _ in range(10):
+            self.controller._record('section', 5.0, error=False)
+        self.assertGreater(self.controller.limit, limit)
+        self.assertEqual(self.controller.stats()['min_latencies'], {'classify': 0.05, 'section': 5.0})
+
+    def test_slow_response_for_same_key_decreases_limit(self):
+        self.controller._record('section', 1.0, error=False)
+        limit = self.controller.limit
+        self.controller._record('section', 5.0, error=False)
+        self.assertLess(self.controller.limit, limit)
+
+    def test_error_decreases_limit(self):
+        self.controller._record('section', 1.0, error=True)
+        self.assertEqual(self.controller.current_limit, 2)
+        self.assertEqual(self.controller.errors, 1)
+
+    def test_slot_limits_in_flight(self):
+        controller = AdaptiveConcurrencyController(initial_limit=2, max_limit=2)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with controller.slot('classify'):
+                peak = max(peak, controller.in_flight)
+                await asyncio.sleep(0.01)
+
+        async def main():
+            await asyncio.gather(*[request() for _ in range(6)])
+
+        asyncio.run(main())
+        self.assertEqual(peak, 2)
+        self.assertEqual(controller.in_flight, 0)
+
+class TestAsyncLMStudioClient(unittest.TestCase):
+    def setUp(self):
+        self.client = AsyncLMStudioClient(backend=_EchoBackend())
+        self.facts = {'keyword': '퀵플렉스', 'main_content': ['퀵플렉스 수수료는 건당 10%입니다']}
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_sync_calls_can_repeat(self):
+        for _ in range(3):
+            result = self.client.generate_post_sections(self.facts, sections=('intro', 'main'))
+            self.assertEqual(result['sections'], {'intro': 'section 응답', 'main': 'section 응답'})
+
+    def test_sync_call_inside_running_loop(self):
+        async def main():
+            return self.client.generate_post_sections(self.facts, sections=('intro',), include_title=True)
+
+        result = asyncio.run(main())
+        self.assertEqual(result['title'], 'title 응답')
+
+    def test_latency_key_separates_output_sizes(self):
+        short = self.client._latency_key(get_profile('classify_batch').with_overrides(max_tokens=100))
+        long = self.client._latency_key(get_profile('classify_batch').with_overrides(max_tokens=2000))
+        self.assertNotEqual(short, long)
+
+if __name__ == '__main__':
+    unittest.main()
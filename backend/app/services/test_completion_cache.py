@@ -0,0 +1,100 @@
+import os
+import tempfile
+import time
+import unittest
+from .completion_cache import CompletionCache
+from .llm_backend import CompletionBackend
+from .lm_studio_client import LMStudioClient
+
+class _ScriptedBackend(CompletionBackend):
+    """정해진 응답을 순서대로 돌려주는 테스트용 백엔드"""
+    model_id = "test-model"
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def complete(self, prompt, profile):
+        self.calls += 1
+        return self.responses.pop(0)
+
+class TestCompletionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'completions.sqlite3')
+        self.cache = CompletionCache(self.path)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_key_is_stable(self):
+        key = CompletionCache.make_key('m', '프롬프트', {'temperature': 0.0, 'max_tokens': 10})
+        self.assertEqual(key, CompletionCache.make_key('m', '프롬프트', {'max_tokens': 10, 'temperature': 0.0}))
+        self.assertNotEqual(key, CompletionCache.make_key('other', '프롬프트', {'temperature': 0.0, 'max_tokens': 10}))
+        self.assertNotEqual(key, CompletionCache.make_key('m', '프롬프트', {'temperature': 0.0, 'max_tokens': 20}))
+        self.assertNotEqual(key, CompletionCache.make_key('m', '다른 프롬프트', {'temperature': 0.0, 'max_tokens': 10}))
+
+    def test_put_get_survives_reopen(self):
+        self.cache.put('m', 'p', {}, '응답')
+        self.cache.close()
+        self.cache = CompletionCache(self.path)
+        self.assertEqual(self.cache.get('m', 'p', {}), '응답')
+        self.assertIsNone(self.cache.get('m', 'p', {'temperature': 0.7}))
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_invalidate(self):
+        self.cache.put('m', 'p', {}, '응답')
+        self.assertTrue(self.cache.invalidate('m', 'p', {}))
+        self.assertFalse(self.cache.invalidate('m', 'p', {}))
+        self.assertIsNone(self.cache.get('m', 'p', {}))
+
+    def test_expired_entries_are_misses_and_evicted(self):
+        self.cache.ttl_seconds = 60
+        self.cache.put('m', 'p', {}, '응답')
+        self.cache._conn.execute('UPDATE completions SET created_at = ?', (time.time() - 120,))
+        self.assertIsNone(self.cache.get('m', 'p', {}))
+        self.assertEqual(self.cache.evict(), 1)
+
+    def test_max_entries_evicts_least_recently_used(self):
+        self.cache.max_entries = 2
+        for i in range(3):
+            self.cache.put('m', f'p{i}', {}, str(i))
+            self.cache._conn.execute('UPDATE completions SET last_access = ? WHERE response = ?', (i, str(i)))
+        self.cache.evict()
+        self.assertIsNone(self.cache.get('m', 'p0', {}))
+        self.assertEqual(self.cache.get('m', 'p2', {}), '2')
+
+class TestClientCacheValidation(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = CompletionCache(os.path.join(self.tmp.name, 'completions.sqlite3'))
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def client(self, responses):
+        return LMStudioClient(cache=self.cache, backend=_ScriptedBackend(responses))
+
+    def test_invalid_response_is_not_cached(self):
+        client = self.client(['잘못된 응답', 'usage'])
+        validate = lambda text: text == 'usage'
+        self.assertEqual(client._generate_response('p', profile='classify', validate=validate), '잘못된 응답')
+        self.assertEqual(client._generate_response('p', profile='classify', validate=validate), 'usage')
+        self.assertEqual(client._generate_response('p', profile='classify', validate=validate), 'usage')
+        self.assertEqual(client.backend.calls, 2)
+
+    def test_cached_entry_failing_validation_is_dropped(self):
+        client = self.client(['잘못된 응답', 'usage'])
+        client._generate_response('p', profile='classify')  # 검증 없이 저장된 이전 항목
+        self.assertEqual(client._generate_response('p', profile='classify', validate=lambda t: t == 'usage'), 'usage')
+        self.assertEqual(client.backend.calls, 2)
+
+    def test_sampling_profile_bypasses_cache(self):
+        client = self.client(['첫 번째', '두 번째'])
+        self.assertEqual(client._generate_response('p', profile='section'), '첫 번째')
+        self.assertEqual(client._generate_response('p', profile='section'), '두 번째')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from .embedding_classifier import EmbeddingClassifier
+from .embeddings.hashed_nlp import HashedNLP
+from .embeddings.sentence_embedder import SentenceEmbedder
+from .lm_studio_client import LMStudioClient
+from .sentence_classifier import ClassifiedSentence, SentenceClassifier
+from .sentence_storage import SentenceStorage
+from .test_completion_cache import _ScriptedBackend
+
+CUES = {
+    'usage': ['신청', '방법', '등록', '절차'],
+    'benefits': ['장점', '혜택', '자유', '안정'],
+    'features': ['기능', '시스템', '제공', '지원'],
+    'costs': ['수수료', '비용', '가격', '단가'],
+    'reviews': ['후기', '경험', '만족', '솔직'],
+}
+
+def make_labeled(count, seed=0):
+    """카테고리 단서 단어 두 개와 잡음 단어 두 개로 만든 합성 문장"""
+    rng = random.Random(seed)
+    texts, labels = [], []
+    for i in range(count):
+        category = list(CUES)[i % len(CUES)]
+        words = rng.sample(CUES[category], 2) + [f"잡음{rng.randrange(50)}" for _ in range(2)]
+        rng.shuffle(words)
+        texts.append(' '.join(words))
+        labels.append(category)
+    return texts, labels
+
+class TestEmbeddingClassifier(unittest.TestCase):
+    def setUp(self):
+        self.embedder = SentenceEmbedder(nlp=HashedNLP())
+        self.train = make_labeled(200, seed=0)
+        self.held_out = make_labeled(100, seed=1)
+
+    def test_methods_learn_separable_categories(self):
+        for method in ('centroid', 'softmax'):
+            classifier = EmbeddingClassifier(embedder=self.embedder, method=method).fit(*self.train)
+            report = classifier.evaluate(*self.held_out)
+            self.assertGreaterEqual(report['accuracy'], 0.9, method)
+            self.assertEqual(set(report['per_category']), set(CUES))
+
+    def test_save_and_load(self):
+        classifier = EmbeddingClassifier(embedder=self.embedder).fit(*self.train)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = classifier.save(os.path.join(tmp, 'classifier.npz'))
+            loaded = EmbeddingClassifier.load(path, embedder=self.embedder)
+        self.assertEqual(loaded.predict(self.held_out[0])[0], classifier.predict(self.held_out[0])[0])
+        self.assertEqual(loaded.categories, classifier.categories)
+
+    def test_untrained_and_unlabeled(self):
+        classifier = EmbeddingClassifier(embedder=self.embedder)
+        with self.assertRaises(ValueError):
+            classifier.predict_proba(["문장"])
+        with self.assertRaises(ValueError):
+            classifier.fit(["문장"], ["unknown"])
+
+    def test_low_confidence_sentences_escalate_to_llm(self):
+        classifier = EmbeddingClassifier(embedder=self.embedder, confidence_threshold=0.6).fit(*self.train)
+        backend = _ScriptedBackend(['reviews'])
+        sentences = ["신청 방법 등록 절차", "방법 비용"]  # 두 번째는 usage와 costs 단서가 하나씩
+        self.assertLess(classifier.predict(sentences[1:])[1][0], 0.6)
+
+        sentence_classifier = SentenceClassifier(lm_client=LMStudioClient(backend=backend),
+                                                 embedding_classifier=classifier)
+        self.assertEqual(sentence_classifier.classify_sentences(sentences), ['usage', 'reviews'])
+        self.assertEqual(backend.calls, 1)
+        self.assertEqual(sentence_classifier.cascade_stats()['escalation_rate'], 0.5)
+
+class TestLoadAllClassified(unittest.TestCase):
+    def test_newest_label_wins_and_bad_files_are_skipped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = SentenceStorage(base_dir=tmp)
+            sentence = lambda category: ClassifiedSentence("퀵플렉스 수수료 안내", category, 0.9, [], 0.0, 0.8)
+            for timestamp, category in [('20250101_000000', 'usage'), ('20250102_000000', 'costs')]:
+                with open(os.path.join(storage.classified_dir, f'classified_{timestamp}_퀵플렉스.json'), 'w', encoding='utf-8') as f:
+                    json.dump({'categories': {category: [
+                        {'text': "퀵플렉스 수수료 안내", 'category': category, 'confidence': 0.9,
+                         'keywords': [], 'sentiment': 0.0, 'quality_score': 0.8}
+                    ]}}, f, ensure_ascii=False)
+            with open(os.path.join(storage.classified_dir, 'classified_broken.json'), 'w') as f:
+                f.write('{')
+
+            with self.assertLogs('app.services.sentence_storage', level='ERROR'):
+                sentences = storage.load_all_classified()
+        self.assertEqual(sentences, [sentence('costs')])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from .generation_profiles import (
+    ANALYSIS_SCHEMA, BATCH_CLASSIFICATION_SCHEMA, CATEGORIES, GENERATION_PROFILES, GenerationProfile, get_profile
+)
+from .llm_backend import CompletionBackend
+from .lm_studio_client import LMStudioClient
+from .sentence_classifier import SentenceClassifier
+
+class _RecordingBackend(CompletionBackend):
+    """응답 조각을 정해진 대로 돌려주고 받은 프로필과 닫힘 여부를 기록하는 테스트용 백엔드"""
+    model_id = "test-model"
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.profiles = []
+        self.streamed = 0
+        self.closed = False
+
+    def complete(self, prompt, profile):
+        self.profiles.append(profile)
+        return ''.join(self.chunks)
+
+    def stream(self, prompt, profile):
+        self.profiles.append(profile)
+        try:
+            for chunk in self.chunks:
+                self.streamed += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+class TestGenerationProfiles(unittest.TestCase):
+    def test_no_stop_sequence_can_end_a_reply_that_starts_with_a_newline(self):
+        for name, profile in GENERATION_PROFILES.items():
+            # 공백만으로 된 stop은 빈 줄로 시작하는 응답을 위치 0에서 끝냄
+            self.assertFalse([stop for stop in profile.stop if not stop.strip()], name)
+        self.assertTrue(get_profile('classify').first_line)
+        self.assertTrue(get_profile('title').first_line)
+
+    def test_finish_skips_leading_newlines(self):
+        self.assertEqual(get_profile('classify').finish("\n\nusage\n설명"), "usage")
+        self.assertEqual(get_profile('title').finish("\n🚚 퀵플렉스 월 300만원 - 후기\n부제목"), "🚚 퀵플렉스 월 300만원 - 후기")
+        self.assertEqual(get_profile('section').finish("\n첫 문단\n\n둘째 문단\n"), "첫 문단\n\n둘째 문단")
+        self.assertEqual(get_profile('classify').finish(""), "")
+
+    def test_request_params_carry_schema_and_overrides(self):
+        params = get_profile('classify_batch').request_params()
+        self.assertEqual(params['extra_body'], {'json_schema': BATCH_CLASSIFICATION_SCHEMA})
+        self.assertNotIn('stop', params)
+        self.assertEqual(get_profile('analyze').cache_params()['json_schema'], ANALYSIS_SCHEMA)
+        self.assertNotIn('extra_body', get_profile('title').request_params())
+
+        overridden = get_profile('classify_batch').with_overrides(max_tokens=300)
+        self.assertEqual((overridden.max_tokens, overridden.temperature), (300, 0.0))
+        self.assertIs(overridden.json_schema, BATCH_CLASSIFICATION_SCHEMA)
+        self.assertNotEqual(overridden.cache_params(), get_profile('classify_batch').cache_params())
+
+    def test_batch_schema_matches_categories(self):
+        item = BATCH_CLASSIFICATION_SCHEMA['items']
+        self.assertEqual(item['properties']['category']['enum'], CATEGORIES)
+        self.assertEqual(set(item['required']), {'index', 'category', *ANALYSIS_SCHEMA['required']})
+
+    def test_get_profile(self):
+        custom = GenerationProfile('custom', max_tokens=10, temperature=0.1)
+        self.assertIs(get_profile(custom), custom)
+        with self.assertRaises(ValueError):
+            get_profile('unknown')
+
+class TestProfilePlumbing(unittest.TestCase):
+    def test_classify_reply_starting_with_newline(self):
+        backend = _RecordingBackend(["\n", "usage", "\n"])
+        classifier = SentenceClassifier(lm_client=LMStudioClient(cache=None, backend=backend))
+        self.assertEqual(classifier.classify_sentence("앱에서 신청하면 됩니다"), 'usage')
+        self.assertEqual(backend.profiles[0].name, 'classify')
+
+    def test_title_stream_stops_after_first_line(self):
+        backend = _RecordingBackend(["\n\n", "퀵플렉스 ", "월 300만원\n", "부제목", " 더"])
+        client = LMStudioClient(cache=None, backend=backend)
+        self.assertEqual(''.join(client.stream_response("제목", profile='title')), "퀵플렉스 월 300만원")
+        self.assertEqual(backend.streamed, 3)
+        self.assertTrue(backend.closed)
+
+    def test_generate_batch_finishes_each_reply(self):
+        backend = _RecordingBackend(["\ncosts\n"])
+        client = LMStudioClient(cache=None, backend=backend)
+        self.assertEqual(client.generate_batch(["a", "b"], profile='classify'), ["costs", "costs"])
+
+if __name__ == '__main__':
+    unittest.main()
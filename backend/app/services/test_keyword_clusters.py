@@ -0,0 +1,67 @@
+import random
+import unittest
+from collections import defaultdict
+from ..scripts.benchmark_keyword_clustering import load_expander_module
+from .content_context.content_context import ContentContext, ServiceInfo
+from .sentence_analyzer.sentence_analyzer import AnalyzedSentence
+
+# keyword_expander/ 패키지는 같은 이름의 keyword_expander.py 모듈에 가려져 파일 경로로 불러옴
+KeywordExpander = load_expander_module().KeywordExpander
+
+def make_sentence(text, keywords):
+    return AnalyzedSentence(text, 0.8, False, False, keywords, 'objective', len(text), 0.7)
+
+def make_corpus(count, vocabulary, seed=0):
+    """키워드 2~4개씩 가진 문장 (일부 문장은 같은 텍스트로 한 번 더 등장)"""
+    rng = random.Random(seed)
+    sentences = [make_sentence(f"문장 {i}", rng.sample(vocabulary, rng.randint(2, 4))) for i in range(count)]
+    return sentences + sentences[::7]
+
+class TestKeywordClusters(unittest.TestCase):
+    def setUp(self):
+        context = ContentContext(keyword='퀵플렉스', service=ServiceInfo('쿠팡', [], [], []))
+        self.expander = KeywordExpander(context)
+
+    def keyword_groups(self, sentences):
+        groups = defaultdict(list)
+        for sentence in sentences:
+            for keyword in sentence.keywords:
+                groups[keyword].append(sentence)
+        return groups
+
+    def assert_matches_pairwise(self, sentences):
+        groups = self.keyword_groups(sentences)
+        keywords = list(groups)
+        related_ids = self.expander._related_keyword_ids(groups)
+        self.assertEqual(len(related_ids), len(keywords))
+        for keyword, ids in zip(keywords, related_ids):
+            with self.subTest(keyword=keyword):
+                self.assertEqual({keywords[i] for i in ids}, self.expander._find_related_keywords(keyword, groups))
+
+    def test_related_ids_match_pairwise_overlap(self):
+        vocabulary = [f"키워드{i}" for i in range(12)]
+        self.assert_matches_pairwise(make_corpus(60, vocabulary))
+
+    def test_related_ids_across_blocks(self):
+        self.expander.cooccurrence_block_size = 5
+        vocabulary = [f"키워드{i}" for i in range(30)]
+        self.assert_matches_pairwise(make_corpus(120, vocabulary, seed=1))
+
+    def test_clusters_use_related_keywords(self):
+        sentences = [
+            make_sentence("수수료는 건당 800원입니다", ["수수료", "건당"]),
+            make_sentence("수수료는 정산 후 지급됩니다", ["수수료", "정산"]),
+            make_sentence("건당 단가는 지역마다 다릅니다", ["건당", "지역"]),
+            make_sentence("신청은 앱에서 합니다", ["신청", "앱"]),
+        ]
+        groups = self.keyword_groups(sentences)
+        clusters = self.expander._cluster_sentences(sentences)
+
+        self.assertEqual([c.main_keyword for c in clusters], ["수수료", "지역", "신청"])
+        for cluster in clusters:
+            self.assertEqual(set(cluster.related_keywords),
+                             self.expander._find_related_keywords(cluster.main_keyword, groups))
+            self.assertEqual(cluster.sentences, groups[cluster.main_keyword])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import random
+import unittest
+import numpy as np
+from .keyword_expander import KeywordExpander
+from .sentence_classifier import ClassifiedSentence
+
+CATEGORIES = ['usage', 'benefits', 'features', 'costs', 'reviews']
+
+def make_sentence(text, keywords, quality=0.8):
+    return ClassifiedSentence(text, 'usage', 0.9, list(keywords), 0.1, quality)
+
+class _AllGroupsExpander(KeywordExpander):
+    """최소 요구사항과 무관하게 모든 그룹을 반환하는 테스트용 확장기"""
+
+    def _meets_minimum_requirements(self, sentence_group):
+        return True
+
+def pairwise_groups(classified_sentences):
+    """모든 문장 쌍을 비교하는 기준 구현: 기준 문장과 공통 키워드가 2개 이상인 미사용 문장을 모음"""
+    entries = [(category, s) for category, sentences in classified_sentences.items() for s in sentences]
+    used = [False] * len(entries)
+    groups = []
+    for index, (category, sentence) in enumerate(entries):
+        if used[index]:
+            continue
+        used[index] = True
+        group = {cat: [] for cat in classified_sentences}
+        group[category].append(sentence)
+        for other, (other_category, other_sentence) in enumerate(entries):
+            if not used[other] and len(set(sentence.keywords) & set(other_sentence.keywords)) >= 2:
+                used[other] = True
+                group[other_category].append(other_sentence)
+        groups.append(group)
+    return groups
+
+class TestCandidateGroups(unittest.TestCase):
+    def test_groups_match_pairwise_rule(self):
+        rng = random.Random(0)
+        vocabulary = [f"키워드{i}" for i in range(8)]
+        classified = {
+            category: [make_sentence(f"{category} {i}", rng.sample(vocabulary, rng.randint(1, 4))) for i in range(15)]
+            for category in CATEGORIES
+        }
+        groups = _AllGroupsExpander()._create_candidate_groups(classified)
+        expected = pairwise_groups(classified)
+
+        self.assertEqual(len(groups), len(expected))
+        self.assertGreater(len(groups), 1)
+        self.assertLess(len(groups), sum(len(s) for s in classified.values()))
+        for group, reference in zip(groups, expected):
+            self.assertEqual({c: [s.text for s in group[c]] for c in CATEGORIES},
+                             {c: [s.text for s in reference[c]] for c in CATEGORIES})
+
+    def test_one_shared_keyword_is_not_enough(self):
+        classified = {
+            'usage': [make_sentence("기준", ["수수료", "건당", "정산"])],
+            'costs': [make_sentence("둘 공유", ["수수료", "건당"]), make_sentence("하나 공유", ["수수료", "후기"])],
+        }
+        groups = _AllGroupsExpander()._create_candidate_groups(classified)
+        self.assertEqual([[s.text for s in g['usage'] + g['costs']] for g in groups],
+                         [["기준", "둘 공유"], ["하나 공유"]])
+
+    def test_groups_below_minimum_requirements_are_dropped(self):
+        classified = {'usage': [make_sentence("기준", ["수수료", "건당"])], 'costs': []}
+        self.assertEqual(KeywordExpander()._create_candidate_groups(classified), [])
+
+class TestIndependence(unittest.TestCase):
+    def make_group(self, *keyword_lists):
+        return {'usage': [make_sentence(' '.join(k), k) for k in keyword_lists]}
+
+    def test_mean_of_one_minus_jaccard(self):
+        groups = [
+            self.make_group(["수수료", "건당"]),
+            self.make_group(["건당"], ["정산"]),
+            self.make_group(["후기"]),
+            self.make_group(),  # 키워드 없는 그룹은 다른 그룹의 평균에서 제외
+        ]
+        # J(0,1) = |{건당}| / |{수수료, 건당, 정산}| = 1/3, 나머지 쌍은 0
+        expected = [
+            ((1 - 1 / 3) + 1) / 2,
+            ((1 - 1 / 3) + 1) / 2,
+            (1 + 1) / 2,
+            1.0,
+        ]
+        np.testing.assert_allclose(KeywordExpander()._calculate_independence(groups), expected)
+
+        expander = KeywordExpander()
+        expander.independence_block_size = 1
+        np.testing.assert_allclose(expander._calculate_independence(groups), expected)
+
+    def test_single_and_empty(self):
+        expander = KeywordExpander()
+        self.assertEqual(expander._calculate_independence([]).tolist(), [])
+        self.assertEqual(expander._calculate_independence([self.make_group(["수수료"])]).tolist(), [1.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import json
+import sys
+import types
+import unittest
+from unittest import mock
+from .generation_profiles import BATCH_CLASSIFICATION_SCHEMA, get_profile
+from .llm_backend import CompletionBackend, LlamaCppBackend
+
+class _StubLlama:
+    """create_completion 호출을 기록하는 llama_cpp.Llama 대역"""
+
+    def __init__(self):
+        self.calls = []
+
+    def create_completion(self, prompt, stream=False, **params):
+        self.calls.append((prompt, params))
+        if stream:
+            return iter([{'choices': [{'text': word}]} for word in ['가', '나', '다']])
+        return {'choices': [{'text': f" {prompt} 응답\n"}]}
+
+class _StubGrammar:
+    """스키마 문자열을 그대로 담는 llama_cpp.LlamaGrammar 대역"""
+    created = []
+
+    def __init__(self, schema):
+        self.schema = schema
+
+    @classmethod
+    def from_json_schema(cls, schema, verbose=True):
+        cls.created.append(schema)
+        return cls(schema)
+
+class TestCompletionBackend(unittest.TestCase):
+    def test_complete_is_abstract(self):
+        with self.assertRaises(TypeError):
+            CompletionBackend()
+
+class TestLlamaCppBackend(unittest.TestCase):
+    def setUp(self):
+        self.llm = _StubLlama()
+        self.backend = LlamaCppBackend('/models/test-model.gguf', llm=self.llm)
+        _StubGrammar.created = []
+
+    def test_complete_batch_keeps_input_order(self):
+        prompts = ["섹션 후기", "섹션 비용", "제목", "섹션 비용 상세"]
+        results = self.backend.complete_batch(prompts, get_profile('section'))
+
+        self.assertEqual(results, [f"{p} 응답" for p in prompts])
+        # 공통 접두사가 긴 프롬프트끼리 이어서 평가
+        self.assertEqual([prompt for prompt, _ in self.llm.calls], sorted(prompts))
+        self.assertEqual(self.backend.model_id, 'test-model.gguf')
+
+    def test_schema_profile_uses_cached_grammar(self):
+        llama_cpp = types.SimpleNamespace(LlamaGrammar=_StubGrammar)
+        with mock.patch.dict(sys.modules, {'llama_cpp': llama_cpp}):
+            self.backend.complete("분류 1", get_profile('classify_batch'))
+            self.backend.complete("분류 2", get_profile('classify_batch').with_overrides(max_tokens=100))
+
+        (_, first), (_, second) = self.llm.calls
+        self.assertIsInstance(first['grammar'], _StubGrammar)
+        self.assertIs(second['grammar'], first['grammar'])
+        self.assertEqual(json.loads(first['grammar'].schema), BATCH_CLASSIFICATION_SCHEMA)
+        self.assertEqual(len(_StubGrammar.created), 1)
+        self.assertEqual((first['max_tokens'], second['max_tokens']), (2000, 100))
+
+    def test_profile_without_schema_has_no_grammar(self):
+        self.backend.complete("제목", get_profile('title'))
+        (_, params), = self.llm.calls
+        self.assertEqual(params, {'max_tokens': 80, 'temperature': 0.7})
+
+    def test_stream_releases_lock_when_closed(self):
+        stream = self.backend.stream("섹션", get_profile('section'))
+        self.assertEqual(next(stream), '가')
+        self.assertTrue(self.backend._lock.locked())
+        stream.close()
+        self.assertFalse(self.backend._lock.locked())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import threading
+import time
+import unittest
+from .generation_profiles import get_profile
+from .llm_backend import CompletionBackend
+from .micro_batcher import MicroBatcher
+
+class _RecordingBackend(CompletionBackend):
+    """배치 호출을 기록하고 delay만큼 기다린 뒤 프롬프트를 대문자로 돌려주는 테스트용 백엔드"""
+
+    def __init__(self, delay=0.0, drop_last=False):
+        self.delay = delay
+        self.drop_last = drop_last
+        self.batches = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def complete(self, prompt, profile):
+        return self.complete_batch([prompt], profile)[0]
+
+    def complete_batch(self, prompts, profile):
+        with self._lock:
+            self.batches.append(list(prompts))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        results = [prompt.upper() for prompt in prompts]
+        return results[:-1] if self.drop_last else results
+
+class TestMicroBatcher(unittest.TestCase):
+    def test_groups_concurrent_prompts_by_profile(self):
+        backend = _RecordingBackend()
+        batcher = MicroBatcher(backend, max_wait_ms=50)
+        futures = [batcher.submit(f'p{i}', get_profile('classify')) for i in range(4)]
+        futures.append(batcher.submit('q', get_profile('section')))
+        self.assertEqual([f.result(timeout=5) for f in futures], ['P0', 'P1', 'P2', 'P3', 'Q'])
+        batcher.close()
+        self.assertEqual(sorted(len(b) for b in backend.batches), [1, 4])
+        self.assertEqual(batcher.stats()['requests'], 5)
+
+    def test_batches_run_concurrently(self):
+        backend = _RecordingBackend(delay=0.2)
+        batcher = MicroBatcher(backend, max_batch_size=1, max_wait_ms=1, max_concurrent_batches=4)
+        started = time.monotonic()
+        futures = [batcher.submit(f'p{i}', get_profile('classify')) for i in range(4)]
+        for future in futures:
+            future.result(timeout=5)
+        elapsed = time.monotonic() - started
+        batcher.close()
+        self.assertGreater(backend.max_active, 1)
+        self.assertLess(elapsed, 0.6)
+
+    def test_missing_results_fail_futures(self):
+        batcher = MicroBatcher(_RecordingBackend(drop_last=True), max_wait_ms=50)
+        futures = [batcher.submit(f'p{i}', get_profile('classify')) for i in range(3)]
+        self.assertEqual(futures[0].result(timeout=5), 'P0')
+        with self.assertRaises(RuntimeError):
+            futures[2].result(timeout=5)
+        batcher.close()
+
+    def test_backend_error_propagates(self):
+        class FailingBackend(CompletionBackend):
+            def complete(self, prompt, profile):
+                raise ValueError("boom")
+
+            def complete_batch(self, prompts, profile):
+                raise ValueError("boom")
+
+        batcher = MicroBatcher(FailingBackend())
+        with self.assertRaises(ValueError):
+            batcher.complete('p', get_profile('classify'))
+        batcher.close()
+
+    def test_submit_after_close_raises(self):
+        batcher = MicroBatcher(_RecordingBackend())
+        batcher.close()
+        with self.assertRaises(RuntimeError):
+            batcher.submit('p', get_profile('classify'))
+
+if __name__ == '__main__':
+    unittest.main()
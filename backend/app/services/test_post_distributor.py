@@ -0,0 +1,102 @@
+import random
+import unittest
+from .post_distributor import PostDistributor, _PostState
+from .sentence_classifier import ClassifiedSentence
+
+CATEGORIES = ['usage', 'benefits', 'features', 'costs', 'reviews']
+
+def make_sentences(count, low, high, seed=0):
+    """카테고리를 돌아가며 배정한 합성 문장 (quality_score, confidence는 [low, high] 균등 분포)"""
+    rng = random.Random(seed)
+    data = {category: [] for category in CATEGORIES}
+    for i in range(count):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        data[category].append(ClassifiedSentence(
+            text=f"{category} 문장 {i}", category=category, confidence=rng.uniform(low, high),
+            keywords=[f"키워드{rng.randrange(20)}"], sentiment=0.0, quality_score=rng.uniform(low, high)
+        ))
+    return data
+
+class TestPostDistributor(unittest.TestCase):
+    def setUp(self):
+        self.distributor = PostDistributor()
+
+    def assert_valid_assignment(self, assignment):
+        used = set()
+        for post in assignment.posts:
+            for category, sentences in post.items():
+                requirements = self.distributor.section_requirements[category]
+                self.assertGreaterEqual(len(sentences), requirements['min'])
+                self.assertLessEqual(len(sentences), requirements['max'])
+            texts = [s.text for sentences in post.values() for s in sentences]
+            self.assertFalse(used.intersection(texts))
+            used.update(texts)
+            self.assertGreaterEqual(self.distributor._calculate_total_quality(post), self.distributor.min_post_quality)
+
+    def test_section_limits_quality_and_no_reuse(self):
+        assignment = self.distributor.assign(make_sentences(500, 0.6, 0.95), max_posts=None)
+        self.assertGreater(len(assignment.posts), 0)
+        self.assert_valid_assignment(assignment)
+
+    def test_duplicate_texts_used_once(self):
+        data = make_sentences(200, 0.8, 0.95)
+        data['usage'] += data['usage'][:10]
+        assignment = self.distributor.assign(data, max_posts=None)
+        self.assert_valid_assignment(assignment)
+
+    def test_low_scores_are_not_assigned(self):
+        data = make_sentences(200, 0.8, 0.95)
+        data['costs'] = make_sentences(200, 0.3, 0.5)['costs']
+        self.assertEqual(self.distributor.assign(data, max_posts=None).posts, [])
+
+    def test_uncapped_is_not_worse_than_capped(self):
+        # 품질이 최소 기준 근처에 몰린 문장: 상한 포스트 수로는 모든 포스트가 기준에 못 미침
+        for low, high in [(0.55, 0.8), (0.6, 0.79)]:
+            data = make_sentences(3000, low, high)
+            uncapped = self.distributor.assign(data, max_posts=None)
+            self.assert_valid_assignment(uncapped)
+            for cap in (50, 150, 300):
+                capped = self.distributor.assign(data, max_posts=cap)
+                self.assert_valid_assignment(capped)
+                self.assertGreaterEqual(len(uncapped.posts), len(capped.posts))
+
+    def test_popular_claims_are_assigned_first(self):
+        data = make_sentences(60, 0.8, 0.8)
+        popular = data['costs'][-1]
+        popular.cluster_size = 20
+        popular.quality_score = 0.78
+        assignment = self.distributor.assign(data, max_posts=1)
+        self.assertIn(popular, assignment.posts[0]['costs'])
+        # 품질 차이가 크면 인기도보다 품질이 우선
+        popular.quality_score = 0.6
+        assignment = self.distributor.assign(data, max_posts=1)
+        self.assertNotIn(popular, assignment.posts[0]['costs'])
+
+    def test_distribute_sentences_returns_valid_structures(self):
+        posts = self.distributor.distribute_sentences(make_sentences(300, 0.7, 0.95), max_posts=2)
+        self.assertEqual(len(posts), 2)
+        for post in posts:
+            self.assertTrue(self.distributor._validate_post_structure(post))
+    
+    def make_state(self, *scores):
+        state = _PostState(CATEGORIES)
+        for score in scores:
+            sentence = ClassifiedSentence(f"문장 {score}", 'usage', score, [], 0.0, score)
+            state.add('usage', sentence, score)
+        return state
+
+    def test_improved_post_becomes_donor(self):
+        # 여유: A 0.5, B -0.04, C -0.02 → B, C 순서로 개선
+        donor, first, second = self.make_state(0.95, 0.95), self.make_state(0.6, 0.76), self.make_state(0.66, 0.72)
+        self.distributor.swap_candidates = 1
+
+        swaps = self.distributor._improve([donor, first, second])
+
+        # B는 A의 0.95를 받고, 여유가 가장 커진 B가 C에 0.95를 넘김 (A는 넘기면 품질 미달)
+        self.assertEqual(swaps, 2)
+        for state in (donor, first, second):
+            self.assertGreaterEqual(state.mean, self.distributor.min_post_quality)
+        self.assertEqual(sorted(s.quality_score for s in second.sections['usage']), [0.72, 0.95])
+
+if __name__ == '__main__':
+    unittest.main()
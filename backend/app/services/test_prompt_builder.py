@@ -0,0 +1,99 @@
+import unittest
+from .content_context.content_context import ContentContext, ServiceInfo
+from .post_generator.blog_post_generator import BlogPostGenerator, NEGATIVE_WORD_PENALTY
+from .prompt_builder import FactItem, PromptBuilder, estimate_tokens
+
+class TestRank(unittest.TestCase):
+    def setUp(self):
+        self.builder = PromptBuilder()
+
+    def test_weighted_relevance_and_quality(self):
+        items = [
+            FactItem("배송 지역은 센터에서 정해줍니다", quality=0.9),
+            FactItem("퀵플렉스 수수료는 건당 800원입니다", quality=0.4),
+            FactItem("퀵플렉스신청은 앱에서 합니다", quality=0.3),  # 띄어쓰기가 달라도 키워드 문자열 포함
+        ]
+        ranked = self.builder.rank(items, '퀵플렉스')
+
+        # 0.6 * 관련도 + 0.4 * 품질: 0.76, 0.72, 0.36
+        self.assertEqual([item.text for item in ranked], [items[1].text, items[2].text, items[0].text])
+        self.assertEqual([item.relevance for item in items], [0.0, 1.0, 1.0])
+
+    def test_quality_only_without_keyword(self):
+        items = [FactItem("낮은 품질 문장입니다", quality=0.2), FactItem("높은 품질 문장입니다", quality=0.8)]
+        ranked = self.builder.rank(items)
+        self.assertEqual([item.quality for item in ranked], [0.8, 0.2])
+        self.assertEqual([item.relevance for item in items], [0.0, 0.0])
+
+class TestSelect(unittest.TestCase):
+    def setUp(self):
+        self.builder = PromptBuilder()
+
+    def cost(self, text):
+        return estimate_tokens(text) + 1
+
+    def test_budget_skips_long_fact_but_keeps_shorter_ones(self):
+        long_fact = FactItem("퀵플렉스 " + "배송 경험담 " * 30 + "입니다", quality=0.9)
+        short_facts = [FactItem(f"퀵플렉스 정산 주기는 {n}일입니다", quality=0.5) for n in (7, 14)]
+        budget = sum(self.cost(item.text) for item in short_facts)
+
+        selected, dropped = self.builder.select([long_fact] + short_facts, budget, '퀵플렉스')
+
+        self.assertEqual(selected, short_facts)
+        self.assertEqual(dropped, 1)
+        self.assertLessEqual(sum(self.cost(item.text) for item in selected), budget)
+
+    def test_duplicates_are_dropped(self):
+        items = [
+            FactItem("퀵플렉스 수수료는 건당 800원입니다", quality=0.9),
+            FactItem("퀵플렉스  수수료는 건당 800원입니다", quality=0.8),  # 공백만 다른 같은 문장
+            FactItem("수수료는 퀵플렉스 건당 800원입니다", quality=0.7),  # 어순만 달라 키워드 집합이 같은 문장
+            FactItem("퀵플렉스 신청은 앱에서 합니다", quality=0.6),
+        ]
+        selected, dropped = self.builder.select(items, 1000, '퀵플렉스')
+        self.assertEqual(selected, [items[0], items[3]])
+        self.assertEqual(dropped, 2)
+
+    def test_build_keeps_prompt_within_budget(self):
+        facts = {
+            'keyword': '퀵플렉스',
+            'key_points': [f"퀵플렉스 {n}번째 지역 센터는 오전에 물량을 배정합니다" for n in range(40)],
+        }
+        result = self.builder.build("참고 정보:\n{facts}", facts, 'title')
+
+        self.assertEqual(result.keyword, '퀵플렉스')
+        self.assertEqual(result.budget, 300)
+        self.assertEqual(result.dropped, 40 - len(result.facts))
+        self.assertLessEqual(sum(self.cost(item.text) for item in result.facts), 300)
+        self.assertGreater(result.tokens_saved, 0)
+        self.assertEqual(self.builder.stats()['total_tokens_saved'], result.tokens_saved)
+
+class TestBlogPostFacts(unittest.TestCase):
+    def setUp(self):
+        context = ContentContext('퀵플렉스', ServiceInfo('쿠팡', ['배송'], ['수입'], []))
+        self.generator = BlogPostGenerator(context)
+
+    def extract(self, *sentences):
+        return self.generator.extract_facts({'blog_results': [{'content': '. '.join(sentences)}]}).splitlines()
+
+    def test_negative_facts_are_ranked_last(self):
+        sentences = [
+            "퀵플렉스 불법 논란은 월 300만원 수입 광고 때문입니다",
+            "퀵플렉스는 건당 800원의 수수료를 받습니다",
+            "퀵플렉스 후기를 보면 만족도가 높다고 합니다",
+        ]
+        scores = [s.quality_score for s in self.generator.sentence_analyzer.analyze_sentences(sentences)]
+        # 감점 전에는 부정적 문장의 품질 점수가 가장 높음
+        self.assertEqual(max(scores), scores[0])
+        self.assertLess(scores[0] - NEGATIVE_WORD_PENALTY, min(scores[1:]))
+
+        facts = self.extract(*sentences)
+        self.assertEqual(facts, [f"- {text}" for text in sentences[1:] + sentences[:1]])
+
+    def test_invalid_sentences_are_dropped(self):
+        # 종결어미 없이 끝나는 문장은 문장 분석기 유효성 검사에서 제외
+        facts = self.extract("퀵플렉스 배송 지역 안내 페이지 모음", "퀵플렉스 신청은 앱에서 합니다")
+        self.assertEqual(facts, ["- 퀵플렉스 신청은 앱에서 합니다"])
+
+if __name__ == '__main__':
+    unittest.main()
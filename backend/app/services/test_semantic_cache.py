@@ -0,0 +1,46 @@
+import unittest
+from .embeddings.hashed_nlp import HashedNLP
+from .embeddings.sentence_embedder import SentenceEmbedder
+from .semantic_cache import SemanticCache
+
+FACTS = "수수료 건당 10% 정산 주 1회 신청 앱 등록"
+
+class TestSemanticCache(unittest.TestCase):
+    def make_cache(self, **kwargs):
+        return SemanticCache(embedder=SentenceEmbedder(nlp=HashedNLP()), **kwargs)
+
+    def test_similar_facts_hit(self):
+        cache = self.make_cache()
+        cache.store('intro', FACTS, "퀵플렉스 소개", keyword='퀵플렉스')
+        self.assertEqual(cache.lookup('intro', FACTS, keyword='퀵플렉스'), "퀵플렉스 소개")
+        self.assertIsNone(cache.lookup('intro', "전혀 다른 사실 목록", keyword='퀵플렉스'))
+        self.assertIsNone(cache.lookup('main', FACTS, keyword='퀵플렉스'))
+        self.assertEqual(cache.stats()['generations_avoided'], 1)
+
+    def test_adapt_replaces_old_keyword_even_if_new_one_appears(self):
+        cache = self.make_cache(policy='adapt')
+        cache.store('intro', FACTS, "퀵플렉스 후기 추천 글입니다. 퀵플렉스후기추천도 확인하세요", keyword='퀵플렉스 후기 추천')
+        self.assertEqual(cache.lookup('intro', FACTS, keyword='퀵플렉스 후기'),
+                         "퀵플렉스 후기 글입니다. 퀵플렉스 후기도 확인하세요")
+        self.assertEqual(cache.stats()['adapted'], 1)
+
+    def test_adapt_does_not_replace_twice(self):
+        self.assertEqual(SemanticCache.adapt("퀵플렉스 안내", '퀵플렉스', '퀵플렉스 퀵플렉스'), "퀵플렉스 퀵플렉스 안내")
+
+    def test_same_keyword_policy(self):
+        cache = self.make_cache(policy='same_keyword')
+        cache.store('intro', FACTS, "퀵플렉스 소개", keyword='퀵플렉스')
+        self.assertIsNone(cache.lookup('intro', FACTS, keyword='배민커넥트'))
+
+    def test_oldest_entries_are_overwritten(self):
+        cache = self.make_cache(max_entries=20)
+        for i in range(50):
+            cache.store('intro', f"사실 {i} 번", f"응답 {i}")
+        self.assertEqual(cache.stats()['entries'], 20)
+        self.assertEqual(cache.find('intro', "사실 49 번").response, "응답 49")
+        self.assertEqual(cache.find('intro', "사실 30 번").response, "응답 30")
+        match = cache.find('intro', "사실 5 번")
+        self.assertTrue(match is None or match.response != "응답 5")
+
+if __name__ == '__main__':
+    unittest.main()
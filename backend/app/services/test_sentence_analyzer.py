@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+from .sentence_analyzer.sentence_analyzer import AnalyzedSentence, SentenceAnalyzer
+from .sentence_table.sentence_table import SentenceTable
+
+SAMPLE = [
+    "쿠팡 퀵플렉스는 건당 800원의 배송 수수료를 받습니다.",
+    "예를 들어 하루 100건을 배송하면 8만원을 법니다",
+    "신청 방법은 앱에서 등록하면 됩니다",
+    "수입이 꽤 괜찮은 것 같아요",
+    "처음에는\n조금 어렵지만 금방 익숙해집니다",
+    "월 300만원 이상 버는 기사도 많다고 하죠",
+    "짧다",
+    "문장이 끝나지 않는 제목 형식",
+    "사례를 보면 주말에만 일해도 충분했다는 분이 많습니다",
+    "배송 지역은 센터에서 정해줍니다",
+]
+
+class TestSentenceAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = SentenceAnalyzer()
+
+    def test_batch_matches_single_sentence_analysis(self):
+        table = self.analyzer.analyze_batch(SAMPLE)
+        expected = [self.analyzer._analyze_single_sentence(s) for s in SAMPLE if self.analyzer._is_valid_sentence(s)]
+
+        self.assertEqual(len(table), 7)  # 마침표로 끝나거나 너무 짧거나 종결어미가 없는 문장 제외
+        for row, single in zip(table.to_records(), expected):
+            with self.subTest(text=single.text):
+                self.assertAlmostEqual(row.quality_score, single.quality_score)
+                self.assertAlmostEqual(row.structure_score, single.structure_score)
+                self.assertEqual(
+                    (row.text, row.has_statistics, row.has_example, row.keywords, row.sentiment, row.length),
+                    (single.text, single.has_statistics, single.has_example, single.keywords,
+                     single.sentiment, single.length)
+                )
+        self.assertEqual(self.analyzer.analyze_sentences(SAMPLE), table.to_records())
+
+    def test_batch_in_process_shards(self):
+        table = self.analyzer.analyze_batch(SAMPLE, processes=2, chunk_size=3)
+        self.assertEqual(table.to_records(), self.analyzer.analyze_batch(SAMPLE).to_records())
+
+    def test_quality_mask_threshold_is_inclusive(self):
+        analyzed = [AnalyzedSentence(f"문장 {q}", q, False, False, [], 'objective', 4, 0.0)
+                    for q in (0.59, 0.6, 0.61, 0.9)]
+        table = SentenceTable.from_records(analyzed)
+        self.assertEqual(self.analyzer.quality_mask(analyzed).tolist(), [False, True, True, True])
+        self.assertEqual(self.analyzer.quality_mask(table, min_quality_score=0.7).tolist(),
+                         [False, False, False, True])
+        self.assertEqual(self.analyzer.quality_mask([]).tolist(), [])
+
+    def test_filter_quality_sentences_keeps_input_type(self):
+        table = self.analyzer.analyze_batch(SAMPLE)
+        records = table.to_records()
+        threshold = float(np.median(table.column('quality_score')))
+
+        filtered = self.analyzer.filter_quality_sentences(records, threshold)
+        self.assertEqual(filtered, [r for r in records if r.quality_score >= threshold])
+
+        filtered_table = self.analyzer.filter_quality_sentences(table, threshold)
+        self.assertIsInstance(filtered_table, SentenceTable)
+        self.assertEqual(filtered_table.to_records(), filtered)
+
+if __name__ == '__main__':
+    unittest.main()
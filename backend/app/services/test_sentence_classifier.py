@@ -0,0 +1,66 @@
+import json
+import re
+import unittest
+from .embeddings.hashed_nlp import HashedNLP
+from .embeddings.sentence_embedder import SentenceEmbedder
+from .post_distributor import PostDistributor
+from .sentence_classifier import SentenceClassifier
+from .sentence_deduplicator import SentenceDeduplicator
+
+class _CountingClient:
+    """배치 프롬프트의 문장마다 유효한 분류 결과를 돌려주고 분류한 문장 수를 세는 LLM 클라이언트"""
+
+    context_length = 4096
+
+    def __init__(self):
+        self.requests = 0
+        self.sentences = []
+
+    def _generate_response(self, prompt, **params):
+        numbered = re.findall(r'^\[(\d+)\] "(.*)"$', prompt, re.MULTILINE)
+        self.requests += 1
+        self.sentences.extend(text for _, text in numbered)
+        return json.dumps([
+            {"index": int(index), "category": "costs" if "원" in text else "usage", "confidence": 0.9,
+             "keywords": text.split()[:2], "sentiment": 0.1, "quality_score": 0.8}
+            for index, text in numbered
+        ], ensure_ascii=False)
+
+class TestClassifyCandidates(unittest.TestCase):
+    def setUp(self):
+        self.client = _CountingClient()
+        self.classifier = SentenceClassifier(lm_client=self.client)
+        self.deduplicator = SentenceDeduplicator(embedder=SentenceEmbedder(nlp=HashedNLP()))
+
+    def test_llm_calls_are_bounded_by_candidate_budget(self):
+        places = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '수원', '창원', '청주']
+        sentences = [f"{place} {i}번 센터 퀵플렉스 배송 수수료는 건당 {800 + 10 * i}원 입니다"
+                     for place in places for i in range(10)]
+        sentences += [f"{place} {i}번 센터 쿠팡 퀵플렉스 신청 방법은 앱에서 등록하는 것 입니다"
+                      for place in places for i in range(10)]
+
+        # 숫자만 다른 문장도 남도록 거의 같은 문장만 합쳐 사전 순위 단계가 예산을 적용하게 함
+        deduplicator = SentenceDeduplicator(embedder=SentenceEmbedder(nlp=HashedNLP()), threshold=0.999)
+        classified = self.classifier.classify_candidates(
+            sentences, keyword='쿠팡 퀵플렉스', max_posts=1, deduplicator=deduplicator
+        )
+
+        budget = sum(PostDistributor().candidate_budget(1).values())
+        self.assertGreater(len(sentences), budget)
+        self.assertGreater(len(self.client.sentences), 0)
+        self.assertLessEqual(len(self.client.sentences), budget)
+        self.assertEqual(len(set(self.client.sentences)), len(self.client.sentences))
+        self.assertEqual(sum(len(items) for items in classified.values()), len(self.client.sentences))
+        self.assertTrue(classified['costs'])
+
+    def test_duplicates_are_classified_once_with_popularity(self):
+        sentences = ["퀵플렉스 배송 수수료는 건당 800원 입니다", "퀵플렉스  배송 수수료는 건당 800원 입니다 ",
+                     "쿠팡 퀵플렉스 신청 방법은 앱에서 등록하는 것 입니다"]
+        classified = self.classifier.classify_candidates(sentences, max_posts=1, deduplicator=self.deduplicator)
+
+        self.assertEqual(len(self.client.sentences), 2)
+        self.assertEqual([s.cluster_size for s in classified['costs']], [2])
+        self.assertEqual([s.cluster_size for s in classified['usage']], [1])
+
+if __name__ == '__main__':
+    unittest.main()
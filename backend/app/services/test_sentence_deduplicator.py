@@ -0,0 +1,39 @@
+import unittest
+import numpy as np
+from .embeddings.hashed_nlp import HashedNLP
+from .embeddings.sentence_embedder import SentenceEmbedder
+from .sentence_deduplicator import SentenceDeduplicator
+
+class TestSentenceDeduplicator(unittest.TestCase):
+    def setUp(self):
+        self.deduplicator = SentenceDeduplicator(embedder=SentenceEmbedder(nlp=HashedNLP()))
+
+    def test_whitespace_variants_are_merged(self):
+        sentences = ["퀵플렉스 수수료 건당 10%", "퀵플렉스  수수료 건당 10% ", "배민커넥트 신청 방법 안내"]
+        result = self.deduplicator.deduplicate(sentences, quality=[0.5, 0.9, 0.7])
+        self.assertEqual(result.indices, [1, 2])
+        self.assertEqual(result.cluster_sizes, [2, 1])
+        self.assertEqual(result.labels.tolist(), [1, 1, 2])
+        self.assertEqual(result.popularity(), {"퀵플렉스  수수료 건당 10% ": 2, "배민커넥트 신청 방법 안내": 1})
+
+    def test_paraphrases_share_a_cluster(self):
+        # 단어 순서만 바뀐 문장은 해시 벡터가 같아 유사도 1
+        sentences = ["수수료 건당 10% 퀵플렉스", "퀵플렉스 수수료 건당 10%", "퀵플렉스 건당 10% 수수료", "완전히 다른 후기 문장"]
+        result = self.deduplicator.deduplicate(sentences, quality=[0.6, 0.8, 0.7, 0.5])
+        self.assertEqual(result.sentences, ["퀵플렉스 수수료 건당 10%", "완전히 다른 후기 문장"])
+        self.assertEqual(result.cluster_sizes, [3, 1])
+        self.assertAlmostEqual(result.reduction, 0.5)
+
+    def test_lsh_avoids_all_pairs(self):
+        rng = np.random.default_rng(0)
+        sentences = [' '.join(f"w{i}" for i in rng.integers(0, 1000, size=8)) for _ in range(400)]
+        result = self.deduplicator.deduplicate(sentences, quality=np.ones(len(sentences)))
+        self.assertEqual(len(result.indices), len(set(sentences)))
+        self.assertLess(result.comparisons, len(sentences) * (len(sentences) - 1) // 2)
+
+    def test_empty(self):
+        result = self.deduplicator.deduplicate([])
+        self.assertEqual((result.indices, result.reduction), ([], 0.0))
+
+if __name__ == '__main__':
+    unittest.main()
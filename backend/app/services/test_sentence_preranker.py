@@ -0,0 +1,62 @@
+import unittest
+from types import SimpleNamespace
+import numpy as np
+from .sentence_preranker import SentencePreranker
+from .tokenizer.tokenizer import is_near_duplicate, normalize_whitespace
+
+class _FixedAnalyzer:
+    """문장별로 정해진 품질 점수를 돌려주는 테스트용 분석기"""
+
+    def __init__(self, quality):
+        self.quality = quality
+
+    def analyze_sentences(self, sentences):
+        return [SimpleNamespace(text=s, quality_score=self.quality[s]) for s in sentences if s in self.quality]
+
+class TestSentencePreranker(unittest.TestCase):
+    def make_preranker(self, quality):
+        return SentencePreranker(analyzer=_FixedAnalyzer(quality))
+
+    def test_high_quality_sentences_stay_in_their_category(self):
+        costs = [f"{category} 수수료는 건당 {i}00원 입니다" for i, category in enumerate(['가', '나', '다'])]
+        usage = [f"{name} 신청 방법은 앱에서 등록하는 것 입니다" for name in ['첫째', '둘째', '셋째', '넷째', '다섯째']]
+        quality = {**{s: 0.95 for s in costs}, **{s: 0.4 for s in usage}}
+        preranker = self.make_preranker(quality)
+
+        result = preranker.select(costs + usage, max_posts=1, safety_factor=1.0)
+        # 앞 카테고리(usage, benefits, features)가 전체 상위인 비용 문장을 가져가지 않음
+        self.assertEqual(result.by_category['costs'], [0, 1])
+        self.assertEqual(result.by_category['usage'], [3, 4, 5, 6])
+        # 남은 비용 문장은 소속 문장이 없는 카테고리를 채움
+        self.assertEqual(result.by_category['benefits'], [2])
+
+    def test_uncued_sentences_fill_remaining_slots(self):
+        sentences = ["평범한 문장 하나 입니다", "평범한 다른 예시 내용", "아무 단서 없는 세번째"]
+        preranker = self.make_preranker({s: 0.8 for s in sentences})
+        result = preranker.select(sentences, max_posts=1, safety_factor=1.0)
+        self.assertEqual(sorted(result.indices), [0, 1, 2])
+        self.assertEqual(result.reduction, 0.0)
+
+    def test_near_duplicates_are_dropped(self):
+        sentences = ["퀵플렉스 배송 수수료 건당 10% 정산", "퀵플렉스  배송 수수료 건당 10% 정산 ",
+                     "퀵플렉스 배송 수수료 건당 10% 정산 안내"]
+        preranker = self.make_preranker({s: 0.9 for s in sentences})
+        result = preranker.select(sentences, max_posts=3)
+        self.assertEqual(len(result.indices), 1)
+
+    def test_rank_by_category_puts_cued_sentences_first(self):
+        scores = np.array([[0.9, 0.9], [0.5, 0.5], [0.7, 0.7]])
+        priors = np.array([[0.2, 0.8], [0.8, 0.2], [0.5, 0.5]])
+        (member0, rest0), (member1, rest1) = SentencePreranker.rank_by_category(scores, priors)
+        self.assertEqual((member0.tolist(), rest0.tolist()), ([1], [0, 2]))
+        self.assertEqual((member1.tolist(), rest1.tolist()), ([0], [2, 1]))
+
+    def test_near_duplicate_helpers(self):
+        self.assertEqual(normalize_whitespace("  퀵플렉스   수수료 \n"), "퀵플렉스 수수료")
+        selected = [frozenset({'퀵플렉스', '수수료', '건당', '정산', '안내'})]
+        self.assertTrue(is_near_duplicate(frozenset({'퀵플렉스', '수수료', '건당', '정산', '안내', '방법'}), selected, 0.8))
+        self.assertFalse(is_near_duplicate(frozenset({'퀵플렉스', '신청'}), selected, 0.8))
+        self.assertFalse(is_near_duplicate(frozenset(), selected, 0.8))
+
+if __name__ == '__main__':
+    unittest.main()
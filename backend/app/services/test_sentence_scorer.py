@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from .sentence_analyzer.sentence_analyzer import SentenceAnalyzer
+from .sentence_scorer import FEATURE_NAMES, SentenceScorer
+
+SENTENCES = [
+    "퀵플렉스 수수료는 건당 10% 수준으로 알려져 있습니다.",
+    "2024년에 300명이 새로 등록했습니다.",
+    "배송 기사는 하루 평균 120개를 배송합니다.",
+    "예를 들어 주 5일 근무하면 월 300만원 정도입니다.",
+    "정말 좋은 것 같아요 지금 바로 신청하세요!",
+    "신청 방법은 앱에서 간단하게 등록하면 됩니다.",
+]
+
+class TestSentenceScorer(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = SentenceAnalyzer()
+        self.scorer = SentenceScorer(analyzer=self.analyzer)
+
+    def test_statistics_flag_matches_analyzer(self):
+        X = self.scorer.features(SENTENCES)
+        flags = X[:, FEATURE_NAMES.index('has_statistics')].astype(bool)
+        expected = [self.analyzer._analyze_single_sentence(s).has_statistics for s in SENTENCES]
+        self.assertEqual(flags.tolist(), expected)
+
+    def test_scores_are_in_range(self):
+        scores = self.scorer.score(SENTENCES)
+        self.assertEqual(set(scores), {'quality_score', 'sentiment', 'confidence'})
+        for low, values in [(0.0, scores['quality_score']), (-1.0, scores['sentiment']), (0.0, scores['confidence'])]:
+            self.assertEqual(values.shape, (len(SENTENCES),))
+            self.assertTrue(((values >= low) & (values <= 1.0)).all())
+        self.assertEqual(self.scorer.features([]).shape, (0, len(FEATURE_NAMES)))
+
+    def test_calibrate_fits_targets_and_round_trips(self):
+        targets = {'quality_score': np.linspace(0.2, 0.9, len(SENTENCES))}
+        before = np.abs(self.scorer.score(SENTENCES)['quality_score'] - targets['quality_score']).mean()
+        errors = self.scorer.calibrate(SENTENCES, targets, l2=1e-4)
+        self.assertLess(errors['quality_score'], before)
+        with self.assertRaises(ValueError):
+            self.scorer.calibrate(SENTENCES, {'unknown': [0.0] * len(SENTENCES)})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.scorer.save(os.path.join(tmp, 'scorer.npz'))
+            loaded = SentenceScorer.load(path, analyzer=self.analyzer)
+        np.testing.assert_allclose(loaded.score(SENTENCES)['quality_score'],
+                                   self.scorer.score(SENTENCES)['quality_score'])
+
+if __name__ == '__main__':
+    unittest.main()
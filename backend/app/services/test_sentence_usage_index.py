@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from .post_distributor import PostDistributor
+from .sentence_usage_index import SentenceUsageIndex, new_post_id
+from .test_post_distributor import make_sentences
+
+class TestSentenceUsageIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'usage.sqlite3')
+        self.index = SentenceUsageIndex(self.path)
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp.cleanup()
+
+    def test_exact_match_ignores_whitespace(self):
+        self.assertEqual(self.index.mark_used(["퀵플렉스 수수료는 건당 10%입니다", "퀵플렉스  수수료는 건당 10%입니다 "]), 1)
+        self.assertTrue(self.index.is_used(" 퀵플렉스 수수료는   건당 10%입니다"))
+        self.assertFalse(self.index.is_used("배민커넥트 신청 방법은 간단합니다"))
+        self.assertEqual(len(self.index), 1)
+
+    def test_near_duplicates(self):
+        self.index.mark_used(["퀵플렉스 수수료는 건당 10% 수준으로 알려져 있습니다"])
+        self.assertFalse(self.index.is_used("퀵플렉스 수수료가 건당 10% 수준으로 알려져 있어요"))
+
+        near = SentenceUsageIndex(os.path.join(self.tmp.name, 'near.sqlite3'), near_duplicate=True)
+        near.mark_used(["퀵플렉스 수수료는 건당 10% 수준으로 알려져 있습니다"])
+        self.assertTrue(near.is_used("퀵플렉스 수수료가 건당 10% 수준으로 알려져 있어요"))
+        self.assertFalse(near.is_used("배민커넥트는 신청 후 바로 배달을 시작할 수 있습니다"))
+        near.close()
+
+    def test_changed_numbers_are_not_duplicates(self):
+        self.index.mark_used(["쿠팡 퀵플렉스 배송 수수료는 건당 800원입니다"])
+        self.assertFalse(self.index.is_used("쿠팡 퀵플렉스 배송 수수료는 건당 1200원입니다"))
+        self.assertTrue(self.index.is_used("쿠팡 퀵플렉스 배송 수수료는  건당 800원입니다"))
+
+    def test_persists_across_reopen(self):
+        self.index.mark_used(["퀵플렉스 수수료는 건당 10% 수준으로 알려져 있습니다"], keyword='퀵플렉스', post_id='p1')
+        self.index.close()
+        self.index = SentenceUsageIndex(self.path, near_duplicate=True)
+        self.assertTrue(self.index.is_used("퀵플렉스 수수료는 건당 10% 수준으로 알려져 있습니다"))
+        self.assertTrue(self.index.is_used("퀵플렉스 수수료가 건당 10% 수준으로 알려져 있어요"))
+        self.assertEqual(self.index.stats()['posts'], 1)
+
+    def test_filter_unused(self):
+        self.index.mark_used(["사용된 문장 입니다 정말로"])
+        self.assertEqual(self.index.filter_unused(["사용된 문장 입니다 정말로", "새 문장 하나 더 있어요"]),
+                         ["새 문장 하나 더 있어요"])
+
+    def test_distributor_records_each_post(self):
+        distributor = PostDistributor(usage_index=self.index)
+        data = make_sentences(300, 0.7, 0.95)
+        posts = distributor.distribute_sentences(data, max_posts=2, keyword='퀵플렉스')
+        self.assertEqual(len(posts), 2)
+        self.assertNotEqual(posts[0].post_id, posts[1].post_id)
+        self.assertEqual(self.index.stats()['posts'], 2)
+
+        # 다음 호출은 이미 쓰인 문장을 다시 쓰지 않음
+        used = {s.text for post in posts for s in post.usage_sentences + post.cost_sentences}
+        more = distributor.distribute_sentences(data, max_posts=2, keyword='퀵플렉스')
+        self.assertFalse(used & {s.text for post in more for s in post.usage_sentences + post.cost_sentences})
+        self.assertEqual(self.index.stats()['posts'], 4)
+
+    def test_post_ids_are_unique(self):
+        self.assertEqual(len({new_post_id() for _ in range(100)}), 100)
+
+if __name__ == '__main__':
+    unittest.main()
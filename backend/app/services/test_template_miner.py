@@ -0,0 +1,49 @@
+import unittest
+from .fact_analyzer.fact_analyzer import FactAnalyzer
+from .fact_analyzer.template_miner import TemplateMiner
+
+class TestTemplateMiner(unittest.TestCase):
+    def test_counts_and_examples(self):
+        miner = TemplateMiner(max_examples=2)
+        miner.add_all([('A', 'a1'), ('B', 'b1'), ('A', 'a2'), ('A', 'a3')])
+        self.assertEqual(miner.top(), [{'signature': 'A', 'count': 3, 'error': 0, 'examples': ['a1', 'a2']}])
+        self.assertEqual(miner.total, 4)
+
+    def test_counts_stay_within_error_bound_after_pruning(self):
+        miner = TemplateMiner(capacity=5)
+        stream = [f"rare{i}" for i in range(40)]
+        # 자주 나오는 시그니처는 드문 시그니처 사이에 흩어져 들어옴
+        for i, signature in enumerate(stream):
+            miner.add(signature, signature)
+            if i % 4 == 0:
+                miner.add('frequent', 'frequent')
+        for i in range(30):
+            miner.add('late', 'late')
+        miner.add('rare0', 'rare0')
+
+        true_counts = {'frequent': 10, 'late': 30, 'rare0': 2}
+        self.assertLessEqual(len(miner), 10)
+        for entry in miner.top(n=10, min_count=1):
+            if entry['signature'] in true_counts:
+                actual = true_counts[entry['signature']]
+                self.assertLessEqual(entry['count'], actual)
+                self.assertLessEqual(actual, entry['count'] + entry['error'])
+        signatures = [entry['signature'] for entry in miner.top(n=2)]
+        self.assertEqual(signatures, ['late', 'frequent'])
+
+    def test_sentence_pattern_keeps_number_and_korean_markers(self):
+        analyzer = FactAnalyzer()
+        self.assertEqual(analyzer._get_sentence_pattern("월 300만원"), "KOR NUMKOR")
+        self.assertEqual(analyzer._get_sentence_pattern("Coupang 퀵플렉스 10%"), "ENG KOR NUM%")
+        # 단어 수가 같아도 구조가 다르면 다른 시그니처
+        self.assertNotEqual(analyzer._get_sentence_pattern("수수료는 10% 입니다"),
+                            analyzer._get_sentence_pattern("수수료는 Coupang 입니다"))
+
+    def test_mined_templates_group_by_structure(self):
+        analyzer = FactAnalyzer()
+        sentences = ["월 300만원 수입", "월 250만원 수입", "주 5일 근무 가능합니다", "신청 방법 안내"]
+        templates = analyzer.mine_templates(sentences)
+        self.assertEqual([(t['signature'], t['count']) for t in templates], [("KOR NUMKOR KOR", 2)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,3 @@
+from .tokenizer import Tokenizer, TokenizedSentence, get_tokenizer, normalize_whitespace, is_near_duplicate
+
+__all__ = ['Tokenizer', 'TokenizedSentence', 'get_tokenizer', 'normalize_whitespace', 'is_near_duplicate']
@@ -0,0 +1,24 @@
+import unittest
+from .tokenizer import Tokenizer
+
+class _CollidingText(str):
+    """해시값과 길이가 같은 다른 문장을 흉내 내는 문자열"""
+    def __hash__(self):
+        return 0
+
+class TestTokenizer(unittest.TestCase):
+    def test_tokenize_is_cached_per_text(self):
+        tokenizer = Tokenizer()
+        first = tokenizer.tokenize("퀵플렉스 수수료는 건당 10%")
+        self.assertIs(tokenizer.tokenize("퀵플렉스 수수료는 건당 10%"), first)
+        self.assertEqual(first.keywords, ('퀵플렉스', '수수료', '건당', '10%'))
+
+    def test_hash_collision_does_not_share_results(self):
+        tokenizer = Tokenizer()
+        a = tokenizer.tokenize(_CollidingText("신청 방법"))
+        b = tokenizer.tokenize(_CollidingText("수입 구조"))
+        self.assertEqual(a.words, ('신청', '방법'))
+        self.assertEqual(b.words, ('수입', '구조'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+from typing import Iterable, Tuple, NamedTuple, Optional
+import re
+import sys
+from ..cache.lru_cache import LRUCache
+
+# 키워드 추출 시 제거할 조사
+PARTICLE_PATTERN = re.compile(r'[은는이가을를에서의로]([ ]|$)')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def normalize_whitespace(text: str) -> str:
+    """연속 공백을 하나로 줄이고 앞뒤 공백 제거 (같은 문장 비교용)"""
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+def is_near_duplicate(keywords: frozenset, selected: Iterable[frozenset], threshold: float) -> bool:
+    """이미 고른 문장 중 키워드 집합의 Jaccard 유사도가 threshold 이상인 것이 있는지 확인"""
+    if not keywords:
+        return False
+    for other in selected:
+        union = len(keywords | other)
+        if union and len(keywords & other) / union >= threshold:
+            return True
+    return False
+
+class TokenizedSentence(NamedTuple):
+    """문장 토큰화 결과"""
+    words: Tuple[str, ...]     # 공백 기준 단어
+    keywords: Tuple[str, ...]  # 조사 제거 후 2글자 이상 단어
+
+class Tokenizer:
+    """문장 토큰화 결과를 공유 캐시에 보관하는 클래스
+
+    캐시 키는 문장 자체라 해시가 충돌해도 다른 문장의 결과를 돌려주지 않으며,
+    토큰은 sys.intern으로 인터닝된 튜플로 반환되므로 여러 분석기가 같은 문장을
+    다시 분리하지 않고 같은 객체를 공유한다.
+    """
+
+    def __init__(self, cache_size: int = 100000):
+        self.cache = LRUCache(maxsize=cache_size)
+
+    def tokenize(self, text: str) -> TokenizedSentence:
+        """문장 토큰화 (캐시 사용)"""
+        result = self.cache.get(text)
+        if result is not None:
+            return result
+
+        result = TokenizedSentence(
+            words=tuple(sys.intern(w) for w in text.split()),
+            keywords=tuple(
+                sys.intern(w) for w in PARTICLE_PATTERN.sub(' ', text).split() if len(w) >= 2
+            )
+        )
+        self.cache.put(text, result)
+        return result
+
+    def words(self, text: str) -> Tuple[str, ...]:
+        """공백 기준 단어"""
+        return self.tokenize(text).words
+
+    def keywords(self, text: str) -> Tuple[str, ...]:
+        """조사를 제거한 2글자 이상 키워드"""
+        return self.tokenize(text).keywords
+
+_shared_tokenizer: Optional[Tokenizer] = None
+
+def get_tokenizer() -> Tokenizer:
+    """프로세스 전체에서 공유하는 Tokenizer 반환"""
+    global _shared_tokenizer
+    if _shared_tokenizer is None:
+        _shared_tokenizer = Tokenizer()
+    return _shared_tokenizer
@@ -0,0 +1,3 @@
+from .vector_index import VectorIndex, VectorHit, SECTION_QUERIES, iter_fact_sentences
+
+__all__ = ['VectorIndex', 'VectorHit', 'SECTION_QUERIES', 'iter_fact_sentences']
@@ -0,0 +1,95 @@
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+from ..embeddings.hashed_nlp import HashedNLP
+from ..embeddings.sentence_embedder import SentenceEmbedder
+from .vector_index import VectorIndex
+
+class TestVectorIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.embedder = SentenceEmbedder(nlp=HashedNLP())
+        self.index = VectorIndex(path=os.path.join(self.tmp.name, 'index'), embedder=self.embedder)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_query_with_filters(self):
+        self.index.add(["퀵플렉스 수수료 는 건당 10% 입니다", "퀵플렉스 신청 방법 은 간단합니다"],
+                       keyword='퀵플렉스', categories=['costs', 'usage'])
+        self.index.add(["배민커넥트 수수료 는 없습니다"], keyword='배민커넥트', category='costs')
+
+        hits = self.index.query("수수료", top_k=2, keyword='퀵플렉스')
+        self.assertEqual(hits[0].text, "퀵플렉스 수수료 는 건당 10% 입니다")
+        self.assertEqual(hits[0].category, 'costs')
+        self.assertEqual(len(self.index.query("수수료", category='costs')), 2)
+        self.assertEqual(self.index.query("수수료", keyword='없는키워드'), [])
+
+    def test_ingest_is_incremental_and_persistent(self):
+        facts_dir = os.path.join(self.tmp.name, 'facts')
+        os.makedirs(facts_dir)
+        with open(os.path.join(facts_dir, 'facts_20250101_120000_퀵플렉스.json'), 'w', encoding='utf-8') as f:
+            json.dump({'facts': [{'sentence': "월 300만원 수입"}, {'sentence': "월 300만원 수입"}]}, f, ensure_ascii=False)
+
+        self.assertEqual(self.index.ingest_facts_dir(facts_dir), 1)
+        self.assertEqual(self.index.ingest_facts_dir(facts_dir), 0)
+
+        reopened = VectorIndex(path=self.index.path, embedder=self.embedder)
+        self.assertEqual(len(reopened), 1)
+        self.assertEqual(reopened.query_section('퀵플렉스', 'costs')[0].keyword, '퀵플렉스')
+
+    def test_ivf_append_after_training(self):
+        rng = np.random.default_rng(0)
+        texts = [' '.join(f"w{i}" for i in rng.integers(0, 500, size=6)) for _ in range(300)]
+        self.index.add(texts)
+        self.index.train(nlist=8)
+        self.index.add(["새로 추가된 문장 입니다"])
+
+        hits = self.index.query("새로 추가된 문장 입니다", top_k=1, nprobe=1)
+        self.assertEqual(hits[0].text, "새로 추가된 문장 입니다")
+        self.assertEqual(self.index.stats()['lists'], 8)
+
+    def test_interrupted_append_is_rolled_back_on_open(self):
+        self.index.add(["첫 번째 문장", "두 번째 문장"], keyword='퀵플렉스')
+        # meta.json 저장 전에 중단된 추가: 일부 파일에만 행이 남음
+        self.index._append('vectors.f32', np.ones((3, 64), dtype=np.float32))
+        self.index._append('columns.i32', np.zeros((3, 3), dtype=np.int32))
+        with open(self.index._file('texts.bin'), 'ab') as f:
+            f.write("남은 조각".encode('utf-8'))
+
+        reopened = VectorIndex(path=self.index.path, embedder=self.embedder)
+        self.assertEqual(len(reopened), 2)
+        self.assertEqual(os.path.getsize(reopened._file('vectors.f32')), 2 * 64 * 4)
+        reopened.add(["세 번째 문장"], keyword='퀵플렉스')
+        self.assertEqual(reopened.query("세 번째 문장", top_k=1)[0].text, "세 번째 문장")
+        self.assertEqual(reopened._hit(1, 0.0).text, "두 번째 문장")
+
+    def test_failed_append_is_rolled_back(self):
+        self.index.add(["첫 번째 문장"])
+        original = self.index._append
+
+        def failing_append(name, array):
+            if name == 'offsets.i64':
+                raise OSError("disk full")
+            original(name, array)
+
+        self.index._append = failing_append
+        with self.assertRaises(OSError):
+            self.index.add(["실패할 문장"])
+        self.index._append = original
+        self.index.add(["두 번째 문장"])
+        self.assertEqual([self.index._hit(row, 0.0).text for row in range(2)], ["첫 번째 문장", "두 번째 문장"])
+
+    def test_retrain_runs_in_background(self):
+        index = VectorIndex(path=os.path.join(self.tmp.name, 'bg'), embedder=self.embedder, min_train_size=50)
+        rng = np.random.default_rng(0)
+        index.add([' '.join(f"w{i}" for i in rng.integers(0, 500, size=6)) for _ in range(60)])
+        self.assertTrue(index.wait_for_training(timeout=30))
+        self.assertEqual(index.stats()['trained_count'], 60)
+        self.assertGreater(index.stats()['lists'], 0)
+        self.assertEqual(len(index._view('lists.i32')), 60)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,502 @@
+from typing import Dict, List, Any, Optional, Sequence, Iterator
+from dataclasses import dataclass
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import threading
+import numpy as np
+from scipy import sparse
+from ..embeddings.sentence_embedder import SentenceEmbedder, get_embedder
+
+logger = logging.getLogger(__name__)
+
+# 섹션/카테고리별 검색 질의에 붙일 단서 표현
+SECTION_QUERIES = {
+    'title': '핵심 특징 장점 수입',
+    'intro': '소개 개요 무엇인지 특징 시작',
+    'main': '방법 장점 특징 비용 조건',
+    'qa': '질문 궁금 조건 자격 문의 답변',
+    'conclusion': '요약 추천 신청 방법 시작',
+    'usage': '방법 절차 신청 등록 가입 시작',
+    'benefits': '장점 혜택 이점 자유 안정',
+    'features': '특징 기능 제공 지원 시스템 방식',
+    'costs': '비용 가격 수수료 수입 월급 단가',
+    'reviews': '후기 경험 직접 해보니 만족 솔직',
+}
+
+METADATA_COLUMNS = ('keyword', 'category', 'source')
+# 사실 파일명: facts_20250101_120000_키워드.json(.txt), 20250101_120000_키워드_facts.json 등
+FACTS_FILENAME_PATTERN = re.compile(r'\d{8}_\d{6}_(?P<keyword>.+?)(?:_facts)?(?:\.json)?\.(?:json|txt)$')
+FACTS_TEXT_FIELDS = ('sentence', 'text', 'content')
+# 행 단위로 이어 쓰는 파일과 행당 원소 수 (None이면 임베딩 차원)
+ROW_FILES = {
+    'vectors.f32': (np.float32, None),
+    'columns.i32': (np.int32, len(METADATA_COLUMNS)),
+    'lists.i32': (np.int32, 1),
+    'offsets.i64': (np.int64, 1),
+    'hashes.u64': (np.uint64, 1),
+}
+
+@dataclass
+class VectorHit:
+    """검색 결과 한 건"""
+    row: int
+    text: str
+    score: float
+    keyword: Optional[str]
+    category: Optional[str]
+    source: Optional[str]
+
+    def to_fact(self) -> Dict[str, Any]:
+        """PromptBuilder에 넘길 수 있는 사실 항목"""
+        return {'text': self.text, 'score': self.score, 'source': self.source}
+
+class VectorIndex:
+    """추출된 사실 문장의 임베딩을 디스크에 쌓아두고 근사 최근접 검색을 하는 인덱스
+
+    저장 구조 (path 디렉터리):
+    - vectors.f32: (문장 수 × 차원) float32 임베딩, 추가 시 파일 끝에 이어 쓰고 np.memmap으로 읽음
+    - columns.i32: (문장 수 × 3) 키워드/카테고리/출처 코드, texts.bin + offsets.i64: 문장 원문
+    - lists.i32: 문장별 IVF 클러스터 번호, centroids.npy: 클러스터 중심
+    - hashes.u64: 중복 추가 방지용 문장 지문, meta.json: 차원/개수/코드표/적재한 파일 목록
+
+    문장 수가 min_train_size를 넘으면 구면 k-means로 IVF를 학습하고,
+    이후 추가되는 문장은 가장 가까운 중심의 목록에 바로 붙는다.
+    add()가 촉발한 (재)학습은 백그라운드 스레드에서 돌며, 그동안 추가된 문장은 학습 끝에 새 중심으로 재배정한다.
+    meta.json의 개수가 기준이라, 추가 도중 중단돼 파일 끝에 남은 행은 다음에 열 때 잘라낸다.
+    질의는 가까운 nprobe개 목록만 훑으며, 필터로 좁혀진 문장이 적으면 전수 비교한다.
+    """
+
+    def __init__(self, path: str = None, embedder: Optional[SentenceEmbedder] = None,
+                 nprobe: int = 16, min_train_size: int = 10000, exact_search_limit: int = 50000):
+        self.path = path or self.default_path()
+        self.embedder = embedder or get_embedder()
+        self.nprobe = nprobe
+        self.min_train_size = min_train_size          # IVF 학습을 시작할 문장 수
+        self.exact_search_limit = exact_search_limit  # 이 수 이하로 좁혀지면 전수 비교
+        os.makedirs(self.path, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._train_lock = threading.Lock()
+        self._training: Optional[threading.Thread] = None
+        self._meta = self._load_meta()
+        self._codes = {name: {v: i for i, v in enumerate(values)} for name, values in self._meta['vocab'].items()}
+        self._truncate_to_meta()
+        self._hashes = set(self._read_array('hashes.u64', np.uint64).tolist())
+        self._centroids: Optional[np.ndarray] = None
+        if os.path.exists(self._file('centroids.npy')):
+            self._centroids = np.load(self._file('centroids.npy'))
+        self._views: Dict[str, np.ndarray] = {}
+        self._list_order: Optional[np.ndarray] = None
+        self._list_bounds: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return self._meta['count']
+
+    @property
+    def dim(self) -> Optional[int]:
+        return self._meta['dim']
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def add(self, texts: Sequence[str], keyword: Optional[str] = None, category: Optional[str] = None,
+            source: Optional[str] = None, categories: Optional[Sequence[Optional[str]]] = None) -> int:
+        """문장 추가 (이미 있는 문장은 건너뜀), 추가된 문장 수 반환
+
+        categories를 넘기면 문장별 카테고리를, 아니면 category를 모든 문장에 적용한다.
+        """
+        if categories is None:
+            categories = [category] * len(texts)
+
+        new_texts, new_categories, new_hashes = [], [], []
+        with self._lock:
+            batch = set()
+            for text, text_category in zip(texts, categories):
+                text = text.strip() if text else ''
+                if not text:
+                    continue
+                fingerprint = self._fingerprint(text)
+                if fingerprint in self._hashes or fingerprint in batch:
+                    continue
+                batch.add(fingerprint)
+                new_texts.append(text)
+                new_categories.append(text_category)
+                new_hashes.append(fingerprint)
+        if not new_texts:
+            return 0
+
+        vectors = self.embedder.embed_many(new_texts).astype(np.float32)
+        with self._lock:
+            if self._meta['dim'] is None:
+                self._meta['dim'] = int(vectors.shape[1])
+                self._meta['model_name'] = self.embedder.model_name
+            elif vectors.shape[1] != self._meta['dim']:
+                raise ValueError(f"Embedding dimension {vectors.shape[1]} does not match index ({self._meta['dim']})")
+
+            columns = np.array([
+                [self._encode('keyword', keyword), self._encode('category', c), self._encode('source', source)]
+                for c in new_categories
+            ], dtype=np.int32)
+            encoded = [text.encode('utf-8') for text in new_texts]
+            offsets = self._meta['text_bytes'] + np.cumsum([len(b) for b in encoded], dtype=np.int64)
+            lists = self._assign(vectors) if self.is_trained else np.full(len(new_texts), -1, dtype=np.int32)
+
+            try:
+                self._append('vectors.f32', vectors)
+                self._append('columns.i32', columns)
+                self._append('lists.i32', lists)
+                self._append('offsets.i64', offsets)
+                self._append('hashes.u64', np.array(new_hashes, dtype=np.uint64))
+                with open(self._file('texts.bin'), 'ab') as f:
+                    f.write(b''.join(encoded))
+            except BaseException:
+                # 일부 파일에만 쓰였으면 meta.json 기준으로 되돌려 이후 추가가 어긋나지 않게 함
+                self._truncate_to_meta()
+                raise
+
+            self._hashes.update(new_hashes)
+            self._meta['count'] += len(new_texts)
+            self._meta['text_bytes'] = int(offsets[-1])
+            self._invalidate()
+            self._save_meta()
+
+            # 처음 학습하거나, 학습 후 크기가 4배로 늘어 목록이 불균형해졌으면 다시 학습
+            trained_count = self._meta['trained_count']
+            retrain = (not trained_count and self._meta['count'] >= self.min_train_size) or \
+                      (trained_count and self._meta['count'] >= 4 * trained_count)
+            if retrain and not self.is_training:
+                self._training = threading.Thread(target=self.train, name='vector-index-train', daemon=True)
+                self._training.start()
+        return len(new_texts)
+
+    @property
+    def is_training(self) -> bool:
+        return self._training is not None and self._training.is_alive()
+
+    def wait_for_training(self, timeout: Optional[float] = None) -> bool:
+        """백그라운드 학습이 끝날 때까지 대기, 끝났으면 True"""
+        training = self._training
+        if training is not None:
+            training.join(timeout)
+        return not self.is_training
+
+    def train(self, nlist: Optional[int] = None, sample_size: int = 100000,
+              iterations: int = 20, seed: int = 0) -> int:
+        """구면 k-means로 IVF 중심 학습 후 전체 문장 재배정, 클러스터 수 반환
+
+        추가된 행은 바뀌지 않으므로 시작 시점의 행으로 k-means와 재배정을 잠금 없이 하고,
+        그사이 추가된 행만 잠금 안에서 새 중심으로 배정한 뒤 교체한다.
+        """
+        with self._train_lock:
+            with self._lock:
+                count = self._meta['count']
+                if not count:
+                    return 0
+                vectors = self._view('vectors.f32')
+            nlist = nlist or max(1, min(count, int(4 * np.sqrt(count))))
+
+            rng = np.random.default_rng(seed)
+            sample_rows = np.sort(rng.choice(count, size=min(count, max(sample_size, nlist)), replace=False))
+            sample = np.asarray(vectors[sample_rows], dtype=np.float32)
+            centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+            for _ in range(iterations):
+                assignment = self._nearest(sample, centroids)
+                membership = sparse.csr_matrix(
+                    (np.ones(len(sample), dtype=np.float32), (assignment, np.arange(len(sample)))),
+                    shape=(nlist, len(sample))
+                )
+                sums = np.asarray(membership @ sample)
+                norms = np.linalg.norm(sums, axis=1, keepdims=True)
+                empty = norms[:, 0] == 0
+                centroids = np.where(empty[:, np.newaxis], centroids, sums / np.where(norms > 0, norms, 1))
+                if empty.any():
+                    centroids[empty] = sample[rng.choice(len(sample), size=int(empty.sum()), replace=False)]
+            centroids = centroids.astype(np.float32)
+            lists = self._assign_rows(vectors, centroids, 0, count)
+
+            with self._lock:
+                total = self._meta['count']
+                if total > count:
+                    lists = np.concatenate([lists, self._assign_rows(self._view('vectors.f32'), centroids, count, total)])
+                # 중간에 중단돼도 이전 파일이 남도록 임시 파일에 쓴 뒤 교체
+                self._write_replace('lists.i32', lists.tobytes())
+                self._write_replace('centroids.npy', self._npy_bytes(centroids))
+                self._centroids = centroids
+                self._meta['trained_count'] = count
+                self._invalidate()
+                self._save_meta()
+        logger.info(f"Trained IVF vector index with {nlist} lists over {count} sentences")
+        return nlist
+
+    def query(self, text: str, top_k: int = 20, keyword: Optional[str] = None,
+              category: Optional[str] = None, source: Optional[str] = None,
+              nprobe: Optional[int] = None) -> List[VectorHit]:
+        """text와 가장 비슷한 문장 top_k개 (keyword/category/source로 필터)"""
+        if not len(self):
+            return []
+        query = self.embedder.embed(text).astype(np.float32)
+
+        with self._lock:
+            filters = {'keyword': keyword, 'category': category, 'source': source}
+            codes = {}
+            for name, value in filters.items():
+                if value is None:
+                    continue
+                code = self._codes[name].get(value)
+                if code is None:
+                    return []
+                codes[name] = code
+
+            rows = self._filter_rows(codes)
+            if rows is None or len(rows) > self.exact_search_limit:
+                candidates = self._probe_rows(query, nprobe or self.nprobe)
+                if candidates is not None:
+                    rows = candidates if rows is None else np.intersect1d(candidates, rows, assume_unique=True)
+            if rows is None:
+                rows = np.arange(len(self), dtype=np.int64)
+            if not len(rows):
+                return []
+
+            scores = self._scores(rows, query)
+            k = min(top_k, len(rows))
+            best = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best], kind='stable')]
+            return [self._hit(int(rows[i]), float(scores[i])) for i in best]
+
+    def query_section(self, keyword: str, section: str, top_k: int = 20,
+                      restrict_keyword: bool = True, use_category: bool = False) -> List[VectorHit]:
+        """키워드 X의 섹션 'costs'에 쓸 사실 top_k개 같은 섹션별 검색
+
+        restrict_keyword면 해당 키워드로 수집한 문장만, use_category면 카테고리가 섹션과 같은 문장만 검색한다.
+        """
+        text = f"{keyword} {SECTION_QUERIES.get(section, section)}"
+        return self.query(
+            text, top_k=top_k,
+            keyword=keyword if restrict_keyword and keyword in self._codes['keyword'] else None,
+            category=section if use_category else None
+        )
+
+    def ingest_facts_dir(self, facts_dir: str = None) -> int:
+        """data/facts의 새 파일(json/txt)을 읽어 문장 추가, 추가된 문장 수 반환"""
+        facts_dir = facts_dir or os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'facts')
+        if not os.path.isdir(facts_dir):
+            return 0
+
+        ingested = set(self._meta['ingested'])
+        added = 0
+        for filename in sorted(os.listdir(facts_dir)):
+            if filename in ingested or not filename.endswith(('.json', '.txt')):
+                continue
+            match = FACTS_FILENAME_PATTERN.search(filename)
+            try:
+                sentences = list(iter_fact_sentences(os.path.join(facts_dir, filename)))
+            except (OSError, ValueError) as e:
+                logger.error(f"Error reading facts file {filename}: {e}")
+                continue
+            added += self.add(sentences, keyword=match.group('keyword') if match else None, source=filename)
+            with self._lock:
+                self._meta['ingested'].append(filename)
+                self._save_meta()
+        logger.info(f"Ingested {added} new fact sentences into vector index ({len(self)} total)")
+        return added
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'sentences': self._meta['count'],
+                'dim': self._meta['dim'],
+                'lists': 0 if self._centroids is None else len(self._centroids),
+                'trained_count': self._meta['trained_count'],
+                'keywords': len(self._meta['vocab']['keyword']) - 1,
+                'files': len(self._meta['ingested'])
+            }
+
+    @staticmethod
+    def default_path() -> str:
+        return os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'vector_index')
+
+    def _filter_rows(self, codes: Dict[str, int]) -> Optional[np.ndarray]:
+        """메타데이터 필터를 만족하는 행 (필터가 없으면 None)"""
+        if not codes:
+            return None
+        columns = self._view('columns.i32')
+        mask = np.ones(len(columns), dtype=bool)
+        for name, code in codes.items():
+            mask &= columns[:, METADATA_COLUMNS.index(name)] == code
+        return np.flatnonzero(mask)
+
+    def _probe_rows(self, query: np.ndarray, nprobe: int) -> Optional[np.ndarray]:
+        """질의와 가까운 nprobe개 IVF 목록의 행 (학습 전이면 None)"""
+        if self._centroids is None:
+            return None
+        if self._list_order is None:
+            lists = self._view('lists.i32')
+            self._list_order = np.argsort(lists, kind='stable')
+            self._list_bounds = np.searchsorted(lists[self._list_order], np.arange(len(self._centroids) + 1))
+        nprobe = min(nprobe, len(self._centroids))
+        probes = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+        rows = np.concatenate([self._list_order[self._list_bounds[p]:self._list_bounds[p + 1]] for p in probes])
+        return np.sort(rows)
+
+    def _scores(self, rows: np.ndarray, query: np.ndarray) -> np.ndarray:
+        vectors = self._view('vectors.f32')
+        if len(rows) == len(vectors):
+            return np.concatenate([vectors[start:start + 65536] @ query for start in range(0, len(rows), 65536)])
+        return np.concatenate([vectors[rows[start:start + 65536]] @ query for start in range(0, len(rows), 65536)])
+
+    def _hit(self, row: int, score: float) -> VectorHit:
+        columns = self._view('columns.i32')[row]
+        offsets = self._view('offsets.i64')
+        start = int(offsets[row - 1]) if row else 0
+        text = bytes(self._view('texts.bin')[start:int(offsets[row])]).decode('utf-8')
+        values = [self._meta['vocab'][name][int(code)] or None for name, code in zip(METADATA_COLUMNS, columns)]
+        return VectorHit(row, text, score, *values)
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return self._nearest(vectors, self._centroids).astype(np.int32)
+
+    @classmethod
+    def _assign_rows(cls, vectors: np.ndarray, centroids: np.ndarray, start: int, stop: int) -> np.ndarray:
+        return np.concatenate([np.zeros(0, dtype=np.int32)] + [
+            cls._nearest(np.asarray(vectors[i:min(i + 65536, stop)]), centroids).astype(np.int32)
+            for i in range(start, stop, 65536)
+        ])
+
+    @staticmethod
+    def _nearest(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ centroids.T, axis=1)
+
+    def _view(self, name: str) -> np.ndarray:
+        """파일을 읽기 전용 memmap으로 열어 캐시 (추가/학습 시 무효화)"""
+        view = self._views.get(name)
+        if view is None:
+            count = self._meta['count']
+            shapes = {
+                'vectors.f32': (np.float32, (count, self._meta['dim'] or 0)),
+                'columns.i32': (np.int32, (count, len(METADATA_COLUMNS))),
+                'lists.i32': (np.int32, (count,)),
+                'offsets.i64': (np.int64, (count,)),
+                'texts.bin': (np.uint8, (self._meta['text_bytes'],)),
+            }
+            dtype, shape = shapes[name]
+            if not count:
+                view = np.zeros(shape, dtype=dtype)
+            else:
+                view = np.memmap(self._file(name), dtype=dtype, mode='r', shape=shape)
+            self._views[name] = view
+        return view
+
+    def _invalidate(self) -> None:
+        self._views = {}
+        self._list_order = None
+        self._list_bounds = None
+
+    def _append(self, name: str, array: np.ndarray) -> None:
+        with open(self._file(name), 'ab') as f:
+            f.write(np.ascontiguousarray(array).tobytes())
+
+    def _truncate_to_meta(self) -> None:
+        """meta.json에 기록된 개수보다 긴 파일 끝(중단된 추가)을 잘라냄"""
+        count = self._meta['count']
+        sizes = {'texts.bin': self._meta['text_bytes']}
+        for name, (dtype, width) in ROW_FILES.items():
+            width = (self._meta['dim'] or 0) if width is None else width
+            sizes[name] = count * width * np.dtype(dtype).itemsize
+        for name, size in sizes.items():
+            path = self._file(name)
+            actual = os.path.getsize(path) if os.path.exists(path) else 0
+            if actual < size:
+                raise ValueError(f"Vector index file {name} is shorter than meta.json ({actual} < {size} bytes)")
+            if actual > size:
+                logger.warning(f"Truncating {actual - size} bytes of an interrupted append from {name}")
+                os.truncate(path, size)
+
+    def _write_replace(self, name: str, data: bytes) -> None:
+        path = self._file(name)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(path + '.tmp', path)
+
+    @staticmethod
+    def _npy_bytes(array: np.ndarray) -> bytes:
+        buffer = io.BytesIO()
+        np.save(buffer, array)
+        return buffer.getvalue()
+
+    def _read_array(self, name: str, dtype: Any) -> np.ndarray:
+        path = self._file(name)
+        return np.fromfile(path, dtype=dtype) if os.path.exists(path) else np.zeros(0, dtype=dtype)
+
+    def _encode(self, name: str, value: Optional[str]) -> int:
+        value = value or ''
+        codes = self._codes[name]
+        if value not in codes:
+            codes[value] = len(self._meta['vocab'][name])
+            self._meta['vocab'][name].append(value)
+        return codes[value]
+
+    @staticmethod
+    def _fingerprint(text: str) -> int:
+        return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _load_meta(self) -> Dict[str, Any]:
+        path = self._file('meta.json')
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {
+            'dim': None,
+            'model_name': None,
+            'count': 0,
+            'text_bytes': 0,
+            'trained_count': 0,
+            'vocab': {name: [''] for name in METADATA_COLUMNS},
+            'ingested': []
+        }
+
+    def _save_meta(self) -> None:
+        # 중간에 중단돼도 이전 meta.json이 남도록 임시 파일에 쓴 뒤 교체
+        path = self._file('meta.json')
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self._meta, f, ensure_ascii=False)
+        os.replace(path + '.tmp', path)
+
+def iter_fact_sentences(filepath: str) -> Iterator[str]:
+    """사실 파일에서 문장 추출
+
+    - facts_*.json: {'facts': [{'sentence': ...}]} 또는 {'core_facts': [{'text': ...}], ...}
+    - facts_*.txt: '문장: ...' 줄
+    """
+    if filepath.endswith('.txt'):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('문장:'):
+                    yield line[len('문장:'):].strip()
+        return
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        yield from _iter_texts(json.load(f))
+
+def _iter_texts(data: Any) -> Iterator[str]:
+    if isinstance(data, str):
+        yield data
+    elif isinstance(data, list):
+        for item in data:
+            yield from _iter_texts(item)
+    elif isinstance(data, dict):
+        for name in FACTS_TEXT_FIELDS:
+            if isinstance(data.get(name), str):
+                yield data[name]
+                return
+        for key, value in data.items():
+            # 출처 URL/메타데이터 목록은 사실 문장이 아님
+            if key in ('facts', 'core_facts', 'statistics', 'expert_quotes', 'examples'):
+                yield from _iter_texts(value)